@@ -0,0 +1,403 @@
+"""
+Comparative performance validation of the Hive worker implementations.
+
+Runs every worker_*_src implementation under the same scripted workloads
+and writes a side-by-side report, so the Queen's decision can cite numbers
+next to the qualitative comparison in validation.md.
+
+Each worker runs in its own subprocess (in parallel by default), from its
+own source directory, against freshly seeded files in its own temporary
+directory. Workloads only use the storage and auth service interfaces; a
+workload a worker does not implement (e.g. registration in Worker A,
+todos in Worker B) is reported as n/a.
+
+Measured per workload:
+- Throughput and p50/p95/p99 latency over a fixed, seeded operation script
+- Peak Python memory allocated while running it (tracemalloc, separate pass)
+Measured per worker:
+- Peak resident memory of the process, on-disk size after seeding and at the end
+
+Usage (from examples/todo_hive):
+    python hive/perf_validation.py --report hive/performance.md
+    python hive/perf_validation.py --users 100000 --ops 5000 --sequential --output results.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+HIVE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Workloads in execution order; writing workloads last so that all reading
+# workloads see the same seeded data
+WORKLOADS = (
+    'user_lookup', 'verify_token', 'authenticate', 'login',
+    'list_todos', 'register', 'create_todo'
+)
+
+# Operations sampled under tracemalloc for the memory pass
+MEMORY_PASS_OPS = 50
+
+PASSWORD = 'validation_password'
+
+# Todos of the seeded dataset are spread over this many users
+TODO_OWNERS = 100
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def directory_size(path: str) -> int:
+    """Total size in bytes of the files in a directory."""
+    return sum(
+        os.path.getsize(os.path.join(path, name))
+        for name in os.listdir(path)
+        if os.path.isfile(os.path.join(path, name))
+    )
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Worker side: runs inside the subprocess, with the worker source on sys.path
+
+def seed(workdir: str, config: Dict) -> Tuple[str, str, List[Dict]]:
+    """Write the users and todos files shared by all workers' scripts."""
+    import bcrypt
+
+    password_hash = bcrypt.hashpw(
+        PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds=config['bcrypt_rounds'])
+    ).decode('utf-8')
+    created = datetime(2024, 1, 1)
+    users = [
+        {
+            'id': f'00000000-0000-4000-8000-{i:012d}',
+            'username': f'user_{i}',
+            'password_hash': password_hash,
+            'created_at': (created + timedelta(seconds=i)).isoformat()
+        }
+        for i in range(config['users'])
+    ]
+    owners = users[:TODO_OWNERS]
+    todos = [
+        {
+            'id': f'00000000-0000-4000-9000-{i:012d}',
+            'content': f'Validation todo number {i}',
+            'user_id': owners[i % len(owners)]['id'],
+            'created_at': (created + timedelta(seconds=i)).isoformat()
+        }
+        for i in range(config['todos'])
+    ]
+
+    users_path = os.path.join(workdir, 'users.json')
+    todos_path = os.path.join(workdir, 'todos.json')
+    with open(users_path, 'w', encoding='utf-8') as f:
+        json.dump({'users': users}, f, indent=2)
+    with open(todos_path, 'w', encoding='utf-8') as f:
+        json.dump({'todos': todos}, f, indent=2)
+    return users_path, todos_path, users
+
+
+def build_workloads(workdir: str, config: Dict) -> Dict[str, Optional[Tuple[int, Callable[[int], object]]]]:
+    """
+    Build the scripted workloads for the worker on sys.path.
+
+    Returns:
+        Dictionary of workload name to (operation_count, operation), or None
+        if the worker does not implement the workload
+    """
+    from auth.auth_service import AuthService
+
+    users_path, todos_path, users = seed(workdir, config)
+    auth_service = AuthService(users_path, revocation_file=os.path.join(workdir, 'revoked.json'))
+
+    rng = random.Random(config['seed'])
+    ops = config['ops']
+    bcrypt_ops = config['bcrypt_ops']
+    # The memory pass continues the script after the timed operations
+    script = [rng.choice(users) for _ in range(max(ops, bcrypt_ops) + MEMORY_PASS_OPS)]
+    tokens = [
+        auth_service.token_manager.generate_token(user['id'], user['username'])
+        for user in script[:ops + MEMORY_PASS_OPS]
+    ]
+
+    workloads = {
+        'user_lookup': (ops, lambda i: auth_service.user_storage.get_user_by_username(script[i]['username'])),
+        'verify_token': (ops, lambda i: auth_service.token_manager.verify_token(tokens[i])),
+        'authenticate': (ops, lambda i: auth_service.authenticate(tokens[i])),
+        'login': (bcrypt_ops, lambda i: auth_service.login(script[i]['username'], PASSWORD)),
+        'register': None,
+        'list_todos': None,
+        'create_todo': None,
+    }
+
+    if hasattr(auth_service, 'register'):
+        workloads['register'] = (
+            bcrypt_ops, lambda i: auth_service.register(f'new_user_{i}', PASSWORD)
+        )
+
+    try:
+        from todos.todo_service import TodoService
+    except ImportError:
+        TodoService = None
+
+    if TodoService is not None:
+        todo_service = TodoService(todos_path)
+        owners = users[:TODO_OWNERS]
+        workloads['list_todos'] = (ops, lambda i: todo_service.list_todos(owners[i % len(owners)]['id']))
+        workloads['create_todo'] = (
+            ops, lambda i: todo_service.create_todo(f'Created todo {i}', owners[i % len(owners)]['id'])
+        )
+
+    return workloads
+
+
+def run_workload(count: int, operation: Callable[[int], object]) -> Dict:
+    """Time each operation of a workload, then sample its memory peak."""
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - start)
+    elapsed = sum(latencies)
+
+    # Separate pass: tracemalloc slows execution down too much to time with it.
+    # It continues the script, so writing workloads do not repeat operations.
+    tracemalloc.start()
+    for i in range(count, count + min(count, MEMORY_PASS_OPS)):
+        operation(i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops': count,
+        'throughput_ops_s': count / elapsed if elapsed > 0 else float('inf'),
+        'p50_s': percentile(latencies, 0.50),
+        'p95_s': percentile(latencies, 0.95),
+        'p99_s': percentile(latencies, 0.99),
+        'peak_alloc_bytes': peak
+    }
+
+
+def run_worker(src_dir: str, config: Dict) -> Dict:
+    """Run all workloads against one worker (inside its subprocess)."""
+    sys.path.insert(0, src_dir)
+
+    with tempfile.TemporaryDirectory(prefix='hive_validation_') as workdir:
+        os.chdir(workdir)
+        workloads = build_workloads(workdir, config)
+        seeded_bytes = directory_size(workdir)
+
+        results = {}
+        for name in WORKLOADS:
+            workload = workloads.get(name)
+            results[name] = run_workload(*workload) if workload else None
+
+        return {
+            'workloads': results,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'disk_seeded_bytes': seeded_bytes,
+            'disk_final_bytes': directory_size(workdir)
+        }
+
+
+# Coordinator side
+
+def discover_workers() -> Dict[str, str]:
+    """Map worker names (worker_a, ...) to their source directories."""
+    return {
+        os.path.basename(path)[:-len('_src')]: path
+        for path in sorted(glob.glob(os.path.join(HIVE_ROOT, 'worker_*_src')))
+        if os.path.isdir(path)
+    }
+
+
+def launch(name: str, src_dir: str, config: Dict) -> Tuple[str, Dict]:
+    """Run one worker in a subprocess and return its parsed results."""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', src_dir, json.dumps(config)],
+        capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        return name, {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else
+                      f'exit status {completed.returncode}'}
+    return name, json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def format_bytes(value: Optional[int]) -> str:
+    """Format a byte count with a readable unit."""
+    if value is None:
+        return 'n/a'
+    for unit in ('B', 'KiB', 'MiB'):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def render_report(report: Dict) -> str:
+    """Render the side-by-side comparison as Markdown."""
+    workers = list(report['workers'])
+    config = report['config']
+    lines = [
+        '# Worker 效能驗證報告',
+        '',
+        f"產生時間：{report['created_at']}（`hive/perf_validation.py`，"
+        f"{'平行' if config['parallel'] else '依序'}執行）",
+        '',
+        f"資料集：{config['users']} 位用戶、{config['todos']} 筆待辦事項；"
+        f"每個工作負載 {config['ops']} 次操作（bcrypt 相關 {config['bcrypt_ops']} 次，"
+        f"cost {config['bcrypt_rounds']}）；隨機種子 {config['seed']}。",
+        ''
+    ]
+
+    for name, result in report['workers'].items():
+        if 'error' in result:
+            lines.append(f"**{name} 執行失敗：** `{result['error']}`")
+            lines.append('')
+
+    ok_workers = [name for name in workers if 'error' not in report['workers'][name]]
+    if not ok_workers:
+        return '\n'.join(lines)
+
+    lines += [
+        '## 工作負載',
+        '',
+        '| 工作負載 | 指標 | ' + ' | '.join(ok_workers) + ' |',
+        '|---|---|' + '---|' * len(ok_workers)
+    ]
+    metrics = (
+        ('吞吐量', lambda r: f"{r['throughput_ops_s']:.1f} ops/s"),
+        ('p50', lambda r: format_seconds(r['p50_s'])),
+        ('p95', lambda r: format_seconds(r['p95_s'])),
+        ('p99', lambda r: format_seconds(r['p99_s'])),
+        ('記憶體峰值', lambda r: format_bytes(r['peak_alloc_bytes'])),
+    )
+    for workload in WORKLOADS:
+        results = [report['workers'][name]['workloads'][workload] for name in ok_workers]
+        if not any(results):
+            continue
+        for index, (label, fmt) in enumerate(metrics):
+            cells = [fmt(result) if result else 'n/a' for result in results]
+            lines.append(f"| {workload if index == 0 else ''} | {label} | " + ' | '.join(cells) + ' |')
+
+    lines += [
+        '',
+        '## 程序與磁碟',
+        '',
+        '| 指標 | ' + ' | '.join(ok_workers) + ' |',
+        '|---|' + '---|' * len(ok_workers)
+    ]
+    for label, key in (('程序常駐記憶體峰值', 'peak_rss_bytes'),
+                       ('磁碟大小（播種後）', 'disk_seeded_bytes'),
+                       ('磁碟大小（結束時）', 'disk_final_bytes')):
+        cells = [format_bytes(report['workers'][name][key]) for name in ok_workers]
+        lines.append(f"| {label} | " + ' | '.join(cells) + ' |')
+
+    lines += [
+        '',
+        'n/a 表示該 Worker 未實作此工作負載。記憶體峰值為計時結束後另外執行'
+        f'最多 {MEMORY_PASS_OPS} 次操作時，tracemalloc 觀察到的 Python 配置峰值。',
+        ''
+    ]
+    return '\n'.join(lines)
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        print(json.dumps(run_worker(sys.argv[2], json.loads(sys.argv[3]))))
+        return
+
+    parser = argparse.ArgumentParser(description='Compare worker implementations under identical workloads')
+    parser.add_argument('--workers', default='',
+                        help='comma-separated worker names (default: every worker_*_src)')
+    parser.add_argument('--users', type=int, default=10_000, help='seeded users')
+    parser.add_argument('--todos', type=int, default=10_000, help='seeded todos')
+    parser.add_argument('--ops', type=int, default=1000, help='operations per workload')
+    parser.add_argument('--bcrypt-ops', type=int, default=10,
+                        help='operations of the bcrypt-bound workloads (login, register)')
+    parser.add_argument('--bcrypt-rounds', type=int, default=12, help='bcrypt cost of seeded password hashes')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the operation script')
+    parser.add_argument('--sequential', action='store_true',
+                        help='run workers one after another (avoids CPU contention between them)')
+    parser.add_argument('--output', help='write raw results as JSON to this path')
+    parser.add_argument('--report', help='write the Markdown report to this path')
+    args = parser.parse_args()
+
+    workers = discover_workers()
+    if args.workers:
+        selected = [name.strip() for name in args.workers.split(',')]
+        unknown = [name for name in selected if name not in workers]
+        if unknown:
+            parser.error(f"Unknown worker(s): {', '.join(unknown)}")
+        workers = {name: workers[name] for name in selected}
+
+    config = {
+        'users': args.users, 'todos': args.todos, 'ops': args.ops,
+        'bcrypt_ops': args.bcrypt_ops, 'bcrypt_rounds': args.bcrypt_rounds,
+        'seed': args.seed, 'parallel': not args.sequential
+    }
+
+    if args.sequential:
+        results = [launch(name, path, config) for name, path in workers.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=len(workers) or 1) as pool:
+            results = list(pool.map(lambda item: launch(item[0], item[1], config), workers.items()))
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'config': config,
+        'workers': dict(results)
+    }
+
+    markdown = render_report(report)
+    print(markdown)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(markdown)
+
+    if any('error' in result for result in report['workers'].values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,21 +3,129 @@ HTTP API application for Worker A.
 
 This application provides:
 - User login with JWT token generation
-- Todo list management (create and list)
+- Todo list management (create, list, delta sync, search, get, update and delete)
+- Server-Sent-Events stream of todo changes
+- Todo statistics per user and (for admins) over all users
+- Todos created in a time range, per user and (for admins) streamed over all users
+- Optionally the GUI itself under /app (same origin, no CORS preflight)
+- Optionally a read replica (follower) that tails the primary's change log
+  and forwards writes to the primary
 Uses Flask as the HTTP framework.
 """
 
-from flask import Flask, request, jsonify
+import time
+
+# Taken before the remaining imports, so startup timing includes them
+PROCESS_STARTED = time.perf_counter()
+
+import os
+import signal
+import threading
+from flask import Flask, Response, request, jsonify, g
 from functools import wraps
 from auth.auth_service import AuthService
-from todos.todo_service import TodoService
+from monitoring import metrics, profiling, InFlightTracker, StartupTimer
+from todos.todo_service import TodoService, TODO_NOT_FOUND_ERROR
+from todos.event_hub import HEARTBEAT_SECONDS, RESYNC_FRAME
 
 
 app = Flask(__name__)
 
-# Initialize services
-auth_service = AuthService()
-todo_service = TodoService()
+# Storage files (paths relative to the working directory)
+USERS_FILE = os.environ.get('WORKER_A_USERS_FILE', 'users_a.json')
+TODOS_FILE = os.environ.get('WORKER_A_TODOS_FILE', 'todos_a.json')
+REVOKED_FILE = os.environ.get('WORKER_A_REVOKED_FILE', 'revoked_a.json')
+
+# Usernames allowed to call admin endpoints (comma-separated environment variable)
+ADMIN_USERNAMES = {
+    name.strip()
+    for name in os.environ.get('WORKER_A_ADMIN_USERS', '').split(',')
+    if name.strip()
+}
+
+# Latency histograms are only recorded (and /metrics served) when enabled
+if os.environ.get('WORKER_A_METRICS') == '1':
+    metrics.enable()
+
+# /ready reports "not ready" while this many other requests are in flight
+MAX_IN_FLIGHT = int(os.environ.get('WORKER_A_MAX_IN_FLIGHT', '64'))
+
+# Where profiling sessions write their .pstats files and summaries
+PROFILE_DIR = os.environ.get('WORKER_A_PROFILE_DIR', 'profiles')
+
+# Requests profiled after SIGUSR1 (handler installed when WORKER_A_PROFILE_SIGNAL=1)
+PROFILE_SIGNAL_REQUESTS = int(os.environ.get('WORKER_A_PROFILE_REQUESTS', '100'))
+
+# Serve the GUI under /app from this process (build assets first: python -m gui.build)
+SERVE_GUI = os.environ.get('WORKER_A_SERVE_GUI') == '1'
+
+# Keep only recently used users' todo lists in memory, up to this many bytes (0: keep all)
+TODO_CACHE_BYTES = int(os.environ.get('WORKER_A_TODO_CACHE_BYTES', '0'))
+
+# Todos per chunk written by the streamed admin time-range query
+ADMIN_RANGE_CHUNK_LINES = 100
+
+# Run as a read-only follower of the primary at this URL (empty: this is the primary)
+PRIMARY_URL = os.environ.get('WORKER_A_PRIMARY_URL', '').rstrip('/')
+
+# Follower: seconds between reads of the primary's change log
+FOLLOWER_POLL_SECONDS = float(os.environ.get('WORKER_A_FOLLOWER_POLL_SECONDS', '0.1'))
+
+# Follower: /ready reports "not ready" once the copy is older than this many seconds
+FOLLOWER_MAX_STALENESS = float(os.environ.get('WORKER_A_FOLLOWER_MAX_STALENESS', '5'))
+
+startup = StartupTimer(PROCESS_STARTED)
+startup.record('imports', time.perf_counter() - PROCESS_STARTED)
+
+# Initialize services (cheap: storage is loaded by the warm-up below)
+with startup.phase('init_services'):
+    auth_service = AuthService(USERS_FILE, revocation_file=REVOKED_FILE)
+    todo_service = TodoService(TODOS_FILE, cache_bytes=TODO_CACHE_BYTES or None, follower=bool(PRIMARY_URL))
+in_flight = InFlightTracker()
+
+follower = None
+forwarder = None
+if PRIMARY_URL:
+    from replication import ReplicationFollower, PrimaryForwarder
+    follower = ReplicationFollower(todo_service, auth_service, FOLLOWER_POLL_SECONDS)
+    forwarder = PrimaryForwarder(PRIMARY_URL)
+
+if SERVE_GUI:
+    from gui.serving import create_gui_blueprint
+    # The page calls the API from its own origin
+    app.register_blueprint(create_gui_blueprint(api_base=''), url_prefix='/app')
+
+
+def warm_up_services():
+    """Load storage and build lookup structures before traffic arrives."""
+    with startup.phase('warm_up.auth'):
+        auth_service.warm_up()
+    with startup.phase('warm_up.todos'):
+        todo_service.warm_up()
+    if follower is not None:
+        follower.start()
+    startup.mark_ready()
+    app.logger.info('Worker A ready after %.3fs', startup.ready_seconds)
+
+
+# Warm up in the background while the server already answers health checks;
+# /ready returns 503 until it finishes, and earlier requests load on demand
+warm_up_thread = threading.Thread(target=warm_up_services, name='warm-up', daemon=True)
+warm_up_thread.start()
+
+
+def start_profiling_on_signal(signum, frame):
+    """Profile the next PROFILE_SIGNAL_REQUESTS requests (SIGUSR1 handler)."""
+    # Start from a thread: the handler may interrupt code holding profiling locks
+    threading.Thread(
+        target=profiling.start,
+        kwargs={'requests': PROFILE_SIGNAL_REQUESTS, 'output_dir': PROFILE_DIR},
+        daemon=True
+    ).start()
+
+
+if os.environ.get('WORKER_A_PROFILE_SIGNAL') == '1' and hasattr(signal, 'SIGUSR1'):
+    signal.signal(signal.SIGUSR1, start_profiling_on_signal)
 
 
 def require_auth(f):
@@ -26,29 +134,110 @@ def require_auth(f):
     def decorated_function(*args, **kwargs):
         token = None
 
-        # Check for token in Authorization header
-        auth_header = request.headers.get('Authorization')
-        if auth_header:
-            try:
-                token = auth_header.split(' ')[1]  # Format: "Bearer <token>"
-            except IndexError:
-                pass
+        with metrics.stage('require_auth'):
+            # Check for token in Authorization header
+            auth_header = request.headers.get('Authorization')
+            if auth_header:
+                try:
+                    token = auth_header.split(' ')[1]  # Format: "Bearer <token>"
+                except IndexError:
+                    pass
+
+            context = auth_service.authenticate(token) if token else None
 
         if not token:
             return jsonify({'error': 'Authentication required'}), 401
 
-        user_info = auth_service.verify_token(token)
-        if not user_info:
+        if context is None:
             return jsonify({'error': 'Invalid or expired token'}), 401
 
-        # Add user information to request context
-        request.current_user = user_info.get('username')
-        request.current_user_id = user_info.get('user_id')
+        # Verified identity for the rest of the request (decoded only once)
+        g.auth = context
         return f(*args, **kwargs)
 
     return decorated_function
 
 
+def forward_to_primary(f):
+    """
+    Decorator sending a write endpoint's requests to the primary when this
+    process is a follower (use before require_auth; the primary authenticates).
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if forwarder is None:
+            return f(*args, **kwargs)
+
+        with metrics.stage('forward_to_primary'):
+            status, body, content_type = forwarder.forward(
+                request.method, request.path, request.query_string, request.headers,
+                request.get_data(), request.remote_addr or ''
+            )
+        if 200 <= status < 300:
+            # The primary has written the change: apply it before answering,
+            # so the client reads its own write from this process
+            follower.poll()
+        return Response(body, status=status, content_type=content_type or None)
+
+    return decorated_function
+
+
+def require_admin(f):
+    """Decorator to require an authenticated admin user (use after require_auth)."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if g.auth.username not in ADMIN_USERNAMES:
+            return jsonify({'error': 'Admin privileges required'}), 403
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@app.before_request
+def count_in_flight_request():
+    """Count the request as in flight until its teardown."""
+    in_flight.start()
+    startup.mark_first_request()
+
+
+@app.teardown_request
+def release_in_flight_request(exc):
+    """Stop counting the request as in flight."""
+    in_flight.finish()
+
+
+@app.before_request
+def start_request_profile():
+    """Profile the request while a profiling session is active."""
+    if profiling.is_active():
+        profiling.begin_request()
+
+
+@app.teardown_request
+def stop_request_profile(exc):
+    """Stop profiling the request (if it was profiled)."""
+    profiling.end_request()
+
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started (only while metrics are enabled)."""
+    if metrics.is_enabled():
+        g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_latency(response):
+    """Record the request latency per method, route and status."""
+    started = g.get('request_started')
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe_request(
+            request.method, endpoint, response.status_code, time.perf_counter() - started
+        )
+    return response
+
+
 # Authentication endpoints
 
 @app.route('/api/login', methods=['POST'])
@@ -89,6 +278,242 @@ def login():
         return jsonify({'error': error or 'Login failed'}), 401
 
 
+@app.route('/api/logout', methods=['POST'])
+@forward_to_primary
+@require_auth
+def logout():
+    """
+    Log out by revoking the current token.
+
+    Requires: Bearer token in Authorization header
+
+    Response (200):
+    {
+        "message": "Logged out"
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    success, error = auth_service.logout(g.auth)
+
+    if success:
+        return jsonify({'message': 'Logged out'}), 200
+    else:
+        return jsonify({'error': error or 'Logout failed'}), 400
+
+
+@app.route('/api/admin/revoke', methods=['POST'])
+@forward_to_primary
+@require_auth
+@require_admin
+def admin_revoke():
+    """
+    Revoke another session's token (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Request body (one of):
+    {
+        "token": "jwt_token_string"
+    }
+    {
+        "jti": "token_id"
+    }
+
+    Response (200):
+    {
+        "message": "Token revoked"
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    success, error = auth_service.revoke_token(
+        token=data.get('token'),
+        token_id=data.get('jti')
+    )
+
+    if success:
+        return jsonify({'message': 'Token revoked'}), 200
+    else:
+        return jsonify({'error': error or 'Revocation failed'}), 400
+
+
+@app.route('/api/admin/profile', methods=['POST'])
+@require_auth
+@require_admin
+def admin_start_profile():
+    """
+    Profile the next N requests or all requests for T seconds (admin only).
+
+    The session switches itself off and writes a .pstats file plus a text
+    summary of the hottest worker functions to WORKER_A_PROFILE_DIR.
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Request body (one of):
+    {
+        "requests": 100
+    }
+    {
+        "seconds": 30
+    }
+
+    Response (202):
+    {
+        "profile": {
+            "requests": 100,
+            "seconds": null,
+            "started_at": "ISO 8601 string",
+            "profiled_requests": 0,
+            "skipped_requests": 0
+        }
+    }
+
+    Response (400 / 409):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    requests_limit = data.get('requests')
+    seconds_limit = data.get('seconds')
+
+    is_valid, error = profiling.validate_limits(requests_limit, seconds_limit)
+    if not is_valid:
+        return jsonify({'error': error}), 400
+
+    success, session, error = profiling.start(
+        requests=requests_limit, seconds=seconds_limit, output_dir=PROFILE_DIR
+    )
+
+    if success:
+        return jsonify({'profile': session}), 202
+    else:
+        return jsonify({'error': error or 'Profiling could not be started'}), 409
+
+
+@app.route('/api/admin/profile', methods=['GET'])
+@require_auth
+@require_admin
+def admin_profile_status():
+    """
+    Get the active profiling session and the result of the last one (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Response (200):
+    {
+        "active": null,
+        "last_result": {
+            "requests": 100,
+            "seconds": null,
+            "started_at": "ISO 8601 string",
+            "finished_at": "ISO 8601 string",
+            "profiled_requests": 100,
+            "skipped_requests": 3,
+            "pstats": "profiles/profile_<timestamp>_<pid>.pstats",
+            "summary": "profiles/profile_<timestamp>_<pid>.txt"
+        }
+    }
+    """
+    return jsonify(profiling.status()), 200
+
+
+@app.route('/api/admin/todos/stats', methods=['GET'])
+@require_auth
+@require_admin
+def admin_todo_stats():
+    """
+    Get todo statistics over all users (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Query parameters:
+        days: Only include the most recent N days in the histogram (default: all)
+
+    Response (200):
+    {
+        "stats": {
+            "total": 1250,
+            "users": 40,
+            "created_per_day": [
+                {"date": "2024-01-01", "count": 12}
+            ]
+        }
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    days = request.args.get('days')
+
+    success, stats, error = todo_service.get_global_stats(days)
+
+    if success:
+        return jsonify({'stats': stats}), 200
+    else:
+        return jsonify({'error': error or 'Failed to get todo statistics'}), 400
+
+
+@app.route('/api/admin/todos/range', methods=['GET'])
+@require_auth
+@require_admin
+def admin_todos_in_range():
+    """
+    Stream the todos created in a time range, over all users or one user (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Query parameters:
+        from: Only todos created at or after this ISO 8601 timestamp (default: no bound)
+        to: Only todos created before this ISO 8601 timestamp (default: no bound)
+        user_id: Only this user's todos (default: all users)
+
+    Response (200): application/x-ndjson, one todo per line, oldest first
+
+        {"id": "uuid", "content": "string", "user_id": "uuid", "created_at": "ISO 8601 string"}
+        {"id": "uuid", "content": "string", "user_id": "uuid", "created_at": "ISO 8601 string"}
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    success, todos, error = todo_service.iter_todos_created_between(
+        request.args.get('from'), request.args.get('to'), request.args.get('user_id')
+    )
+    if not success:
+        return jsonify({'error': error or 'Failed to query todos'}), 400
+
+    # Lines are sent in chunks as the todos are read, so the range is never
+    # held in memory as a whole
+    def generate():
+        lines = []
+        for todo in todos:
+            lines.append(app.json.dumps(todo) + '\n')
+            if len(lines) == ADMIN_RANGE_CHUNK_LINES:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
 @app.route('/api/me', methods=['GET'])
 @require_auth
 def get_current_user():
@@ -106,9 +531,7 @@ def get_current_user():
         }
     }
     """
-    user = auth_service.get_user_by_token(
-        request.headers.get('Authorization', '').split(' ')[1]
-    )
+    user = g.auth.user
 
     if not user:
         return jsonify({'error': 'User not found'}), 404
@@ -125,6 +548,7 @@ def get_current_user():
 # Todo endpoints
 
 @app.route('/api/todos', methods=['POST'])
+@forward_to_primary
 @require_auth
 def create_todo():
     """
@@ -154,12 +578,14 @@ def create_todo():
     """
     data = request.get_json() or {}
     content = data.get('content')
-    user_id = request.current_user_id
+    user_id = g.auth.user_id
 
     success, todo_data, error = todo_service.create_todo(content, user_id)
 
     if success:
-        return jsonify({'todo': todo_data}), 201
+        with metrics.stage('jsonify'):
+            response = jsonify({'todo': todo_data})
+        return response, 201
     else:
         return jsonify({'error': error or 'Failed to create todo'}), 400
 
@@ -168,10 +594,16 @@ def create_todo():
 @require_auth
 def list_todos():
     """
-    List all todo items for the authenticated user.
+    List all todo items for the authenticated user, newest first.
 
     Requires: Bearer token in Authorization header
 
+    Query parameters:
+        from: Only todos created at or after this ISO 8601 timestamp
+        to: Only todos created before this ISO 8601 timestamp
+              (e.g. from=2024-05-01&to=2024-06-01 for May; UTC unless an
+              offset is given)
+
     Response (200):
     {
         "todos": [
@@ -183,34 +615,463 @@ def list_todos():
             }
         ]
     }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
     """
-    user_id = request.current_user_id
+    user_id = g.auth.user_id
 
-    success, todos_list, error = todo_service.list_todos(user_id)
+    success, todos_list, error = todo_service.list_todos(
+        user_id, request.args.get('from'), request.args.get('to')
+    )
 
     if success:
-        return jsonify({'todos': todos_list or []}), 200
+        with metrics.stage('jsonify'):
+            response = jsonify({'todos': todos_list or []})
+        return response, 200
     else:
         return jsonify({'error': error or 'Failed to list todos'}), 400
 
 
-# Health check endpoint
+@app.route('/api/todos/<todo_id>', methods=['GET'])
+@require_auth
+def get_todo(todo_id):
+    """
+    Get one of the authenticated user's todos.
+
+    Requires: Bearer token in Authorization header
+
+    Response (200):
+    {
+        "todo": {
+            "id": "uuid",
+            "content": "string",
+            "user_id": "uuid",
+            "created_at": "ISO 8601 string"
+        }
+    }
+
+    Response (404):
+    {
+        "error": "Todo not found"
+    }
+    """
+    user_id = g.auth.user_id
+
+    success, todo_data, error = todo_service.get_todo(todo_id, user_id)
+
+    if success:
+        return jsonify({'todo': todo_data}), 200
+    elif error == TODO_NOT_FOUND_ERROR:
+        return jsonify({'error': error}), 404
+    else:
+        return jsonify({'error': error or 'Failed to get todo'}), 400
+
+
+@app.route('/api/todos/<todo_id>', methods=['PATCH'])
+@forward_to_primary
+@require_auth
+def update_todo(todo_id):
+    """
+    Update the content of one of the authenticated user's todos.
+
+    Requires: Bearer token in Authorization header
+
+    Request body:
+    {
+        "content": "string"
+    }
+
+    Response (200):
+    {
+        "todo": {
+            "id": "uuid",
+            "content": "string",
+            "user_id": "uuid",
+            "created_at": "ISO 8601 string",
+            "updated_at": "ISO 8601 string"
+        }
+    }
+
+    Response (400 / 404):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    content = data.get('content')
+    user_id = g.auth.user_id
+
+    success, todo_data, error = todo_service.update_todo(todo_id, user_id, content)
+
+    if success:
+        return jsonify({'todo': todo_data}), 200
+    elif error == TODO_NOT_FOUND_ERROR:
+        return jsonify({'error': error}), 404
+    else:
+        return jsonify({'error': error or 'Failed to update todo'}), 400
+
+
+@app.route('/api/todos/<todo_id>', methods=['DELETE'])
+@forward_to_primary
+@require_auth
+def delete_todo(todo_id):
+    """
+    Delete one of the authenticated user's todos.
+
+    Requires: Bearer token in Authorization header
+
+    Response (200):
+    {
+        "message": "Todo deleted"
+    }
+
+    Response (404):
+    {
+        "error": "Todo not found"
+    }
+    """
+    user_id = g.auth.user_id
+
+    success, error = todo_service.delete_todo(todo_id, user_id)
+
+    if success:
+        return jsonify({'message': 'Todo deleted'}), 200
+    elif error == TODO_NOT_FOUND_ERROR:
+        return jsonify({'error': error}), 404
+    else:
+        return jsonify({'error': error or 'Failed to delete todo'}), 400
+
+
+@app.route('/api/todos/changes', methods=['GET'])
+@require_auth
+def get_todo_changes():
+    """
+    Get the authenticated user's todo changes since a version (delta sync).
+
+    Requires: Bearer token in Authorization header
+
+    Query parameters:
+        since: Version returned by the previous call (omit for the full list)
+
+    Response (200):
+    {
+        "version": "string",
+        "reset": false,
+        "todos": [
+            {
+                "id": "uuid",
+                "content": "string",
+                "user_id": "uuid",
+                "created_at": "ISO 8601 string"
+            }
+        ],
+        "deleted": ["uuid"]
+    }
+
+    When "reset" is true, "todos" is the full list and replaces the
+    client's copy (first sync, or the version is no longer valid, e.g.
+    after a server restart).
+    """
+    user_id = g.auth.user_id
+    since = request.args.get('since')
+
+    success, changes, error = todo_service.sync_todos(user_id, since)
+
+    if success:
+        with metrics.stage('jsonify'):
+            response = jsonify(changes)
+        return response, 200
+    else:
+        return jsonify({'error': error or 'Failed to get todo changes'}), 400
+
+
+@app.route('/api/todos/stream', methods=['GET'])
+@require_auth
+def stream_todo_events():
+    """
+    Stream the authenticated user's todo changes as Server-Sent Events.
+
+    Requires: Bearer token in Authorization header
+
+    Response (200): text/event-stream
+
+        event: todo_created
+        data: {"id": "uuid", "content": "string", "user_id": "uuid", "created_at": "ISO 8601 string"}
+
+        event: todo_updated
+        data: {"id": "uuid", "content": "string", ...}
+
+        event: todo_deleted
+        data: {"id": "uuid"}
+
+    A ": heartbeat" comment is sent after HEARTBEAT_SECONDS without events.
+    A client that falls too far behind receives "event: resync" and the
+    stream ends; it should catch up via GET /api/todos/changes and reconnect.
+    The stream also ends once its token is revoked (logout, admin revoke)
+    or expires; the token is checked again before every frame and heartbeat.
+
+    Response (429):
+    {
+        "error": "Too many open event streams"
+    }
+    """
+    subscription = todo_service.events.subscribe(g.auth.user_id)
+    if subscription is None:
+        return jsonify({'error': 'Too many open event streams'}), 429
+
+    token = g.auth.token
+    expires_at = g.auth.claims.get('exp')
+
+    # The generator runs after the request has been torn down, so an open
+    # stream neither counts as in flight nor holds a profiling session
+    def generate():
+        try:
+            yield f"retry: {HEARTBEAT_SECONDS * 1000}\n\n"
+            while True:
+                timeout = HEARTBEAT_SECONDS
+                if expires_at is not None:
+                    # Wake up no later than the token's expiry
+                    timeout = min(timeout, max(int(expires_at) - time.time(), 0))
+                frame = subscription.next_frame(timeout)
+                if auth_service.token_manager.verify_claims(token) is None:
+                    return
+                if frame is not None:
+                    yield frame
+                elif subscription.overflowed:
+                    yield RESYNC_FRAME
+                    return
+                elif subscription.closed:
+                    return
+                else:
+                    yield ': heartbeat\n\n'
+        finally:
+            todo_service.events.unsubscribe(subscription)
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/todos/stats', methods=['GET'])
+@require_auth
+def get_todo_stats():
+    """
+    Get the authenticated user's todo count and created-per-day histogram.
+
+    Requires: Bearer token in Authorization header
+
+    Query parameters:
+        days: Only include the most recent N days in the histogram (default: all)
+
+    Response (200):
+    {
+        "stats": {
+            "total": 12,
+            "created_per_day": [
+                {"date": "2024-01-01", "count": 3}
+            ]
+        }
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    user_id = g.auth.user_id
+    days = request.args.get('days')
+
+    success, stats, error = todo_service.get_stats(user_id, days)
+
+    if success:
+        return jsonify({'stats': stats}), 200
+    else:
+        return jsonify({'error': error or 'Failed to get todo statistics'}), 400
+
+
+@app.route('/api/todos/search', methods=['GET'])
+@require_auth
+def search_todos():
+    """
+    Search the authenticated user's todos by content.
+
+    Every query term matches words starting with it; results contain all
+    query terms, best match first.
+
+    Requires: Bearer token in Authorization header
+
+    Query parameters:
+        q: Search text (required, at most 200 characters)
+        limit: Maximum number of results (default 20, at most 100)
+
+    Response (200):
+    {
+        "todos": [
+            {
+                "id": "uuid",
+                "content": "string",
+                "user_id": "uuid",
+                "created_at": "ISO 8601 string"
+            }
+        ]
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    user_id = g.auth.user_id
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', type=int)
+
+    success, todos_list, error = todo_service.search_todos(user_id, query, limit)
+
+    if success:
+        with metrics.stage('jsonify'):
+            response = jsonify({'todos': todos_list or []})
+        return response, 200
+    else:
+        return jsonify({'error': error or 'Failed to search todos'}), 400
+
+
+# Health check endpoints
 
 @app.route('/health', methods=['GET'])
 def health():
     """
     Health check endpoint.
 
+    Query parameters:
+        verbose: "1" to include readiness, in-flight requests, open event
+                 streams, startup timing, storage I/O counters and (on a
+                 follower) replication lag
+
     Response (200):
     {
         "status": "healthy",
         "service": "Worker A API"
     }
+
+    Response (200, verbose=1):
+    {
+        "status": "healthy",
+        "service": "Worker A API",
+        "ready": true,
+        "in_flight_requests": 1,
+        "event_streams": 2,
+        "startup": {
+            "phases": {"imports": 0.21, "init_services": 0.002, "warm_up.auth": 0.01, ...},
+            "ready_seconds": 0.45,
+            "time_to_first_request_seconds": 0.3,
+            "uptime_seconds": 120.5
+        },
+        "storage": {
+            "users": {
+                "file": "users_a.json",
+                "file_reads": 42,
+                "file_writes": 1,
+                "bytes_read": 51234,
+                "bytes_written": 1220,
+                "parse_seconds": 0.0031,
+                "serialize_seconds": 0.0002,
+                "record_count": 10,
+                "file_size_bytes": 1220
+            },
+            "todos": {...}
+        },
+        "replication": {
+            "primary": "http://primary:5000",
+            "lsn": 1042,
+            "poll_seconds": 0.1,
+            "polls": 5120,
+            "applied_changes": 1042,
+            "reloads": 1,
+            "errors": 0,
+            "last_error": null,
+            "last_lag_seconds": 0.052,
+            "max_lag_seconds": 0.31,
+            "staleness_seconds": 0.04
+        }
+    }
     """
-    return jsonify({
+    response = {
         'status': 'healthy',
         'service': 'Worker A API'
-    }), 200
+    }
+
+    if request.args.get('verbose') == '1':
+        storage = {**auth_service.storage_stats(), **todo_service.storage_stats()}
+        response['ready'] = auth_service.is_ready() and todo_service.is_ready()
+        response['in_flight_requests'] = in_flight.count
+        response['event_streams'] = todo_service.events.connection_count()
+        response['startup'] = startup.to_dict()
+        response['storage'] = storage
+        if follower is not None:
+            response['replication'] = {'primary': PRIMARY_URL, **follower.status()}
+
+    return jsonify(response), 200
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Readiness check endpoint.
+
+    Ready once storage has been loaded, and only while fewer than
+    WORKER_A_MAX_IN_FLIGHT other requests are in flight (default 64). A
+    follower is only ready while it caught up with the primary within the
+    last WORKER_A_FOLLOWER_MAX_STALENESS seconds (default 5).
+
+    Response (200):
+    {
+        "ready": true
+    }
+
+    Response (503):
+    {
+        "ready": false,
+        "reason": "error message"
+    }
+    """
+    if not (auth_service.is_ready() and todo_service.is_ready()):
+        return jsonify({'ready': False, 'reason': 'Storage is not loaded'}), 503
+
+    if follower is not None and not follower.is_caught_up(FOLLOWER_MAX_STALENESS):
+        return jsonify({'ready': False, 'reason': 'Replica is behind the primary'}), 503
+
+    # Do not count this readiness request itself
+    if in_flight.count - 1 >= MAX_IN_FLIGHT:
+        return jsonify({'ready': False, 'reason': 'Too many requests in flight'}), 503
+
+    return jsonify({'ready': True}), 200
+
+
+# Metrics endpoint
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """
+    Latency histograms in the Prometheus text exposition format.
+
+    Enabled with the WORKER_A_METRICS=1 environment variable.
+
+    Response (200): text/plain; version=0.0.4
+
+    Response (404):
+    {
+        "error": "Metrics are disabled"
+    }
+    """
+    if not metrics.is_enabled():
+        return jsonify({'error': 'Metrics are disabled'}), 404
+
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 
 # Root endpoint
@@ -226,23 +1087,58 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "login": "POST /api/login",
+            "logout": "POST /api/logout",
             "me": "GET /api/me",
             "create_todo": "POST /api/todos",
             "list_todos": "GET /api/todos",
-            "health": "GET /health"
+            "todo_changes": "GET /api/todos/changes?since=",
+            "todo_stream": "GET /api/todos/stream",
+            "get_todo": "GET /api/todos/<id>",
+            "update_todo": "PATCH /api/todos/<id>",
+            "delete_todo": "DELETE /api/todos/<id>",
+            "search_todos": "GET /api/todos/search?q=",
+            "todo_stats": "GET /api/todos/stats",
+            "admin_revoke": "POST /api/admin/revoke",
+            "admin_profile": "POST /api/admin/profile",
+            "admin_profile_status": "GET /api/admin/profile",
+            "admin_todo_stats": "GET /api/admin/todos/stats",
+            "admin_todos_in_range": "GET /api/admin/todos/range?from=&to=",
+            "health": "GET /health",
+            "ready": "GET /ready",
+            "metrics": "GET /metrics",
+            "gui": "GET /app/ (only with WORKER_A_SERVE_GUI=1)"
         }
     }
     """
+    endpoints = {
+        'login': 'POST /api/login',
+        'logout': 'POST /api/logout',
+        'me': 'GET /api/me',
+        'create_todo': 'POST /api/todos',
+        'list_todos': 'GET /api/todos',
+        'todo_changes': 'GET /api/todos/changes?since=',
+        'todo_stream': 'GET /api/todos/stream',
+        'get_todo': 'GET /api/todos/<id>',
+        'update_todo': 'PATCH /api/todos/<id>',
+        'delete_todo': 'DELETE /api/todos/<id>',
+        'search_todos': 'GET /api/todos/search?q=',
+        'todo_stats': 'GET /api/todos/stats',
+        'admin_revoke': 'POST /api/admin/revoke',
+        'admin_profile': 'POST /api/admin/profile',
+        'admin_profile_status': 'GET /api/admin/profile',
+        'admin_todo_stats': 'GET /api/admin/todos/stats',
+        'admin_todos_in_range': 'GET /api/admin/todos/range?from=&to=',
+        'health': 'GET /health',
+        'ready': 'GET /ready',
+        'metrics': 'GET /metrics'
+    }
+    if SERVE_GUI:
+        endpoints['gui'] = 'GET /app/'
+
     return jsonify({
         'service': 'Worker A API',
         'version': '1.0.0',
-        'endpoints': {
-            'login': 'POST /api/login',
-            'me': 'GET /api/me',
-            'create_todo': 'POST /api/todos',
-            'list_todos': 'GET /api/todos',
-            'health': 'GET /health'
-        }
+        'endpoints': endpoints
     }), 200
 
 
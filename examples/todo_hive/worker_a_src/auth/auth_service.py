@@ -8,6 +8,8 @@ following worker_b_src pattern.
 from typing import Tuple, Optional, Dict
 from .user_storage import FileBasedUserStorage
 from .token_manager import JWTTokenManager
+from .auth_context import AuthContext
+from monitoring import metrics
 
 
 class AuthService:
@@ -19,16 +21,18 @@ class AuthService:
     This implementation follows worker_b_src pattern.
     """
 
-    def __init__(self, storage_file: str = "users_a.json"):
+    def __init__(self, storage_file: str = "users_a.json", revocation_file: str = "revoked_a.json"):
         """
         Initialize authentication service.
 
         Args:
             storage_file: Path to user storage file
+            revocation_file: Path to revoked token storage file
         """
         self.user_storage = FileBasedUserStorage(storage_file)
-        self.token_manager = JWTTokenManager()
+        self.token_manager = JWTTokenManager(revocation_file=revocation_file)
 
+    @metrics.timed('auth_service.login')
     def login(self, username: str, password: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Login a user and generate a token.
@@ -87,6 +91,74 @@ class AuthService:
         """
         return self.token_manager.verify_token(token)
 
+    @metrics.timed('auth_service.authenticate')
+    def authenticate(self, token: str) -> Optional[AuthContext]:
+        """
+        Verify a token once and build the request's authentication context.
+
+        Args:
+            token: JWT token to verify
+
+        Returns:
+            AuthContext if the token is valid, None otherwise
+        """
+        claims = self.token_manager.verify_claims(token)
+        if claims is None:
+            return None
+
+        return AuthContext(token, claims, self.user_storage.get_user_by_id)
+
+    def logout(self, context: AuthContext) -> Tuple[bool, Optional[str]]:
+        """
+        Log out by revoking the token of the given authentication context.
+
+        Args:
+            context: Authentication context of the session to end
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not self.token_manager.revoke_claims(context.claims):
+            return False, "Token cannot be revoked"
+
+        return True, None
+
+    def revoke_token(self, token: Optional[str] = None,
+                     token_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Revoke a token (administrative), given either the token or its ID.
+
+        Args:
+            token: JWT token to revoke
+            token_id: Token ID ('jti' claim) to revoke when the token is unknown
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if token:
+            revoked = self.token_manager.revoke_token(token)
+        elif token_id:
+            revoked = self.token_manager.revoke_token_id(token_id)
+        else:
+            return False, "Token or token ID is required"
+
+        if not revoked:
+            return False, "Token cannot be revoked"
+
+        return True, None
+
+    def refresh_revocations(self) -> bool:
+        """
+        Pick up tokens revoked by another process (e.g. the primary, when
+        running as a follower).
+
+        Returns:
+            True if the revocation list was reloaded
+        """
+        if self.token_manager.revocation_list is None:
+            return False
+        return self.token_manager.revocation_list.reload_if_changed()
+
     def get_user_by_token(self, token: str) -> Optional[Dict]:
         """
         Get user information from token.
@@ -97,12 +169,20 @@ class AuthService:
         Returns:
             User dictionary if token is valid, None otherwise
         """
-        user_info = self.verify_token(token)
-        if not user_info:
+        context = self.authenticate(token)
+        if context is None:
             return None
 
-        user_id = user_info.get('user_id')
-        if user_id:
-            return self.user_storage.get_user_by_id(user_id)
+        return context.user
+
+    def warm_up(self):
+        """Load user storage so the first request does not pay for it."""
+        self.user_storage.warm_up()
+
+    def is_ready(self) -> bool:
+        """Return True once user storage has been loaded."""
+        return self.user_storage.ready
 
-        return None
\ No newline at end of file
+    def storage_stats(self) -> Dict[str, Dict]:
+        """Return I/O counters of the storage files used by this service."""
+        return {'users': self.user_storage.stats.to_dict()}
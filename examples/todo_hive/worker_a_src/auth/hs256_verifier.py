@@ -0,0 +1,149 @@
+"""
+Fast-path HS256 JWT verifier for Worker A.
+
+Tokens issued by JWTTokenManager always use HS256 with a single secret and
+a fixed claim set, so the generic jwt.decode machinery (algorithm lookup,
+per-call key preparation, option merging, exception-driven failures) is
+unnecessary on the verification hot path.
+
+Security checks kept:
+- Algorithm pinned to HS256 (header must declare it)
+- Constant-time HMAC-SHA256 signature comparison
+- Registered claims checked like jwt.decode defaults (exp, iat, nbf, aud)
+"""
+
+import binascii
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable
+
+from jwt.algorithms import HMACAlgorithm
+from jwt.utils import base64url_decode
+
+
+class HS256Verifier:
+    """
+    Specialized verifier for HS256 tokens signed with one secret.
+
+    This implementation provides:
+    - A precomputed HMAC key object, copied per token instead of rebuilt
+    - A small memo of header segments of correctly signed tokens, so the
+      common header is decoded only once per process
+    - Failures reported as None instead of exceptions
+    - Only the configured claims extracted from the payload
+    """
+
+    # Upper bound for memoized header segments (only headers of valid signatures are kept)
+    MAX_CACHED_HEADERS = 8
+
+    def __init__(self, secret_key: str, claims: Iterable[str] = ('user_id', 'username')):
+        """
+        Initialize the verifier.
+
+        Args:
+            secret_key: Secret key tokens are signed with
+            claims: Payload claims returned for a valid token
+        """
+        # Reject asymmetric keys exactly like PyJWT's HMAC key preparation
+        key = HMACAlgorithm(HMACAlgorithm.SHA256).prepare_key(secret_key)
+        self._mac = hmac.new(key, digestmod=hashlib.sha256)
+        self._claims = tuple(claims)
+        self._accepted_headers: Dict[str, bool] = {}
+
+    def verify(self, token: Any, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Verify a token and extract the configured claims.
+
+        Args:
+            token: JWT token string
+            now: Current UTC timestamp; computed if not given (batch callers
+                pass one value for the whole batch)
+
+        Returns:
+            Dictionary of the configured claims if the token is valid, None otherwise
+        """
+        if isinstance(token, bytes):
+            try:
+                token = token.decode('utf-8')
+            except UnicodeDecodeError:
+                return None
+        elif not isinstance(token, str):
+            return None
+
+        signing_input, dot, crypto_segment = token.rpartition('.')
+        header_segment, dot2, payload_segment = signing_input.partition('.')
+        if not dot or not dot2:
+            return None
+
+        header_known = header_segment in self._accepted_headers
+        if not header_known and not self._is_header_allowed(header_segment):
+            return None
+
+        try:
+            signature = base64url_decode(crypto_segment)
+            payload_data = base64url_decode(payload_segment)
+        except (TypeError, binascii.Error):
+            return None
+
+        mac = self._mac.copy()
+        mac.update(signing_input.encode('utf-8'))
+        if not hmac.compare_digest(mac.digest(), signature):
+            return None
+
+        # Memoize only headers of correctly signed tokens, so forged tokens
+        # cannot fill the memo
+        if not header_known and len(self._accepted_headers) < self.MAX_CACHED_HEADERS:
+            self._accepted_headers[header_segment] = True
+
+        try:
+            payload = json.loads(payload_data)
+        except ValueError:
+            return None
+
+        if not isinstance(payload, dict):
+            return None
+
+        if now is None:
+            now = datetime.now(tz=timezone.utc).timestamp()
+        if not self._claims_valid(payload, now):
+            return None
+
+        return {claim: payload.get(claim) for claim in self._claims}
+
+    @staticmethod
+    def _is_header_allowed(header_segment: str) -> bool:
+        """Decode a header segment and check the algorithm is pinned to HS256."""
+        try:
+            header = json.loads(base64url_decode(header_segment))
+        except (TypeError, ValueError, binascii.Error):
+            return False
+
+        if not isinstance(header, dict):
+            return False
+
+        # Detached payloads are never issued by JWTTokenManager
+        if header.get('b64', True) is False:
+            return False
+
+        return header.get('alg') == 'HS256'
+
+    @staticmethod
+    def _claims_valid(payload: Dict, now: float) -> bool:
+        """Apply the registered claim checks jwt.decode performs by default."""
+        try:
+            if 'iat' in payload and int(payload['iat']) > now:
+                return False
+            if 'nbf' in payload and int(payload['nbf']) > now:
+                return False
+            if 'exp' in payload and int(payload['exp']) <= now:
+                return False
+        except (TypeError, ValueError):
+            return False
+
+        # No audience is configured, so tokens carrying one are rejected
+        if payload.get('aud'):
+            return False
+
+        return True
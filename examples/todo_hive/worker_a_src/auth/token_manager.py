@@ -5,11 +5,15 @@ This implementation follows worker_b_src pattern:
 - JWT tokens for stateless authentication
 - Configurable expiration time
 - User ID (UUID) and username in token payload
+- Verification through the HS256Verifier fast path (same checks as jwt.decode)
+- Token ID ('jti') in token payload so individual tokens can be revoked
 """
 
-import jwt
-from typing import Optional, Dict
+import calendar
+import uuid
+from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
+from .token_revocation import TokenRevocationList
 
 
 class JWTTokenManager:
@@ -19,21 +23,30 @@ class JWTTokenManager:
     This implementation follows worker_b_src pattern:
     - Stateless token generation with UUID and username
     - Token verification
+    - Optional revocation of individual tokens (logout)
     - No server-side session storage required
     - Suitable for distributed systems
     """
 
-    def __init__(self, secret_key: str = "worker_a_secret_key", expires_in_hours: int = 24):
+    def __init__(self, secret_key: str = "worker_a_secret_key", expires_in_hours: int = 24,
+                 revocation_file: Optional[str] = None):
         """
         Initialize JWT token manager.
 
         Args:
             secret_key: Secret key for signing tokens
             expires_in_hours: Token expiration time in hours
+            revocation_file: Path to the revoked token storage file;
+                revocation is disabled if not given
         """
         self.secret_key = secret_key
         self.expires_in_hours = expires_in_hours
         self.algorithm = 'HS256'
+        # Created on first use, so importing this module does not import jwt
+        self._verifier = None
+        self.revocation_list = (
+            TokenRevocationList(revocation_file) if revocation_file else None
+        )
 
     def generate_token(self, user_id: str, username: str) -> str:
         """
@@ -52,10 +65,13 @@ class JWTTokenManager:
         payload = {
             'user_id': user_id,
             'username': username,
+            'jti': uuid.uuid4().hex,
             'iat': now,
             'exp': expiration
         }
 
+        import jwt
+
         token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
         return token
 
@@ -69,21 +85,104 @@ class JWTTokenManager:
         Returns:
             Dictionary with 'user_id' and 'username' if token is valid, None otherwise
         """
-        try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
-            return {
-                'user_id': payload.get('user_id'),
-                'username': payload.get('username')
-            }
-        except jwt.ExpiredSignatureError:
+        return self._user_info(self.verify_claims(token))
+
+    def verify_claims(self, token: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Verify a JWT token and return its claims.
+
+        Args:
+            token: JWT token string to verify
+            now: Current UTC timestamp; computed if not given
+
+        Returns:
+            Dictionary with 'user_id', 'username', 'jti' and 'exp' if the token
+            is valid and not revoked, None otherwise
+        """
+        claims = self._get_verifier().verify(token, now)
+        if claims is None:
             return None
-        except jwt.InvalidTokenError:
+
+        if self.revocation_list is not None and self.revocation_list.is_revoked(claims['jti']):
             return None
 
+        return claims
+
+    def _get_verifier(self):
+        """Return the HS256 verifier, creating it (and importing jwt) on first use."""
+        if self._verifier is None:
+            from .hs256_verifier import HS256Verifier
+
+            self._verifier = HS256Verifier(
+                self.secret_key, claims=('user_id', 'username', 'jti', 'exp')
+            )
+        return self._verifier
+
+    @staticmethod
+    def _user_info(claims: Optional[Dict]) -> Optional[Dict[str, str]]:
+        """Reduce verified claims to user information."""
+        if claims is None:
+            return None
+
+        return {
+            'user_id': claims['user_id'],
+            'username': claims['username']
+        }
+
+    def revoke_token(self, token: str) -> bool:
+        """
+        Revoke a valid token until it expires.
+
+        Args:
+            token: JWT token string to revoke
+
+        Returns:
+            True if the token was revoked, False if it is invalid, already
+            expired, carries no token ID, or revocation is disabled
+        """
+        if self.revocation_list is None:
+            return False
+
+        return self.revoke_claims(self._get_verifier().verify(token))
+
+    def revoke_claims(self, claims: Optional[Dict[str, Any]]) -> bool:
+        """
+        Revoke the token described by already verified claims.
+
+        Args:
+            claims: Claims returned by verify_claims
+
+        Returns:
+            True if the token was revoked, False if it is already expired,
+            carries no token ID, or revocation is disabled
+        """
+        if self.revocation_list is None or claims is None:
+            return False
+
+        if not claims.get('jti') or claims.get('exp') is None:
+            return False
+
+        return self.revocation_list.revoke(claims['jti'], int(claims['exp']))
+
+    def revoke_token_id(self, jti: str) -> bool:
+        """
+        Revoke a token by its ID ('jti' claim) when the token itself is unknown.
+
+        The entry is kept for the maximum token lifetime, since the token's
+        own expiration time is not available.
+
+        Args:
+            jti: Token ID to revoke
+
+        Returns:
+            True if the token ID was revoked, False if revocation is disabled
+        """
+        if self.revocation_list is None or not jti:
+            return False
+
+        expiration = datetime.utcnow() + timedelta(hours=self.expires_in_hours)
+        return self.revocation_list.revoke(jti, int(calendar.timegm(expiration.utctimetuple())))
+
     def is_token_valid(self, token: str) -> bool:
         """
         Check if a token is valid.
@@ -6,13 +6,16 @@ This implementation follows worker_b_src pattern:
 - UUID as user identifier
 - bcrypt for password hashing
 - File-based storage for user data
+- Checksummed, durably replaced file keeping the previous version
 """
 
-import json
 import os
+import time
 import uuid
-from typing import Optional, Dict
-import bcrypt
+from typing import Optional, Dict, List
+from monitoring import metrics
+from monitoring.storage_stats import StorageStats
+from storage import encode_document, keep_previous_copy, read_document, write_atomic
 
 
 class FileBasedUserStorage:
@@ -35,8 +38,13 @@ class FileBasedUserStorage:
                 "password_hash": "string",
                 "created_at": "ISO 8601 string"
             }
-        ]
+        ],
+        "checksum": "crc32:..."
     }
+
+    Each save is fsync'ed and atomically replaces the file, keeping the
+    replaced version as <storage_file>.prev; a file failing its checksum is
+    replaced by that copy instead of being read as empty.
     """
 
     def __init__(self, storage_file: str = "users_a.json"):
@@ -47,30 +55,90 @@ class FileBasedUserStorage:
             storage_file: Path to the JSON file for storing users
         """
         self.storage_file = storage_file
+        self.stats = StorageStats(storage_file)
+        self.ready = False
+        # Where the last load came from ('current', 'previous' or 'missing')
+        self._load_source = 'missing'
         self._ensure_storage_file()
 
     def _ensure_storage_file(self):
         """Ensure the storage file exists, create if not."""
         if not os.path.exists(self.storage_file):
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump({"users": []}, f)
+            write_atomic(self.storage_file, encode_document({"users": []}))
 
+    @metrics.timed('user_storage.load')
     def _load_users(self) -> Dict:
-        """Load users from storage file."""
-        try:
-            with open(self.storage_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure "users" key exists
-                if "users" not in data:
-                    data["users"] = []
-                return data
-        except (FileNotFoundError, json.JSONDecodeError):
+        """
+        Load users from storage file, or from its previous copy if the
+        storage file fails verification.
+
+        Raises:
+            StorageCorruptedError: If neither copy passes verification
+        """
+        result = read_document(self.storage_file)
+        self._load_source = result.source
+        if result.data is None:
             return {"users": []}
 
+        data = result.data
+        # Ensure "users" key exists
+        if "users" not in data:
+            data["users"] = []
+        self.stats.record_read(result.num_bytes, result.parse_seconds, len(data["users"]))
+        return data
+
+    @metrics.timed('user_storage.save')
     def _save_users(self, data: Dict):
-        """Save users to storage file."""
-        with open(self.storage_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save users to storage file (atomically replaced and fsync'ed)."""
+        start = time.perf_counter()
+        raw = encode_document(data)
+        serialize_seconds = time.perf_counter() - start
+        # A file that failed verification must not become the previous copy
+        keep_previous = self._load_source == 'current'
+        write_atomic(
+            self.storage_file, raw,
+            (lambda: keep_previous_copy(self.storage_file)) if keep_previous else None
+        )
+        self._load_source = 'current'
+        self.stats.record_write(len(raw), serialize_seconds, len(data.get("users", [])))
+
+    def warm_up(self):
+        """
+        Load the storage file once and mark the storage as ready.
+
+        Called at startup so the first request does not pay for the initial
+        load, and so readiness checks can tell when storage is usable. A
+        storage file recovered from its previous copy is rewritten.
+        """
+        start = time.perf_counter()
+        data = self._load_users()
+        source = self._load_source
+        if source == 'previous':
+            self._save_users(data)
+        self.stats.record_recovery({
+            'checkpoint': source,
+            'checkpoint_records': len(data["users"]),
+            'seconds': round(time.perf_counter() - start, 6)
+        })
+        self.ready = True
+
+    def get_all_users(self) -> List[Dict]:
+        """
+        Get all users (used by backups).
+
+        Returns:
+            List of all user dictionaries
+        """
+        return self._load_users()["users"]
+
+    def restore(self, users: List[Dict]):
+        """
+        Replace the stored users (used when restoring a backup).
+
+        Args:
+            users: User dictionaries to store
+        """
+        self._save_users({"users": users})
 
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """
@@ -141,6 +209,9 @@ class FileBasedUserStorage:
         if not stored_hash:
             return False
 
+        # Imported on first use to keep process startup fast
+        import bcrypt
+
         try:
             return bcrypt.checkpw(
                 password.encode('utf-8'),
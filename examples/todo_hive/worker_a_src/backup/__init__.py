@@ -0,0 +1,8 @@
+"""
+Storage backups for Worker A.
+
+Run from the worker_a_src directory, e.g.:
+    python -m backup.snapshots create --backup-dir backups
+    python -m backup.snapshots verify --backup-dir backups
+    python -m backup.snapshots restore --backup-dir backups
+"""
@@ -0,0 +1,9 @@
+"""
+Benchmarks for Worker A.
+
+Run from the worker_a_src directory, e.g.:
+    python -m benchmarks.suite run --output benchmark_results.json
+    python -m benchmarks.suite compare baseline.json benchmark_results.json
+    python -m benchmarks.loadgen --users 20 --duration 30
+    python -m benchmarks.hs256_verifier
+"""
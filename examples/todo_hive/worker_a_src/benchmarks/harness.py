@@ -0,0 +1,205 @@
+"""
+Benchmark harness: timing, JSON result files, baseline comparison and
+isolated app instances.
+
+Each benchmark is a zero-argument callable. It is calibrated so that one
+sample takes at least MIN_SAMPLE_SECONDS, then sampled until the time
+budget is used up. Reported times are per call.
+
+Result file format:
+{
+    "meta": {"created_at": "ISO 8601 string", "python": "3.x", ...},
+    "results": {
+        "<benchmark name>": {
+            "median_s": float, "mean_s": float, "min_s": float,
+            "p95_s": float, "ops_per_s": float,
+            "samples": int, "calls_per_sample": int
+        }
+    }
+}
+"""
+
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# A single sample should last at least this long, so timer overhead is negligible
+MIN_SAMPLE_SECONDS = 0.001
+
+# Numbers the app modules loaded by load_app
+_app_instances = itertools.count(1)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure(func: Callable[[], object], budget_seconds: float = 1.0,
+            min_samples: int = 3, max_samples: int = 50) -> Dict[str, float]:
+    """
+    Time a callable and summarize the per-call cost.
+
+    Args:
+        func: Zero-argument callable to benchmark
+        budget_seconds: Approximate total time to spend sampling
+        min_samples: Minimum number of samples, even if over budget
+        max_samples: Maximum number of samples
+
+    Returns:
+        Dictionary of timing statistics (seconds per call)
+    """
+    # Calibrate the number of calls per sample (also serves as warm-up)
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS or calls >= 1_000_000:
+            break
+        calls *= 10
+
+    samples: List[float] = []
+    deadline = time.perf_counter() + budget_seconds
+    while len(samples) < max_samples and (len(samples) < min_samples or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - start) / calls)
+
+    median = statistics.median(samples)
+    return {
+        'median_s': median,
+        'mean_s': statistics.fmean(samples),
+        'min_s': min(samples),
+        'p95_s': percentile(samples, 0.95),
+        'ops_per_s': 1.0 / median if median > 0 else float('inf'),
+        'samples': len(samples),
+        'calls_per_sample': calls
+    }
+
+
+def load_app(users_file: str, todos_file: str, revocation_file: str):
+    """
+    Load a separate instance of app.py whose services use the given files.
+
+    The paths are passed through the WORKER_A_*_FILE environment variables
+    while the module is executed, so neither its services nor its warm-up
+    ever open the default files in the working directory (those of a
+    server that may be running from there). Each call creates a new module
+    with its own services; the warm-up has finished when it returns.
+
+    Args:
+        users_file: Users storage file
+        todos_file: Todos storage file
+        revocation_file: Revoked token storage file
+
+    Returns:
+        The loaded app module
+    """
+    overrides = {
+        'WORKER_A_USERS_FILE': users_file,
+        'WORKER_A_TODOS_FILE': todos_file,
+        'WORKER_A_REVOKED_FILE': revocation_file
+    }
+    saved = {name: os.environ.get(name) for name in overrides}
+    name = f'_benchmark_app_{next(_app_instances)}'
+    spec = importlib.util.spec_from_file_location(name, importlib.util.find_spec('app').origin)
+    module = importlib.util.module_from_spec(spec)
+    # Flask looks the module up by name to find its root path
+    sys.modules[name] = module
+    os.environ.update(overrides)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        for variable, value in saved.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+    module.warm_up_thread.join()
+    return module
+
+
+def new_results(extra_meta: Optional[Dict] = None) -> Dict:
+    """Create an empty result document with environment metadata."""
+    meta = {
+        'created_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine()
+    }
+    meta.update(extra_meta or {})
+    return {'meta': meta, 'results': {}}
+
+
+def save_results(results: Dict, path: str):
+    """Write a result document as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict:
+    """Read a result document written by save_results."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict, current: Dict,
+                    threshold: float = 0.10) -> Tuple[List[Dict], List[str], List[str]]:
+    """
+    Compare current results against a baseline by median time per call.
+
+    Args:
+        baseline: Baseline result document
+        current: Current result document
+        threshold: Allowed slowdown as a fraction (0.10 = 10% slower)
+
+    Returns:
+        Tuple of (rows, missing, new)
+        - rows: One dictionary per common benchmark with 'name', 'baseline_s',
+          'current_s', 'change' (fractional) and 'regression' (bool)
+        - missing: Benchmarks in the baseline but not in current results
+        - new: Benchmarks in current results but not in the baseline
+    """
+    base = baseline.get('results', {})
+    cur = current.get('results', {})
+
+    rows = []
+    for name in sorted(set(base) & set(cur)):
+        baseline_s = base[name]['median_s']
+        current_s = cur[name]['median_s']
+        change = (current_s - baseline_s) / baseline_s if baseline_s > 0 else 0.0
+        rows.append({
+            'name': name,
+            'baseline_s': baseline_s,
+            'current_s': current_s,
+            'change': change,
+            'regression': change > threshold
+        })
+
+    missing = sorted(set(base) - set(cur))
+    new = sorted(set(cur) - set(base))
+    return rows, missing, new
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
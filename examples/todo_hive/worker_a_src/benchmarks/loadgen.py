@@ -0,0 +1,286 @@
+"""
+Local HTTP load generator replaying the Worker A GUI traffic mix.
+
+Each virtual user runs in its own thread and follows the flow of
+gui/static/js/api.js and app.js: log in, fetch /api/me, list todos, then
+perform a configurable mix of actions with think time in between. A
+'create' action is followed by a list, as the GUI refetches after adding.
+
+Targets:
+- inprocess (default): the Flask app through its test client, with users
+  and todos seeded into a temporary directory
+- http://localhost:<port>: a running Worker A API (local hosts only);
+  accounts must already exist, see --username / --password
+
+Usage (from worker_a_src):
+    python -m benchmarks.loadgen --users 20 --duration 30
+    python -m benchmarks.loadgen --target http://localhost:5000 \\
+        --username 'loadgen_{i}' --password secret --mix list=4,create=1,me=1
+
+Reports throughput plus p50/p95/p99 latency and error rate per endpoint.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import bcrypt
+
+from .harness import percentile, format_seconds, load_app
+
+
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+
+class InProcessTransport:
+    """Send requests to the Flask app through a per-thread test client."""
+
+    def __init__(self, app):
+        self._app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, headers: Dict,
+                body: Optional[Dict]) -> Tuple[int, Optional[Dict]]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self._app.test_client()
+        response = client.open(path, method=method, headers=headers, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpTransport:
+    """Send requests to a local API server over HTTP."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        host = urlparse(base_url).hostname
+        if host not in LOCAL_HOSTS:
+            raise ValueError(f"Refusing to generate load against non-local host: {host}")
+        self._base_url = base_url.rstrip('/')
+        self._timeout = timeout
+
+    def request(self, method: str, path: str, headers: Dict,
+                body: Optional[Dict]) -> Tuple[int, Optional[Dict]]:
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(
+            self._base_url + path, data=data, method=method,
+            headers={'Content-Type': 'application/json', **headers}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                return response.status, json.loads(response.read() or b'null')
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+
+class Recorder:
+    """Thread-safe collection of per-endpoint latencies and errors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+
+class VirtualUser(threading.Thread):
+    """One simulated GUI user running sessions until the deadline."""
+
+    def __init__(self, index: int, transport, recorder: Recorder, args, deadline: float):
+        super().__init__(name=f'virtual-user-{index}', daemon=True)
+        self.index = index
+        self.transport = transport
+        self.recorder = recorder
+        self.args = args
+        self.deadline = deadline
+        self.random = random.Random(args.seed + index)
+        self.token: Optional[str] = None
+
+    def call(self, endpoint: str, method: str, path: str, expected: int,
+             body: Optional[Dict] = None) -> Optional[Dict]:
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        start = time.perf_counter()
+        try:
+            status, data = self.transport.request(method, path, headers, body)
+        except Exception:
+            status, data = 0, None
+        self.recorder.record(endpoint, time.perf_counter() - start, status == expected)
+        return data if status == expected else None
+
+    def think(self):
+        if self.args.think_time > 0:
+            time.sleep(self.random.expovariate(1.0 / self.args.think_time))
+
+    def run(self):
+        username = self.args.username.format(i=self.index)
+        actions, weights = zip(*self.args.mix.items())
+
+        while time.monotonic() < self.deadline:
+            # Session start: login, current user, initial list
+            data = self.call('POST /api/login', 'POST', '/api/login', 200,
+                             {'username': username, 'password': self.args.password})
+            if not data:
+                self.think()
+                continue
+            self.token = data['token']
+            self.call('GET /api/me', 'GET', '/api/me', 200)
+            self.call('GET /api/todos', 'GET', '/api/todos', 200)
+
+            for _ in range(self.args.actions_per_session):
+                if time.monotonic() >= self.deadline:
+                    break
+                self.think()
+                action = self.random.choices(actions, weights)[0]
+                if action == 'create':
+                    self.call('POST /api/todos', 'POST', '/api/todos', 201,
+                              {'content': f'load test todo from user {self.index}'})
+                    self.call('GET /api/todos', 'GET', '/api/todos', 200)
+                elif action == 'list':
+                    self.call('GET /api/todos', 'GET', '/api/todos', 200)
+                elif action == 'me':
+                    self.call('GET /api/me', 'GET', '/api/me', 200)
+
+            self.token = None
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse 'list=4,create=1,me=1' into action weights."""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ('list', 'create', 'me'):
+            raise argparse.ArgumentTypeError(f"Unknown action in mix: {name}")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Mix must contain a positive weight")
+    return mix
+
+
+def in_process_transport(workdir: str, args) -> InProcessTransport:
+    """Seed one account per virtual user and point the app at temporary files."""
+    users_path = os.path.join(workdir, 'users_loadgen.json')
+    todos_path = os.path.join(workdir, 'todos_loadgen.json')
+    password_hash = bcrypt.hashpw(
+        args.password.encode('utf-8'), bcrypt.gensalt(rounds=args.bcrypt_rounds)
+    ).decode('utf-8')
+    users = [
+        {
+            'id': f'00000000-0000-4000-8000-{i:012d}',
+            'username': args.username.format(i=i),
+            'password_hash': password_hash,
+            'created_at': '2024-01-01T00:00:00'
+        }
+        for i in range(args.users)
+    ]
+    with open(users_path, 'w', encoding='utf-8') as f:
+        json.dump({'users': users}, f)
+
+    app_module = load_app(users_path, todos_path, os.path.join(workdir, 'revoked_loadgen.json'))
+    return InProcessTransport(app_module.app)
+
+
+def report(recorder: Recorder, elapsed: float) -> Dict:
+    """Summarize recorded latencies per endpoint."""
+    summary = {'duration_s': elapsed, 'endpoints': {}}
+    total = errors = 0
+    for endpoint, latencies in sorted(recorder.latencies.items()):
+        count = len(latencies)
+        failed = recorder.errors.get(endpoint, 0)
+        total += count
+        errors += failed
+        summary['endpoints'][endpoint] = {
+            'requests': count,
+            'throughput_rps': count / elapsed,
+            'errors': failed,
+            'error_rate': failed / count,
+            'p50_s': percentile(latencies, 0.50),
+            'p95_s': percentile(latencies, 0.95),
+            'p99_s': percentile(latencies, 0.99)
+        }
+    summary['requests'] = total
+    summary['throughput_rps'] = total / elapsed if elapsed else 0.0
+    summary['errors'] = errors
+    summary['error_rate'] = errors / total if total else 0.0
+    return summary
+
+
+def print_report(summary: Dict):
+    print(f"{'endpoint':<18}{'requests':>10}{'req/s':>10}{'errors':>9}"
+          f"{'p50':>12}{'p95':>12}{'p99':>12}")
+    for endpoint, stats in summary['endpoints'].items():
+        print(f"{endpoint:<18}{stats['requests']:>10}{stats['throughput_rps']:>10.1f}"
+              f"{stats['error_rate']:>9.1%}{format_seconds(stats['p50_s']):>12}"
+              f"{format_seconds(stats['p95_s']):>12}{format_seconds(stats['p99_s']):>12}")
+    print(f"\nTotal: {summary['requests']} requests in {summary['duration_s']:.1f} s, "
+          f"{summary['throughput_rps']:.1f} req/s, error rate {summary['error_rate']:.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Worker A load generator (local only)')
+    parser.add_argument('--target', default='inprocess',
+                        help="'inprocess' or a local base URL such as http://localhost:5000")
+    parser.add_argument('--users', type=int, default=10, help='number of virtual users')
+    parser.add_argument('--duration', type=float, default=30.0, help='test duration in seconds')
+    parser.add_argument('--think-time', type=float, default=0.5,
+                        help='mean think time between actions in seconds (0 disables)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('list=4,create=1,me=1'),
+                        help='action weights after the initial list, e.g. list=4,create=1,me=1')
+    parser.add_argument('--actions-per-session', type=int, default=20,
+                        help='actions per session before logging in again')
+    parser.add_argument('--username', default='loadgen_{i}',
+                        help="account username; '{i}' is replaced by the virtual user number")
+    parser.add_argument('--password', default='loadgen_password', help='account password')
+    parser.add_argument('--bcrypt-rounds', type=int, default=12,
+                        help='bcrypt cost of seeded accounts (inprocess target)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--output', help='also write the report as JSON to this path')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='worker_a_loadgen_') as workdir:
+        if args.target == 'inprocess':
+            transport = in_process_transport(workdir, args)
+        else:
+            try:
+                transport = HttpTransport(args.target)
+            except ValueError as e:
+                parser.error(str(e))
+
+        recorder = Recorder()
+        start = time.monotonic()
+        deadline = start + args.duration
+        threads = [VirtualUser(i, transport, recorder, args, deadline) for i in range(args.users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = report(recorder, time.monotonic() - start)
+
+    summary['config'] = {
+        'target': args.target, 'users': args.users, 'duration_s': args.duration,
+        'think_time_s': args.think_time, 'mix': args.mix,
+        'actions_per_session': args.actions_per_session
+    }
+    print_report(summary)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
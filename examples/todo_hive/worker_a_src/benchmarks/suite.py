@@ -0,0 +1,261 @@
+"""
+Storage and API benchmark suite for Worker A.
+
+Covers FileBasedUserStorage and FileBasedTodoStorage operations at several
+dataset sizes, AuthService.login, JWTTokenManager.verify_token,
+TodoService.list_todos, search_todos and get_stats, and the HTTP endpoints through the
+Flask test client. Every run uses freshly seeded files in a temporary
+directory.
+
+Usage (from worker_a_src):
+    # Run the suite and write machine-readable results
+    python -m benchmarks.suite run --output benchmark_results.json
+
+    # Store a baseline, later compare a new run against it
+    python -m benchmarks.suite run --output benchmarks/baseline.json
+    python -m benchmarks.suite compare benchmarks/baseline.json benchmark_results.json --threshold 0.10
+
+The compare command exits with status 1 if any benchmark is slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+import bcrypt
+
+from auth.auth_service import AuthService
+from auth.user_storage import FileBasedUserStorage
+from todos.todo_service import TodoService
+from todos.todo_storage import FileBasedTodoStorage
+
+from .harness import (
+    measure, new_results, save_results, load_results, compare_results, format_seconds, load_app
+)
+
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+# Todos of each dataset are spread over this many users
+TODO_OWNERS = 100
+
+BENCH_USERNAME = 'bench_user'
+BENCH_PASSWORD = 'bench_password'
+
+
+def seed_users(path: str, count: int, password_hash: str) -> Dict:
+    """
+    Write a users file with count users; the last one is the benchmark user.
+
+    Returns:
+        The benchmark user's record
+    """
+    created = datetime(2024, 1, 1)
+    users = [
+        {
+            'id': str(uuid.uuid4()),
+            'username': f'user_{i}',
+            'password_hash': password_hash,
+            'created_at': (created + timedelta(seconds=i)).isoformat()
+        }
+        for i in range(count - 1)
+    ]
+    bench_user = {
+        'id': str(uuid.uuid4()),
+        'username': BENCH_USERNAME,
+        'password_hash': password_hash,
+        'created_at': created.isoformat()
+    }
+    users.append(bench_user)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'users': users}, f)
+
+    return bench_user
+
+
+def seed_todos(path: str, count: int, owner_ids: List[str]) -> List[str]:
+    """
+    Write a todos file with count todos spread round-robin over owner_ids.
+
+    Returns:
+        List of all todo IDs
+    """
+    created = datetime(2024, 1, 1)
+    todos = [
+        {
+            'id': str(uuid.uuid4()),
+            'content': f'Benchmark todo number {i}',
+            'user_id': owner_ids[i % len(owner_ids)],
+            'created_at': (created + timedelta(seconds=i)).isoformat()
+        }
+        for i in range(count)
+    ]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'todos': todos}, f)
+
+    return [todo['id'] for todo in todos]
+
+
+def size_benchmarks(workdir: str, size: int,
+                    password_hash: str) -> List[Tuple[str, Callable[[], object]]]:
+    """Build the benchmarks that depend on the dataset size."""
+    users_path = os.path.join(workdir, f'users_{size}.json')
+    todos_path = os.path.join(workdir, f'todos_{size}.json')
+
+    bench_user = seed_users(users_path, size, password_hash)
+    owner_ids = [bench_user['id']] + [str(uuid.uuid4()) for _ in range(TODO_OWNERS - 1)]
+    todo_ids = seed_todos(todos_path, size, owner_ids)
+
+    user_storage = FileBasedUserStorage(users_path)
+    todo_storage = FileBasedTodoStorage(todos_path)
+    todo_service = TodoService(todos_path)
+
+    client, token = http_client(workdir, users_path, todos_path, tag=str(size))
+    headers = {'Authorization': f'Bearer {token}'}
+    middle_todo_id = todo_ids[len(todo_ids) // 2]
+    # Delta sync with an up-to-date version (the common polling case)
+    sync_version = todo_service.sync_todos(bench_user['id'])[1]['version']
+
+    tag = f'[n={size}]'
+    return [
+        (f'user_storage.get_user_by_username{tag}', lambda: user_storage.get_user_by_username(BENCH_USERNAME)),
+        (f'user_storage.get_user_by_id{tag}', lambda: user_storage.get_user_by_id(bench_user['id'])),
+        (f'user_storage.username_exists_missing{tag}', lambda: user_storage.username_exists('nobody')),
+        (f'todo_storage.get_todos_by_user_id{tag}', lambda: todo_storage.get_todos_by_user_id(bench_user['id'])),
+        (f'todo_storage.get_todo_by_id{tag}', lambda: todo_storage.get_todo_by_id(middle_todo_id)),
+        (f'todo_storage.get_all_todos{tag}', todo_storage.get_all_todos),
+        (f'todo_service.get_todo{tag}', lambda: todo_service.get_todo(middle_todo_id, owner_ids[len(todo_ids) // 2 % TODO_OWNERS])),
+        (f'todo_service.list_todos{tag}', lambda: todo_service.list_todos(bench_user['id'])),
+        (f'todo_service.sync_todos{tag}', lambda: todo_service.sync_todos(bench_user['id'], sync_version)),
+        (f'todo_service.search_todos{tag}', lambda: todo_service.search_todos(bench_user['id'], 'todo numb')),
+        (f'todo_service.get_stats{tag}', lambda: todo_service.get_stats(bench_user['id'])),
+        (f'todo_service.get_global_stats{tag}', todo_service.get_global_stats),
+        (f'http.get_todos{tag}', lambda: client.get('/api/todos', headers=headers)),
+        (f'http.get_todo{tag}', lambda: client.get(f'/api/todos/{todo_ids[0]}', headers=headers)),
+        # Write benchmarks last: they grow the dataset
+        (f'todo_storage.create_todo{tag}', lambda: todo_storage.create_todo('benchmark', bench_user['id'])),
+        (f'http.post_todos{tag}', lambda: client.post('/api/todos', headers=headers, json={'content': 'benchmark'})),
+    ]
+
+
+def http_client(workdir: str, users_path: str, todos_path: str, tag: str):
+    """
+    Return a Flask test client whose services use the given files, and a
+    valid token for the benchmark user.
+    """
+    app_module = load_app(users_path, todos_path, os.path.join(workdir, f'revoked_{tag}.json'))
+    client = app_module.app.test_client()
+    response = client.post('/api/login', json={'username': BENCH_USERNAME, 'password': BENCH_PASSWORD})
+    return client, response.get_json()['token']
+
+
+def fixed_benchmarks(workdir: str, users: int,
+                     password_hash: str) -> List[Tuple[str, Callable[[], object]]]:
+    """Build the benchmarks that do not depend on the todo dataset size."""
+    users_path = os.path.join(workdir, 'users_auth.json')
+    todos_path = os.path.join(workdir, 'todos_auth.json')
+    seed_users(users_path, users, password_hash)
+    seed_todos(todos_path, 0, [''])
+
+    auth_service = AuthService(users_path, revocation_file=os.path.join(workdir, 'revoked_auth.json'))
+    token_manager = auth_service.token_manager
+    token = token_manager.generate_token(str(uuid.uuid4()), BENCH_USERNAME)
+
+    client, client_token = http_client(workdir, users_path, todos_path, tag='auth')
+    headers = {'Authorization': f'Bearer {client_token}'}
+    credentials = {'username': BENCH_USERNAME, 'password': BENCH_PASSWORD}
+
+    tag = f'[users={users}]'
+    return [
+        (f'auth_service.login{tag}', lambda: auth_service.login(BENCH_USERNAME, BENCH_PASSWORD)),
+        ('token_manager.verify_token', lambda: token_manager.verify_token(token)),
+        (f'http.post_login{tag}', lambda: client.post('/api/login', json=credentials)),
+        (f'http.get_me{tag}', lambda: client.get('/api/me', headers=headers)),
+    ]
+
+
+def run(args) -> int:
+    sizes = [int(size) for size in args.sizes.split(',')]
+    password_hash = bcrypt.hashpw(
+        BENCH_PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds=args.bcrypt_rounds)
+    ).decode('utf-8')
+
+    results = new_results({'sizes': sizes, 'bcrypt_rounds': args.bcrypt_rounds, 'budget_s': args.budget})
+
+    with tempfile.TemporaryDirectory(prefix='worker_a_bench_') as workdir:
+        groups = [lambda: fixed_benchmarks(workdir, min(sizes), password_hash)]
+        groups += [lambda size=size: size_benchmarks(workdir, size, password_hash) for size in sizes]
+
+        for build in groups:
+            for name, func in build():
+                if args.filter and args.filter not in name:
+                    continue
+                stats = measure(func, budget_seconds=args.budget)
+                results['results'][name] = stats
+                print(f"{name:<52}{format_seconds(stats['median_s']):>14}"
+                      f"{stats['ops_per_s']:>14.1f} ops/s", flush=True)
+
+    save_results(results, args.output)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+def compare(args) -> int:
+    rows, missing, new = compare_results(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+
+    print(f"{'benchmark':<52}{'baseline':>14}{'current':>14}{'change':>10}")
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:<52}{format_seconds(row['baseline_s']):>14}"
+              f"{format_seconds(row['current_s']):>14}{row['change']:>+10.1%}{flag}")
+
+    for name in missing:
+        print(f"{name:<52}{'(missing from current run)':>38}")
+    for name in new:
+        print(f"{name:<52}{'(not in baseline)':>38}")
+
+    regressions = [row for row in rows if row['regression']]
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} out of {len(rows)} benchmark(s)")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Worker A storage and API benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmark suite')
+    run_parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                            help='comma-separated dataset sizes (records)')
+    run_parser.add_argument('--output', default='benchmark_results.json',
+                            help='path of the JSON result file')
+    run_parser.add_argument('--filter', default='',
+                            help='only run benchmarks whose name contains this text')
+    run_parser.add_argument('--budget', type=float, default=1.0,
+                            help='approximate seconds spent sampling each benchmark')
+    run_parser.add_argument('--bcrypt-rounds', type=int, default=12,
+                            help='bcrypt cost factor of seeded password hashes')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser('compare', help='compare results against a baseline')
+    compare_parser.add_argument('baseline', help='baseline result file')
+    compare_parser.add_argument('current', help='current result file')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='allowed slowdown as a fraction (default 0.10)')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
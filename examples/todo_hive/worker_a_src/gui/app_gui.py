@@ -3,21 +3,14 @@ Worker A GUI Server
 
 Flask 應用程序，提供前端界面服務。
 前端界面連接到 Worker A 後端 API (http://localhost:5000)
+頁面與靜態資源由 serving.py 提供（執行 python -m gui.build 後使用帶雜湊的預壓縮資源）
 """
 
-from flask import Flask, render_template
+from flask import Flask
+from serving import create_gui_blueprint
 
-app = Flask(
-    __name__,
-    template_folder='templates',
-    static_folder='static'
-)
-
-
-@app.route('/')
-def index():
-    """渲染主頁面"""
-    return render_template('index.html')
+app = Flask(__name__, static_folder=None)
+app.register_blueprint(create_gui_blueprint())
 
 
 @app.route('/health', methods=['GET'])
@@ -0,0 +1,134 @@
+"""
+Static asset build for the Worker A GUI.
+
+Copies the GUI's CSS and JavaScript into gui/dist/assets/ under
+content-hashed names (e.g. js/app.3f2a9c1d7b4e.js), together with gzip
+and (if the optional brotli package is installed) brotli precompressed
+variants, and writes gui/dist/manifest.json mapping each source path to
+its hashed path. gui/serving.py serves the hashed files with immutable
+cache headers once the manifest exists.
+
+Design decisions:
+- The hash covers the file content, so a changed file gets a new URL and
+  an unchanged one keeps its URL (and the browser's cached copy)
+- Compression is done once at build time at the highest levels instead
+  of on every request
+- gzip output is reproducible (no timestamp), so rebuilds do not change it
+- Files of earlier builds are kept, so pages loaded before a deploy can
+  still fetch the assets they reference
+- The manifest is written last and atomically replaced, so a server never
+  sees a manifest pointing at files that are not written yet
+
+Usage (from the worker_a_src directory):
+    python -m gui.build
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built without it
+    brotli = None
+
+
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Source files under gui/static/ that are fingerprinted
+ASSETS = ['css/style.css', 'js/cache.js', 'js/api.js', 'js/app.js']
+
+# Length of the content hash in file names (hex characters)
+HASH_LENGTH = 12
+
+
+def _write_file(path: str, data: bytes):
+    """Write a file atomically (temporary file in the same directory, then rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates owner-only files; assets are public
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def hashed_name(source: str, data: bytes) -> str:
+    """
+    Content-hashed path of an asset.
+
+    Args:
+        source: Path relative to gui/static/ (e.g. "js/app.js")
+        data: File content
+
+    Returns:
+        Path with the hash inserted before the extension (e.g. "js/app.3f2a9c1d7b4e.js")
+    """
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    root, ext = os.path.splitext(source)
+    return f"{root}.{digest}{ext}"
+
+
+def build(static_dir: str, dist_dir: str) -> Dict:
+    """
+    Fingerprint and precompress the GUI assets.
+
+    Args:
+        static_dir: Directory with the source assets (gui/static)
+        dist_dir: Output directory (gui/dist)
+
+    Returns:
+        Manifest dictionary {"assets": {source: hashed path}, "encodings": [...]}
+    """
+    assets_dir = os.path.join(dist_dir, 'assets')
+    encodings = ['gzip'] + (['br'] if brotli is not None else [])
+    manifest = {'assets': {}, 'encodings': encodings}
+
+    for source in ASSETS:
+        with open(os.path.join(static_dir, source), 'rb') as f:
+            data = f.read()
+
+        target = hashed_name(source, data)
+        path = os.path.join(assets_dir, target)
+        _write_file(path, data)
+        _write_file(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write_file(path + '.br', brotli.compress(data, quality=11))
+
+        manifest['assets'][source] = target
+
+    _write_file(
+        os.path.join(dist_dir, 'manifest.json'),
+        json.dumps(manifest, indent=2).encode('utf-8')
+    )
+    return manifest
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Build fingerprinted, precompressed GUI assets')
+    parser.add_argument('--static-dir', default=os.path.join(GUI_DIR, 'static'),
+                        help='Source asset directory (default: gui/static)')
+    parser.add_argument('--dist-dir', default=os.path.join(GUI_DIR, 'dist'),
+                        help='Output directory (default: gui/dist)')
+    args = parser.parse_args()
+
+    manifest = build(args.static_dir, args.dist_dir)
+
+    for source, target in manifest['assets'].items():
+        print(f"{source} -> {target}")
+    print(f"Encodings: {', '.join(manifest['encodings'])}")
+    if brotli is None:
+        print("brotli is not installed; only gzip variants were built (pip install brotli)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Serving of the Worker A GUI page and its static assets.
+
+Used by the standalone GUI server (gui/app_gui.py) and, with
+WORKER_A_SERVE_GUI=1, by the API process itself (mounted under /app), so
+the page calls the API from its own origin: no extra server hop and no
+CORS preflight.
+
+Design decisions:
+- After `python -m gui.build`, assets are served from gui/dist/ under
+  content-hashed URLs with "Cache-Control: public, max-age=31536000, immutable"
+- Precompressed .br/.gz variants are picked by the request's Accept-Encoding
+  (with "Vary: Accept-Encoding"); nothing is compressed per request
+- The page itself is revalidated on every visit (no-cache), so the asset
+  URLs of a new build are picked up at once
+- Without a build, the unhashed files in gui/static/ are served (development)
+- The manifest is read once when the blueprint is created; restart the
+  server after a build
+"""
+
+import json
+import mimetypes
+import os
+from typing import Dict, Optional
+
+from flask import Blueprint, make_response, render_template, request, send_from_directory, url_for
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Output directory of gui/build.py
+DIST_DIR = os.path.join(GUI_DIR, 'dist')
+
+# Fingerprinted assets never change under the same URL
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+# Precompressed variants, most preferred first
+ENCODING_SUFFIXES = [('br', '.br'), ('gzip', '.gz')]
+
+
+def load_manifest(dist_dir: str = DIST_DIR) -> Optional[Dict]:
+    """
+    Load the asset manifest written by gui/build.py.
+
+    Returns:
+        Manifest dictionary, or None if the assets have not been built
+    """
+    try:
+        with open(os.path.join(dist_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def create_gui_blueprint(api_base: Optional[str] = None, dist_dir: str = DIST_DIR) -> Blueprint:
+    """
+    Create the blueprint serving the GUI page and its assets.
+
+    Args:
+        api_base: Base URL of the API used by the page ('' for the same
+                  origin, None for the client's default http://localhost:5000)
+        dist_dir: Output directory of gui/build.py
+
+    Returns:
+        Blueprint named 'gui' ('/' is the page, '/assets/...' the built
+        assets and '/static/...' the unbuilt ones)
+    """
+    manifest = load_manifest(dist_dir)
+    assets_dir = os.path.join(dist_dir, 'assets')
+    blueprint = Blueprint('gui', __name__, template_folder='templates', static_folder='static')
+
+    def asset_url(source: str) -> str:
+        """URL of an asset (hashed if built, else the unbuilt file)."""
+        if manifest and source in manifest['assets']:
+            return url_for('gui.asset', filename=manifest['assets'][source])
+        return url_for('gui.static', filename=source)
+
+    @blueprint.route('/')
+    def index():
+        """Render the main page."""
+        response = make_response(render_template('index.html', asset_url=asset_url, api_base=api_base))
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    @blueprint.route('/assets/<path:filename>')
+    def asset(filename):
+        """Serve a built asset, precompressed if the client accepts it."""
+        path = safe_join(assets_dir, filename)
+        if path is None or not os.path.isfile(path):
+            raise NotFound()
+
+        served, encoding = filename, None
+        for name, suffix in ENCODING_SUFFIXES:
+            if request.accept_encodings.quality(name) > 0 and os.path.isfile(path + suffix):
+                served, encoding = filename + suffix, name
+                break
+
+        response = send_from_directory(
+            assets_dir, served,
+            mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            max_age=ASSET_MAX_AGE
+        )
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+    return blueprint
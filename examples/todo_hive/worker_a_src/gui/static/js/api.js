@@ -7,6 +7,59 @@ class WorkerAApi {
     constructor(baseUrl = 'http://localhost:5000') {
         this.baseUrl = baseUrl;
         this.token = localStorage.getItem('worker_a_token') || null;
+        this.todoStream = null;
+        this.cache = new WorkerACache();
+        this.cacheSaveTimer = null;
+        this.pendingTodoCount = 0;
+        this.resetTodoSync();
+    }
+
+    /**
+     * 從本地快取恢復上次的用戶資訊與待辦事項列表（不發送請求）
+     * 恢復的版本號讓下一次 syncTodos 只下載快取之後的變更
+     * @returns {Promise<Object>} {user, todos}，沒有快取時 user 為 null、todos 為空陣列
+     */
+    async loadCache() {
+        const [user, cachedTodos] = await Promise.all([this.cache.get('user'), this.cache.get('todos')]);
+
+        if (cachedTodos && this.todoVersion === null) {
+            this.todosById = new Map(cachedTodos.todos.map(todo => [todo.id, todo]));
+            this.todoVersion = cachedTodos.version;
+        }
+
+        return { user: user || null, todos: this.sortedTodos() };
+    }
+
+    /**
+     * 稍後將待辦事項列表寫入快取（合併短時間內的多次變更，不保存尚未確認的項目）
+     */
+    scheduleCacheSave() {
+        if (this.cacheSaveTimer) {
+            return;
+        }
+        this.cacheSaveTimer = setTimeout(() => {
+            this.cacheSaveTimer = null;
+            const todos = this.sortedTodos().filter(todo => !todo.pending);
+            this.cache.set('todos', { version: this.todoVersion, todos });
+        }, 500);
+    }
+
+    /**
+     * 清除本地待辦事項副本（下次同步時重新下載完整列表）
+     */
+    resetTodoSync() {
+        this.todoVersion = null;
+        this.todosById = new Map();
+    }
+
+    /**
+     * 本地待辦事項列表（最新的在前）
+     * @returns {Array} 待辦事項列表
+     */
+    sortedTodos() {
+        return Array.from(this.todosById.values()).sort(
+            (a, b) => (a.created_at < b.created_at ? 1 : a.created_at > b.created_at ? -1 : 0)
+        );
     }
 
     /**
@@ -27,6 +80,11 @@ class WorkerAApi {
     clearToken() {
         this.token = null;
         localStorage.removeItem('worker_a_token');
+        this.stopTodoStream();
+        this.resetTodoSync();
+        clearTimeout(this.cacheSaveTimer);
+        this.cacheSaveTimer = null;
+        this.cache.clear();
     }
 
     /**
@@ -49,7 +107,10 @@ class WorkerAApi {
         const data = await response.json();
         
         if (!response.ok) {
-            throw new Error(data.error || `HTTP error! status: ${response.status}`);
+            const error = new Error(data.error || `HTTP error! status: ${response.status}`);
+            // 讓呼叫者分辨令牌失效（401）與其他錯誤
+            error.status = response.status;
+            throw error;
         }
         
         return data;
@@ -76,10 +137,34 @@ class WorkerAApi {
         if (data.token) {
             this.setToken(data.token);
         }
+
+        // 丟棄其他用戶留下的快取
+        this.resetTodoSync();
+        await this.cache.clear();
+        await this.cache.set('user', data.user);
         
         return data;
     }
 
+    /**
+     * 登出用戶（在伺服器端撤銷令牌）
+     * @returns {Promise<void>}
+     */
+    async logout() {
+        if (this.token) {
+            try {
+                await fetch(`${this.baseUrl}/api/logout`, {
+                    method: 'POST',
+                    headers: this.getAuthHeaders()
+                });
+            } catch (error) {
+                // 即使撤銷失敗，仍清除本地令牌
+                console.error('Failed to revoke token:', error);
+            }
+        }
+        this.clearToken();
+    }
+
     /**
      * 獲取當前用戶資訊
      * @returns {Promise<Object>} 用戶資訊
@@ -90,7 +175,9 @@ class WorkerAApi {
             headers: this.getAuthHeaders()
         });
 
-        return await this.handleResponse(response);
+        const data = await this.handleResponse(response);
+        this.cache.set('user', data.user);
+        return data;
     }
 
     /**
@@ -122,6 +209,168 @@ class WorkerAApi {
         return data.todos || [];
     }
 
+    /**
+     * 增量同步待辦事項：只下載上次同步後新增、修改與刪除的項目，合併到本地列表
+     * @returns {Promise<Array>} 合併後的待辦事項列表（最新的在前）
+     */
+    async syncTodos() {
+        const query = this.todoVersion ? `?since=${encodeURIComponent(this.todoVersion)}` : '';
+        const response = await fetch(`${this.baseUrl}/api/todos/changes${query}`, {
+            method: 'GET',
+            headers: this.getAuthHeaders()
+        });
+
+        const data = await this.handleResponse(response);
+
+        // reset 表示伺服器返回完整列表（首次同步或版本已失效）
+        if (data.reset) {
+            // 保留尚未確認的樂觀項目
+            this.todosById = new Map(
+                Array.from(this.todosById).filter(([, todo]) => todo.pending)
+            );
+        }
+        (data.todos || []).forEach(todo => this.todosById.set(todo.id, todo));
+        (data.deleted || []).forEach(id => this.todosById.delete(id));
+        this.todoVersion = data.version;
+        this.scheduleCacheSave();
+
+        return this.sortedTodos();
+    }
+
+    /**
+     * 將一個變更事件合併到本地列表（重複的事件不會造成影響）
+     * @param {string} event - todo_created、todo_updated 或 todo_deleted
+     * @param {Object} data - 事件內容（待辦事項，或刪除時的 {id}）
+     * @returns {Array} 合併後的待辦事項列表（最新的在前）
+     */
+    applyTodoEvent(event, data) {
+        if (event === 'todo_deleted') {
+            this.todosById.delete(data.id);
+        } else {
+            this.todosById.set(data.id, data);
+        }
+        this.scheduleCacheSave();
+        return this.sortedTodos();
+    }
+
+    /**
+     * 在伺服器確認前先將新待辦事項加入本地列表（樂觀更新）
+     * 暫時項目帶 pending 標記，時間格式與伺服器相同（UTC，無時區後綴）以便排序
+     * @param {string} content - 待辦事項內容
+     * @returns {Object} 暫時的待辦事項
+     */
+    addPendingTodo(content) {
+        this.pendingTodoCount += 1;
+        const todo = {
+            id: `pending-${this.pendingTodoCount}`,
+            content,
+            created_at: new Date().toISOString().slice(0, -1),
+            pending: true
+        };
+        this.todosById.set(todo.id, todo);
+        return todo;
+    }
+
+    /**
+     * 以伺服器返回的待辦事項取代暫時項目
+     * @param {string} pendingId - 暫時項目的 id
+     * @param {Object} todo - 伺服器創建的待辦事項
+     * @returns {Array} 合併後的待辦事項列表（最新的在前）
+     */
+    confirmPendingTodo(pendingId, todo) {
+        // 等待期間已登出時不再加入
+        if (!this.todosById.delete(pendingId)) {
+            return this.sortedTodos();
+        }
+        return this.applyTodoEvent('todo_created', todo);
+    }
+
+    /**
+     * 創建失敗時移除暫時項目（回滾樂觀更新）
+     * @param {string} pendingId - 暫時項目的 id
+     * @returns {Array} 待辦事項列表（最新的在前）
+     */
+    rollbackPendingTodo(pendingId) {
+        this.todosById.delete(pendingId);
+        return this.sortedTodos();
+    }
+
+    /**
+     * 訂閱待辦事項變更推送（Server-Sent Events）
+     * 使用 fetch 讀取串流，因為 EventSource 無法帶 Authorization header
+     * @param {Function} onEvent - 每個事件呼叫 onEvent(event, data)
+     * @returns {Promise<void>} 串流結束時 resolve（伺服器關閉、要求 resync 或被 stopTodoStream 中止）
+     */
+    async streamTodos(onEvent) {
+        this.stopTodoStream();
+        const controller = new AbortController();
+        this.todoStream = controller;
+
+        try {
+            const response = await fetch(`${this.baseUrl}/api/todos/stream`, {
+                method: 'GET',
+                headers: this.getAuthHeaders(),
+                signal: controller.signal
+            });
+
+            if (!response.ok) {
+                await this.handleResponse(response);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+
+                // 事件之間以空行分隔
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    const frame = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+
+                    let event = 'message';
+                    let data = '';
+                    frame.split('\n').forEach(line => {
+                        if (line.startsWith('event: ')) {
+                            event = line.slice(7);
+                        } else if (line.startsWith('data: ')) {
+                            data += line.slice(6);
+                        }
+                    });
+
+                    // 心跳註解與 retry 設定沒有 data
+                    if (data) {
+                        onEvent(event, JSON.parse(data));
+                    }
+                }
+            }
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                throw error;
+            }
+        } finally {
+            if (this.todoStream === controller) {
+                this.todoStream = null;
+            }
+        }
+    }
+
+    /**
+     * 關閉待辦事項變更推送
+     */
+    stopTodoStream() {
+        if (this.todoStream) {
+            this.todoStream.abort();
+            this.todoStream = null;
+        }
+    }
+
     /**
      * 驗證令牌是否有效
      * @returns {Promise<boolean>} 令牌是否有效
@@ -141,5 +390,6 @@ class WorkerAApi {
     }
 }
 
-// 創建全局 API 實例
-const api = new WorkerAApi();
\ No newline at end of file
+// 創建全局 API 實例（頁面由 API 服務器提供時，data-api-base="" 表示同源）
+const apiBase = document.body.dataset.apiBase;
+const api = new WorkerAApi(apiBase === undefined ? undefined : apiBase);
\ No newline at end of file
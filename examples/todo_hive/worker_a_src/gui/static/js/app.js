@@ -8,6 +8,9 @@ class WorkerAApp {
         this.currentView = 'login';
         this.currentUser = null;
         this.todos = [];
+        this.streaming = false;
+        // 每次啟動推送迴圈遞增；登出時也遞增，使仍在等待重連的舊迴圈結束
+        this.streamGeneration = 0;
         
         // DOM 元素引用
         this.elements = {
@@ -51,20 +54,37 @@ class WorkerAApp {
         // 綁定事件監聽器
         this.bindEvents();
 
-        // 檢查是否有有效的令牌
-        const hasValidToken = await api.verifyToken();
-        
-        if (hasValidToken) {
-            await this.loadUserInfo();
-            this.showDashboard();
-        } else {
-            this.showLogin();
-        }
-
         // 監聽字符計數
         this.elements.todoContent.addEventListener('input', () => {
             this.updateCharCount();
         });
+
+        if (!api.token) {
+            this.showLogin();
+            return;
+        }
+
+        // 先以本地快取立即顯示上次的資料
+        const cached = await api.loadCache();
+        if (cached.user) {
+            this.setCurrentUser(cached.user);
+            this.todos = cached.todos;
+            this.renderTodos();
+            this.showDashboard();
+        }
+
+        // 再向伺服器重新驗證令牌，並增量同步快取之後的變更
+        try {
+            const response = await api.getCurrentUser();
+            this.setCurrentUser(response.user);
+        } catch (error) {
+            this.handleLogout(false);
+            return;
+        }
+
+        await this.loadTodos();
+        this.showDashboard();
+        this.startTodoStream();
     }
 
     /**
@@ -77,7 +97,8 @@ class WorkerAApp {
         });
 
         // 登出按鈕
-        this.elements.logoutBtn.addEventListener('click', () => {
+        this.elements.logoutBtn.addEventListener('click', async () => {
+            await api.logout();
             this.handleLogout();
         });
 
@@ -112,14 +133,14 @@ class WorkerAApp {
         try {
             const response = await api.login(username, password);
             
-            this.currentUser = response.user;
+            this.setCurrentUser(response.user);
             this.showAlert('登錄成功！', 'success');
             
             // 延遲切換視圖以顯示成功訊息
             setTimeout(async () => {
-                await this.loadUserInfo();
                 await this.loadTodos();
                 this.showDashboard();
+                this.startTodoStream();
             }, 500);
 
         } catch (error) {
@@ -131,18 +152,23 @@ class WorkerAApp {
 
     /**
      * 處理登出
+     * @param {boolean} notify - 是否顯示登出訊息（令牌失效時不顯示）
      */
-    handleLogout() {
+    handleLogout(notify = true) {
         api.clearToken();
         this.currentUser = null;
         this.todos = [];
+        this.streaming = false;
+        this.streamGeneration += 1;
         
         // 清空表單
         this.elements.loginForm.reset();
         this.elements.addTodoForm.reset();
         
         this.showLogin();
-        this.showAlert('已成功登出', 'info');
+        if (notify) {
+            this.showAlert('已成功登出', 'info');
+        }
     }
 
     /**
@@ -163,53 +189,105 @@ class WorkerAApp {
             return;
         }
 
-        // 設置按鈕加載狀態
-        this.setButtonLoading(this.elements.addTodoBtn, true);
+        // 樂觀更新：不等待伺服器，先顯示在列表中並清空輸入框
+        const pending = api.addPendingTodo(content);
+        this.todos = api.sortedTodos();
+        this.renderTodos();
+        this.elements.todoContent.value = '';
+        this.updateCharCount();
 
         try {
             const response = await api.createTodo(content);
             
+            // 以伺服器返回的項目取代暫時項目（推送串流送來的同一事件不會重複加入）
+            this.todos = api.confirmPendingTodo(pending.id, response.todo);
+            this.renderTodos();
             this.showAlert('待辦事項新增成功！', 'success');
-            this.elements.todoContent.value = '';
-            this.updateCharCount();
-            
-            // 重新載入待辦事項列表
-            await this.loadTodos();
 
         } catch (error) {
+            // 回滾：移除暫時項目，並將內容放回輸入框
+            this.todos = api.rollbackPendingTodo(pending.id);
+            this.renderTodos();
+            if (!this.elements.todoContent.value) {
+                this.elements.todoContent.value = content;
+                this.updateCharCount();
+            }
             this.showAlert(error.message || '新增待辦事項失敗', 'error');
-        } finally {
-            this.setButtonLoading(this.elements.addTodoBtn, false);
         }
     }
 
     /**
-     * 載入用戶資訊
+     * 設置並顯示當前用戶
      */
-    async loadUserInfo() {
-        try {
-            const response = await api.getCurrentUser();
-            this.currentUser = response.user;
-            this.elements.usernameDisplay.textContent = this.currentUser.username;
-        } catch (error) {
-            console.error('Failed to load user info:', error);
-            this.handleLogout();
-        }
+    setCurrentUser(user) {
+        this.currentUser = user;
+        this.elements.usernameDisplay.textContent = user.username;
     }
 
     /**
-     * 載入待辦事項列表
+     * 載入待辦事項列表（增量同步，只下載變更）
      */
     async loadTodos() {
         try {
-            this.todos = await api.listTodos();
+            this.todos = await api.syncTodos();
             this.renderTodos();
         } catch (error) {
+            // 令牌已被撤銷或過期：返回登錄畫面
+            if (error.status === 401) {
+                this.handleLogout(false);
+                return;
+            }
             this.showAlert(error.message || '載入待辦事項失敗', 'error');
             console.error('Failed to load todos:', error);
         }
     }
 
+    /**
+     * 訂閱待辦事項變更推送，其他分頁或裝置的變更會即時出現在列表中
+     * 串流中斷或要求 resync 時，先增量同步補上遺漏的變更，再重新連線
+     * 令牌失效（401）時結束迴圈並返回登錄畫面
+     */
+    async startTodoStream() {
+        if (this.streaming) {
+            return;
+        }
+        this.streaming = true;
+        const generation = ++this.streamGeneration;
+        // 登出（或登出後再次登錄）後，這個迴圈即不再有效
+        const active = () => this.streamGeneration === generation;
+
+        while (active()) {
+            let delay = 1000;
+            try {
+                await api.streamTodos((event, data) => {
+                    if (event !== 'resync' && active()) {
+                        this.todos = api.applyTodoEvent(event, data);
+                        this.renderTodos();
+                    }
+                });
+            } catch (error) {
+                if (error.status === 401) {
+                    if (active()) {
+                        this.handleLogout(false);
+                    }
+                    break;
+                }
+                console.error('Todo stream failed:', error);
+                delay = 15000;
+            }
+
+            if (!active()) {
+                break;
+            }
+            // 令牌失效時 loadTodos 會登出，迴圈隨之結束
+            await this.loadTodos();
+            if (!active()) {
+                break;
+            }
+            await new Promise(resolve => setTimeout(resolve, delay));
+        }
+    }
+
     /**
      * 渲染待辦事項列表
      */
@@ -229,7 +307,7 @@ class WorkerAApp {
             // 渲染每個待辦事項
             this.todos.forEach(todo => {
                 const li = document.createElement('li');
-                li.className = 'todo-item';
+                li.className = todo.pending ? 'todo-item pending' : 'todo-item';
                 
                 const content = document.createElement('div');
                 content.className = 'todo-content';
@@ -240,7 +318,7 @@ class WorkerAApp {
                 
                 const id = document.createElement('span');
                 id.className = 'todo-id';
-                id.textContent = `ID: ${todo.id.substring(0, 8)}...`;
+                id.textContent = todo.pending ? '傳送中...' : `ID: ${todo.id.substring(0, 8)}...`;
                 
                 const date = document.createElement('span');
                 date.className = 'todo-date';
@@ -292,16 +370,11 @@ class WorkerAApp {
     /**
      * 顯示儀表板（待辦事項管理）
      */
-    async showDashboard() {
+    showDashboard() {
         this.currentView = 'dashboard';
         this.elements.loginView.style.display = 'none';
         this.elements.dashboardView.style.display = 'block';
         this.elements.userInfo.style.display = 'flex';
-        
-        // 確保已載入待辦事項
-        if (this.todos.length === 0) {
-            await this.loadTodos();
-        }
     }
 
     /**
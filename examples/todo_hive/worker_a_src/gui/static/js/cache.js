@@ -0,0 +1,84 @@
+/**
+ * Worker A Local Cache
+ * 以 IndexedDB 保存用戶資訊與待辦事項列表，頁面載入時可立即顯示
+ * 瀏覽器不支援或無法開啟 IndexedDB 時（例如隱私模式），所有操作都不做任何事
+ */
+
+class WorkerACache {
+    constructor(dbName = 'worker_a_cache', storeName = 'entries') {
+        this.dbName = dbName;
+        this.storeName = storeName;
+        this.dbPromise = null;
+    }
+
+    /**
+     * 開啟資料庫（只開啟一次）
+     * @returns {Promise<IDBDatabase|null>} 資料庫，無法使用時為 null
+     */
+    open() {
+        if (!this.dbPromise) {
+            this.dbPromise = new Promise(resolve => {
+                if (typeof indexedDB === 'undefined') {
+                    resolve(null);
+                    return;
+                }
+                const request = indexedDB.open(this.dbName, 1);
+                request.onupgradeneeded = () => {
+                    request.result.createObjectStore(this.storeName);
+                };
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => {
+                    console.error('Failed to open cache:', request.error);
+                    resolve(null);
+                };
+            });
+        }
+        return this.dbPromise;
+    }
+
+    /**
+     * 在一個交易中執行操作
+     * @param {string} mode - readonly 或 readwrite
+     * @param {Function} operation - 以 object store 為參數，返回 IDBRequest
+     * @returns {Promise<*>} 請求結果，無法使用快取或失敗時為 undefined
+     */
+    async run(mode, operation) {
+        const db = await this.open();
+        if (!db) {
+            return undefined;
+        }
+        return new Promise(resolve => {
+            const request = operation(db.transaction(this.storeName, mode).objectStore(this.storeName));
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => {
+                console.error('Cache operation failed:', request.error);
+                resolve(undefined);
+            };
+        });
+    }
+
+    /**
+     * 讀取快取項目
+     * @param {string} key - 鍵
+     * @returns {Promise<*>} 值，不存在時為 undefined
+     */
+    get(key) {
+        return this.run('readonly', store => store.get(key));
+    }
+
+    /**
+     * 寫入快取項目
+     * @param {string} key - 鍵
+     * @param {*} value - 可被結構化複製的值
+     */
+    set(key, value) {
+        return this.run('readwrite', store => store.put(value, key));
+    }
+
+    /**
+     * 清除所有快取項目（登出或切換用戶時）
+     */
+    clear() {
+        return this.run('readwrite', store => store.clear());
+    }
+}
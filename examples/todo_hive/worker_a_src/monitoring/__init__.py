@@ -0,0 +1,17 @@
+"""
+Monitoring module for Worker A.
+
+This module provides runtime instrumentation:
+- Per-stage latency histograms
+- Prometheus text exposition for the /metrics endpoint
+- Storage I/O counters and in-flight request tracking for health checks
+- On-demand cProfile capture of live requests
+- Startup phase timing and time to first request
+"""
+
+from . import metrics, profiling
+from .storage_stats import StorageStats
+from .health import InFlightTracker
+from .startup import StartupTimer
+
+__all__ = ['metrics', 'profiling', 'StorageStats', 'InFlightTracker', 'StartupTimer']
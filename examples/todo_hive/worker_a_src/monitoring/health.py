@@ -0,0 +1,31 @@
+"""
+Readiness helpers for Worker A.
+
+Tracks the number of requests currently being handled, so the readiness
+endpoint can report an overloaded instance as not ready.
+"""
+
+import threading
+
+
+class InFlightTracker:
+    """Thread-safe counter of requests currently in progress."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def start(self):
+        """Mark the start of a request."""
+        with self._lock:
+            self._count += 1
+
+    def finish(self):
+        """Mark the end of a request."""
+        with self._lock:
+            self._count -= 1
+
+    @property
+    def count(self) -> int:
+        """Number of requests currently in progress."""
+        return self._count
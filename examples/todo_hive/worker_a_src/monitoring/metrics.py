@@ -0,0 +1,241 @@
+"""
+Latency histograms with Prometheus text exposition for Worker A.
+
+Instrumentation points (require_auth, service methods, storage load/save)
+record per-stage durations into histograms; the /metrics endpoint renders
+them in the Prometheus text format.
+
+Design decisions:
+- Disabled by default; while disabled, timed() wrappers only check a flag
+  and stage() returns a shared no-op context manager
+- Fixed histogram buckets, so recording is O(buckets) with no allocation
+- One lock per histogram; no external dependencies
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Tuple, Callable
+
+
+# Upper bounds (seconds) of histogram buckets
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+_enabled = False
+
+
+class Histogram:
+    """
+    Cumulative-bucket latency histogram.
+
+    This implementation provides:
+    - Per-bucket counts, total count and sum of observed values
+    - Thread-safe observation
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        """
+        Return cumulative bucket counts, total count and sum.
+
+        Returns:
+            Tuple of (cumulative_counts, count, sum); cumulative_counts has one
+            entry per bucket followed by the +Inf bucket
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, total_sum
+
+
+class MetricsRegistry:
+    """
+    Named histogram families keyed by label values.
+
+    Each family has fixed label names; histograms are created on first use.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, Tuple[str, Tuple[str, ...], Dict[Tuple[str, ...], Histogram]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        """Declare a histogram family."""
+        with self._lock:
+            self._families.setdefault(name, (help_text, label_names, {}))
+
+    def observe(self, name: str, label_values: Tuple[str, ...], value: float):
+        """Record a value into the histogram for the given label values."""
+        histograms = self._families[name][2]
+        histogram = histograms.get(label_values)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.setdefault(label_values, Histogram())
+        histogram.observe(value)
+
+    def reset(self):
+        """Drop all recorded observations (families stay registered)."""
+        with self._lock:
+            for _, _, histograms in self._families.values():
+                histograms.clear()
+
+    def render(self) -> str:
+        """Render all families in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            families = [
+                (name, help_text, label_names, list(histograms.items()))
+                for name, (help_text, label_names, histograms) in sorted(self._families.items())
+            ]
+
+        for name, help_text, label_names, histograms in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for label_values, histogram in sorted(histograms, key=lambda item: item[0]):
+                labels = ','.join(
+                    f'{label}="{_escape(value)}"' for label, value in zip(label_names, label_values)
+                )
+                cumulative, count, total_sum = histogram.snapshot()
+                separator = ',' if labels else ''
+                for bound, bucket_count in zip(histogram.buckets, cumulative):
+                    lines.append(f'{name}_bucket{{{labels}{separator}le="{bound}"}} {bucket_count}')
+                lines.append(f'{name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative[-1]}')
+                lines.append(f'{name}_sum{{{labels}}} {total_sum}')
+                lines.append(f'{name}_count{{{labels}}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_METRIC = 'worker_stage_duration_seconds'
+HTTP_METRIC = 'worker_http_request_duration_seconds'
+REPLICATION_LAG_METRIC = 'worker_replication_lag_seconds'
+
+REGISTRY.register(STAGE_METRIC, 'Time spent in each request processing stage.', ('stage',))
+REGISTRY.register(HTTP_METRIC, 'HTTP request latency.', ('method', 'endpoint', 'status'))
+REGISTRY.register(REPLICATION_LAG_METRIC,
+                  'Time from a change being written by the primary to a follower applying it.', ())
+
+
+def enable():
+    """Start recording metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording metrics."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if metrics are being recorded."""
+    return _enabled
+
+
+def observe_stage(stage: str, seconds: float):
+    """Record the duration of a processing stage."""
+    if _enabled:
+        REGISTRY.observe(STAGE_METRIC, (stage,), seconds)
+
+
+def observe_request(method: str, endpoint: str, status: int, seconds: float):
+    """Record the latency of an HTTP request."""
+    if _enabled:
+        REGISTRY.observe(HTTP_METRIC, (method, endpoint, str(status)), seconds)
+
+
+def observe_replication_lag(seconds: float):
+    """Record the replication lag of one change applied by a follower."""
+    if _enabled:
+        REGISTRY.observe(REPLICATION_LAG_METRIC, (), seconds)
+
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator recording the duration of every call as a stage.
+
+    Args:
+        stage: Stage name used as the 'stage' label
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe(STAGE_METRIC, (stage,), time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def _timed_block(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(STAGE_METRIC, (stage,), time.perf_counter() - start)
+
+
+class _NoOpBlock:
+    """Shared context manager used while metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_OP_BLOCK = _NoOpBlock()
+
+
+def stage(name: str):
+    """
+    Context manager recording the duration of a block as a stage.
+
+    Args:
+        name: Stage name used as the 'stage' label
+    """
+    if not _enabled:
+        return _NO_OP_BLOCK
+    return _timed_block(name)
+
+
+def render() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
@@ -0,0 +1,262 @@
+"""
+On-demand cProfile capture for Worker A.
+
+An admin request (or SIGUSR1) starts a session that profiles the next N
+requests or every request for T seconds. When the session ends it writes a
+.pstats file plus a text summary of the hottest functions in the worker's
+own modules (storage, auth and services), then switches itself off.
+
+Design decisions:
+- While no session is active, request hooks only check a module-level flag
+- One cProfile.Profile per request, merged into the session's pstats.Stats
+- Only one request is profiled at a time, since newer Python versions allow
+  a single active profiler per process; overlapping requests are counted
+  as skipped
+"""
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+
+# Worker source directory; functions defined below it are summarized
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Worker modules included in the summary (relative to SOURCE_ROOT)
+SUMMARY_PATHS = ('auth' + os.sep, 'todos' + os.sep, 'storage' + os.sep, 'app.py')
+
+SUMMARY_LIMIT = 30
+OVERALL_LIMIT = 20
+
+MAX_REQUESTS = 10000
+MAX_SECONDS = 3600
+
+# Numbers the sessions of this process, so their result files never collide
+_session_numbers = itertools.count(1)
+
+
+class ProfileSession:
+    """One profiling session limited by a request count or a duration."""
+
+    def __init__(self, output_dir: str, requests: Optional[int] = None,
+                 seconds: Optional[float] = None):
+        self.output_dir = output_dir
+        self.max_requests = requests
+        self.seconds = seconds
+        self.started_at = datetime.utcnow()
+        self.number = next(_session_numbers)
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.profiled_requests = 0
+        self.skipped_requests = 0
+        self.stats: Optional[pstats.Stats] = None
+        # Held while a request is being profiled
+        self.busy = threading.Lock()
+        self.timer: Optional[threading.Timer] = None
+
+    def to_dict(self) -> Dict:
+        """Return the session settings and progress."""
+        return {
+            'requests': self.max_requests,
+            'seconds': self.seconds,
+            'started_at': self.started_at.isoformat(),
+            'profiled_requests': self.profiled_requests,
+            'skipped_requests': self.skipped_requests
+        }
+
+
+_lock = threading.Lock()
+_session: Optional[ProfileSession] = None
+_last_result: Optional[Dict] = None
+_local = threading.local()
+
+
+def is_active() -> bool:
+    """Return True while a profiling session is running."""
+    return _session is not None
+
+
+def validate_limits(requests, seconds) -> Tuple[bool, Optional[str]]:
+    """
+    Validate the limits of a new session.
+
+    Args:
+        requests: Number of requests to profile, or None
+        seconds: Profiling duration in seconds, or None
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if (requests is None) == (seconds is None):
+        return False, "Exactly one of 'requests' or 'seconds' is required"
+
+    if requests is not None:
+        if not isinstance(requests, int) or isinstance(requests, bool) or not 1 <= requests <= MAX_REQUESTS:
+            return False, f"'requests' must be an integer between 1 and {MAX_REQUESTS}"
+    else:
+        if not isinstance(seconds, (int, float)) or isinstance(seconds, bool) or not 0 < seconds <= MAX_SECONDS:
+            return False, f"'seconds' must be a number between 0 and {MAX_SECONDS}"
+
+    return True, None
+
+
+def start(requests: Optional[int] = None, seconds: Optional[float] = None,
+          output_dir: str = 'profiles') -> Tuple[bool, Optional[Dict], Optional[str]]:
+    """
+    Start a profiling session.
+
+    Args:
+        requests: Profile this many requests, then stop
+        seconds: Profile requests for this many seconds, then stop
+        output_dir: Directory receiving the .pstats and summary files
+
+    Returns:
+        Tuple of (success, session_info, error_message)
+    """
+    global _session
+
+    is_valid, error = validate_limits(requests, seconds)
+    if not is_valid:
+        return False, None, error
+
+    with _lock:
+        if _session is not None:
+            return False, None, "A profiling session is already active"
+
+        session = ProfileSession(output_dir, requests=requests, seconds=seconds)
+        if seconds:
+            session.timer = threading.Timer(seconds, _finish, args=(session,))
+            session.timer.daemon = True
+            session.timer.start()
+        _session = session
+
+    return True, session.to_dict(), None
+
+
+def status() -> Dict:
+    """Return the active session (if any) and the result of the last one."""
+    session = _session
+    return {
+        'active': session.to_dict() if session else None,
+        'last_result': _last_result
+    }
+
+
+def begin_request():
+    """Start profiling the current request if the active session wants it."""
+    session = _session
+    if session is None:
+        return
+
+    if session.deadline is not None and time.monotonic() >= session.deadline:
+        _finish(session)
+        return
+
+    if not session.busy.acquire(blocking=False):
+        with _lock:
+            session.skipped_requests += 1
+        return
+
+    profile = cProfile.Profile()
+    _local.request = (session, profile)
+    profile.enable()
+
+
+def end_request():
+    """Stop profiling the current request (no-op if it was not profiled)."""
+    current = getattr(_local, 'request', None)
+    if current is None:
+        return
+
+    session, profile = current
+    profile.disable()
+    _local.request = None
+
+    with _lock:
+        if session.stats is None:
+            session.stats = pstats.Stats(profile)
+        else:
+            session.stats.add(profile)
+        session.profiled_requests += 1
+        done = session.max_requests is not None and session.profiled_requests >= session.max_requests
+    session.busy.release()
+
+    if done:
+        _finish(session)
+
+
+def _finish(session: ProfileSession):
+    """End the session (once) and write its results."""
+    global _session, _last_result
+
+    with _lock:
+        if _session is not session:
+            return
+        _session = None
+
+    if session.timer is not None:
+        session.timer.cancel()
+
+    # Wait for a request still being profiled
+    with session.busy:
+        _last_result = _write_results(session)
+
+
+def _write_results(session: ProfileSession) -> Dict:
+    """Write the .pstats file and text summary of a finished session."""
+    result = session.to_dict()
+    result['finished_at'] = datetime.utcnow().isoformat()
+    result['pstats'] = None
+    result['summary'] = None
+
+    if session.stats is None:
+        return result
+
+    os.makedirs(session.output_dir, exist_ok=True)
+    base = os.path.join(
+        session.output_dir, f"profile_{session.started_at:%Y%m%dT%H%M%S}_{os.getpid()}_{session.number}"
+    )
+    session.stats.dump_stats(base + '.pstats')
+    with open(base + '.txt', 'w', encoding='utf-8') as f:
+        f.write(render_summary(session.stats, result))
+
+    result['pstats'] = base + '.pstats'
+    result['summary'] = base + '.txt'
+    return result
+
+
+def render_summary(stats: pstats.Stats, info: Dict) -> str:
+    """
+    Render a flat text summary of a profile.
+
+    Lists the worker's own functions by own time, followed by the top
+    functions overall by cumulative time.
+    """
+    lines = [
+        f"Worker A profile: {info['profiled_requests']} request(s) profiled, "
+        f"{info['skipped_requests']} skipped",
+        f"Started {info['started_at']}, finished {info['finished_at']}",
+        '',
+        f"Hottest worker functions ({', '.join(SUMMARY_PATHS)}) by own time:",
+        f"{'ncalls':>10} {'tottime':>10} {'cumtime':>10}  function"
+    ]
+
+    own = []
+    for (filename, lineno, funcname), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        path = os.path.relpath(filename, SOURCE_ROOT) if filename.startswith(SOURCE_ROOT) else None
+        if path and path.startswith(SUMMARY_PATHS):
+            own.append((tottime, cumtime, ncalls, f"{path}:{lineno}({funcname})"))
+
+    for tottime, cumtime, ncalls, name in sorted(own, reverse=True)[:SUMMARY_LIMIT]:
+        lines.append(f"{ncalls:>10} {tottime:>10.6f} {cumtime:>10.6f}  {name}")
+
+    overall = io.StringIO()
+    stats.stream = overall
+    stats.sort_stats('cumulative').print_stats(OVERALL_LIMIT)
+    lines += ['', f"Top {OVERALL_LIMIT} functions overall by cumulative time:", overall.getvalue()]
+    return '\n'.join(lines)
@@ -0,0 +1,80 @@
+"""
+Startup timing for Worker A.
+
+Records how long each startup phase took (imports, service construction,
+storage warm-up), when the process became ready and when the first request
+arrived, all relative to the moment app.py started executing.
+
+Design decisions:
+- Warm-up runs in a background thread, so phases may finish after the
+  server already accepts requests (e.g. health checks)
+- The first-request check is a single attribute test once it is recorded
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class StartupTimer:
+    """
+    Durations of startup phases and time to readiness / first request.
+
+    This implementation provides:
+    - Named phases timed with a context manager
+    - Ready and first-request marks (first call wins)
+    - Thread-safe recording
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        """
+        Initialize the timer.
+
+        Args:
+            started: time.perf_counter() value of the process start;
+                defaults to now
+        """
+        self.started = started if started is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.ready_seconds: Optional[float] = None
+        self.first_request_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        """Record the duration of a phase."""
+        with self._lock:
+            self.phases[name] = seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def mark_ready(self):
+        """Record that startup work is complete."""
+        with self._lock:
+            if self.ready_seconds is None:
+                self.ready_seconds = time.perf_counter() - self.started
+
+    def mark_first_request(self):
+        """Record the arrival of the first request (later calls are ignored)."""
+        if self.first_request_seconds is not None:
+            return
+        with self._lock:
+            if self.first_request_seconds is None:
+                self.first_request_seconds = time.perf_counter() - self.started
+
+    def to_dict(self) -> Dict:
+        """Return the recorded phases and marks, in seconds."""
+        with self._lock:
+            return {
+                'phases': dict(self.phases),
+                'ready_seconds': self.ready_seconds,
+                'time_to_first_request_seconds': self.first_request_seconds,
+                'uptime_seconds': time.perf_counter() - self.started
+            }
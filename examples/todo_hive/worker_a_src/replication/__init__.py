@@ -0,0 +1,15 @@
+"""
+Read replicas for Worker A.
+
+This module lets read-only API processes (followers) serve reads next to
+the process that writes the storage files (the primary):
+- Tailing the primary's todo change log into an in-memory copy
+- Picking up tokens revoked on the primary
+- Measured replication lag and a staleness bound for readiness checks
+- Forwarding of write requests to the primary
+"""
+
+from .follower import ReplicationFollower
+from .forwarding import PrimaryForwarder
+
+__all__ = ['ReplicationFollower', 'PrimaryForwarder']
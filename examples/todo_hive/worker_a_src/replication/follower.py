@@ -0,0 +1,167 @@
+"""
+Follower loop of a Worker A read replica.
+
+A follower shares the primary's storage files (same directory or a shared
+filesystem) but never writes them. A background thread polls the todo
+change log and applies what the primary appended, so reads are served from
+memory without re-parsing the primary's files.
+
+Design decisions:
+- Polling instead of filesystem notifications: portable, and a poll that
+  finds nothing new costs one stat and one open of the change log
+- Lag is measured per applied change, from the time the primary wrote the
+  record ("ts") to the time it was applied here
+- Staleness is bounded by the time since the last poll that read the log
+  to its end: everything written before that poll started is visible, so
+  readiness checks can take a follower out of rotation when it falls behind
+- A poll can also be requested directly (after forwarding a write), so a
+  client reads its own write from the follower it wrote through
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from monitoring import metrics
+
+
+# Seconds between polls of the primary's change log
+DEFAULT_POLL_SECONDS = 0.1
+
+
+class ReplicationFollower:
+    """
+    Keeps a follower's todo service and revocation list in step with the primary.
+
+    This implementation provides:
+    - A background thread applying the primary's changes every poll interval
+    - On-demand polls (serialized with the background thread)
+    - Replication lag of applied changes (last, maximum, histogram in /metrics)
+    - Staleness (seconds since the follower was last caught up)
+    - Error counting: a failed poll is retried on the next interval
+    """
+
+    def __init__(self, todo_service, auth_service, poll_seconds: float = DEFAULT_POLL_SECONDS):
+        """
+        Initialize the follower (call start() once storage is loaded).
+
+        Args:
+            todo_service: TodoService created with follower=True
+            auth_service: AuthService whose revocation list follows the primary's
+            poll_seconds: Seconds between polls
+        """
+        self.todo_service = todo_service
+        self.auth_service = auth_service
+        self.poll_seconds = poll_seconds
+        self._poll_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.polls = 0
+        self.applied_changes = 0
+        self.reloads = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_lag_seconds: Optional[float] = None
+        self.max_lag_seconds: Optional[float] = None
+        # time.time() at the start of the last successful poll
+        self.caught_up_at: Optional[float] = None
+
+    def poll(self) -> int:
+        """
+        Apply the primary's latest changes now.
+
+        Returns:
+            Number of changes applied (0 if storage was reloaded or the poll failed)
+        """
+        with self._poll_lock:
+            started = time.time()
+            try:
+                changes = self.todo_service.follow_primary()
+                self.auth_service.refresh_revocations()
+            except Exception as e:
+                # Storage being replaced or damaged; the next poll retries
+                with self._lock:
+                    self.errors += 1
+                    self.last_error = f"{type(e).__name__}: {e}"
+                return 0
+
+            applied_at = time.time()
+            with self._lock:
+                self.polls += 1
+                self.caught_up_at = started
+                if changes is None:
+                    self.reloads += 1
+                    return 0
+
+                self.applied_changes += len(changes)
+                for change in changes:
+                    if change.written_at is None:
+                        continue
+                    lag = max(applied_at - change.written_at, 0.0)
+                    self.last_lag_seconds = lag
+                    if self.max_lag_seconds is None or lag > self.max_lag_seconds:
+                        self.max_lag_seconds = lag
+                    metrics.observe_replication_lag(lag)
+                return len(changes)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.poll_seconds)
+
+    def start(self):
+        """Start polling in a background thread (no-op if already started)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='replication-follower', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the follower was last caught up with the primary (None before the first poll)."""
+        with self._lock:
+            if self.caught_up_at is None:
+                return None
+            return max(time.time() - self.caught_up_at, 0.0)
+
+    def is_caught_up(self, max_staleness_seconds: float) -> bool:
+        """
+        Check whether the follower's copy is recent enough to serve reads.
+
+        Args:
+            max_staleness_seconds: Largest acceptable staleness
+
+        Returns:
+            True if the follower was caught up within that many seconds
+        """
+        staleness = self.staleness_seconds()
+        return staleness is not None and staleness <= max_staleness_seconds
+
+    def status(self) -> Dict:
+        """Return a snapshot of the replication counters."""
+        staleness = self.staleness_seconds()
+        lsn = self.todo_service.todo_storage.applied_lsn()
+        with self._lock:
+            return {
+                'lsn': lsn,
+                'poll_seconds': self.poll_seconds,
+                'polls': self.polls,
+                'applied_changes': self.applied_changes,
+                'reloads': self.reloads,
+                'errors': self.errors,
+                'last_error': self.last_error,
+                'last_lag_seconds': _rounded(self.last_lag_seconds),
+                'max_lag_seconds': _rounded(self.max_lag_seconds),
+                'staleness_seconds': _rounded(staleness)
+            }
+
+
+def _rounded(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds, 6) if seconds is not None else None
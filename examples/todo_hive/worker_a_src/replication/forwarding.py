@@ -0,0 +1,84 @@
+"""
+Forwarding of write requests from a Worker A follower to the primary.
+
+Only the primary writes the storage files, so a follower sends every
+write request on unchanged and returns the primary's answer. The primary
+authenticates and validates the request itself.
+
+Design decisions:
+- Standard library HTTP client only (urllib), like the load generator
+- The primary's status code, body and content type are passed through,
+  including error responses
+- A primary that cannot be reached yields 502, never a local write
+"""
+
+import urllib.error
+import urllib.request
+from typing import Mapping, Tuple
+
+
+# Seconds to wait for the primary's response
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+# Request headers sent on to the primary
+FORWARDED_HEADERS = ('Authorization', 'Content-Type', 'Accept')
+
+PRIMARY_UNAVAILABLE_BODY = b'{"error": "Primary is unavailable"}\n'
+
+
+class PrimaryForwarder:
+    """
+    Sends requests on to the primary and returns its responses.
+
+    This implementation provides:
+    - Method, path, query string, body and the relevant headers forwarded
+    - The original client address in X-Forwarded-For
+    - Status, body and content type of the primary's response (including errors)
+    - 502 if the primary does not answer within the timeout
+    """
+
+    def __init__(self, primary_url: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        Initialize the forwarder.
+
+        Args:
+            primary_url: Base URL of the primary, e.g. http://10.0.0.5:5000
+            timeout: Seconds to wait for the primary
+        """
+        self.primary_url = primary_url.rstrip('/')
+        self.timeout = timeout
+
+    def forward(self, method: str, path: str, query_string: bytes, headers: Mapping[str, str],
+                body: bytes, client_address: str = '') -> Tuple[int, bytes, str]:
+        """
+        Send one request to the primary.
+
+        Args:
+            method: HTTP method
+            path: Request path, e.g. /api/todos
+            query_string: Raw query string (without '?')
+            headers: Request headers of the client
+            body: Raw request body
+            client_address: Address of the client, for X-Forwarded-For
+
+        Returns:
+            Tuple of (status_code, body, content_type) of the primary's response
+        """
+        url = self.primary_url + path
+        if query_string:
+            url += '?' + query_string.decode('latin-1')
+
+        forwarded = {name: headers[name] for name in FORWARDED_HEADERS if headers.get(name)}
+        if client_address:
+            forwarded['X-Forwarded-For'] = client_address
+
+        outgoing = urllib.request.Request(url, data=body or None, headers=forwarded, method=method)
+        try:
+            with urllib.request.urlopen(outgoing, timeout=self.timeout) as response:
+                return response.status, response.read(), response.headers.get('Content-Type', '')
+        except urllib.error.HTTPError as e:
+            # Error responses of the primary are passed through as they are
+            with e:
+                return e.code, e.read(), e.headers.get('Content-Type', '')
+        except (urllib.error.URLError, OSError):
+            return 502, PRIMARY_UNAVAILABLE_BODY, 'application/json'
@@ -0,0 +1,31 @@
+"""
+Storage file helpers for Worker A.
+
+This module provides crash-safe building blocks for the file-based storages:
+- Checksummed JSON documents and change-log records
+- Atomic, fsync'ed file replacement keeping the previous good copy
+"""
+
+from .checksummed import (
+    StorageCorruptedError,
+    DocumentRead,
+    checksum,
+    encode_document,
+    encode_document_stream,
+    decode_document,
+    encode_record,
+    decode_record,
+    read_document,
+    document_checksum,
+    write_atomic,
+    keep_previous_copy,
+    fsync_directory,
+    PREVIOUS_SUFFIX,
+)
+
+__all__ = [
+    'StorageCorruptedError', 'DocumentRead', 'checksum', 'encode_document',
+    'encode_document_stream', 'decode_document', 'encode_record', 'decode_record',
+    'read_document', 'document_checksum', 'write_atomic',
+    'keep_previous_copy', 'fsync_directory', 'PREVIOUS_SUFFIX',
+]
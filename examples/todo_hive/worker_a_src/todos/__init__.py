@@ -4,11 +4,20 @@ Todo management module for Worker A.
 This module provides todo list management functionality:
 - Create todo items
 - List todo items
+- Full-text search over todo content
+- Incrementally maintained todo statistics
+- Time-range queries on creation time (sorted index)
+- Change events for Server-Sent-Events streams
 - JSON file persistence
 - Association with authenticated users
 """
 
 from .todo_storage import FileBasedTodoStorage
 from .todo_service import TodoService
+from .search_index import TodoSearchIndex
+from .todo_stats import TodoStats
+from .time_index import TodoTimeIndex
+from .event_hub import TodoEventHub
 
-__all__ = ['FileBasedTodoStorage', 'TodoService']
\ No newline at end of file
+__all__ = ['FileBasedTodoStorage', 'TodoService', 'TodoSearchIndex', 'TodoStats', 'TodoTimeIndex',
+           'TodoEventHub']
\ No newline at end of file
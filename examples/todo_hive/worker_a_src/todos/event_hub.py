@@ -0,0 +1,151 @@
+"""
+In-process fan-out of todo change events to Server-Sent-Events streams.
+
+TodoService publishes an event whenever a todo is created, updated or
+deleted; every open stream of the todo's owner receives it.
+
+Design decisions:
+- Events are serialized to an SSE frame once per publish, not per stream
+- Each stream has a bounded buffer; a stream that falls MAX_BUFFERED_EVENTS
+  behind is marked overflowed and closed with a "resync" event, so a slow
+  client cannot grow memory (it catches up through delta sync instead)
+- Streams per user are limited to MAX_STREAMS_PER_USER
+- Only streams of this process are reached; with several worker processes
+  clients still converge through delta sync on reconnect
+"""
+
+import itertools
+import json
+import threading
+from collections import deque
+from typing import Dict, Optional, Set
+
+
+# Events buffered per stream before it is closed as too slow
+MAX_BUFFERED_EVENTS = 100
+
+# Open streams allowed per user
+MAX_STREAMS_PER_USER = 10
+
+# Seconds without events after which a heartbeat comment is sent
+HEARTBEAT_SECONDS = 15
+
+# Frame telling a client it missed events and must resync
+RESYNC_FRAME = 'event: resync\ndata: {}\n\n'
+
+
+class Subscription:
+    """One open event stream with a bounded buffer of SSE frames."""
+
+    def __init__(self, user_id: str, max_events: int = MAX_BUFFERED_EVENTS):
+        self.user_id = user_id
+        self.max_events = max_events
+        self.overflowed = False
+        self.closed = False
+        self._frames = deque()
+        self._condition = threading.Condition()
+
+    def push(self, frame: str):
+        """Buffer a frame; on overflow, drop the buffer and mark the stream."""
+        with self._condition:
+            if self.closed or self.overflowed:
+                return
+            if len(self._frames) >= self.max_events:
+                self.overflowed = True
+                self._frames.clear()
+            else:
+                self._frames.append(frame)
+            self._condition.notify()
+
+    def next_frame(self, timeout: float) -> Optional[str]:
+        """
+        Wait for the next frame.
+
+        Returns:
+            The next frame, or None if the timeout passed, the stream
+            overflowed or it was closed
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._frames or self.overflowed or self.closed, timeout
+            )
+            if self._frames:
+                return self._frames.popleft()
+            return None
+
+    def close(self):
+        """Wake up and end the stream."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+
+
+class TodoEventHub:
+    """
+    Per-user fan-out hub for todo change events.
+
+    This implementation provides:
+    - Subscribe/unsubscribe of streams per user, with a per-user limit
+    - Publishing an event to all streams of a user
+    - Thread-safe access
+    """
+
+    def __init__(self, max_streams_per_user: int = MAX_STREAMS_PER_USER):
+        """
+        Initialize the hub.
+
+        Args:
+            max_streams_per_user: Open streams allowed per user
+        """
+        self.max_streams_per_user = max_streams_per_user
+        self._streams: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._event_ids = itertools.count(1)
+
+    def subscribe(self, user_id: str) -> Optional[Subscription]:
+        """
+        Open a stream for a user.
+
+        Returns:
+            The subscription, or None if the user has too many open streams
+        """
+        with self._lock:
+            streams = self._streams.setdefault(user_id, set())
+            if len(streams) >= self.max_streams_per_user:
+                return None
+            subscription = Subscription(user_id)
+            streams.add(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Close a stream and stop delivering events to it."""
+        subscription.close()
+        with self._lock:
+            streams = self._streams.get(subscription.user_id)
+            if streams is not None:
+                streams.discard(subscription)
+                if not streams:
+                    del self._streams[subscription.user_id]
+
+    def publish(self, user_id: str, event: str, data: Dict):
+        """
+        Send an event to all open streams of a user.
+
+        Args:
+            user_id: Owner of the changed todo
+            event: Event name (e.g. "todo_created")
+            data: JSON-serializable event payload
+        """
+        with self._lock:
+            streams = list(self._streams.get(user_id, ()))
+        if not streams:
+            return
+
+        frame = f"id: {next(self._event_ids)}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        for subscription in streams:
+            subscription.push(frame)
+
+    def connection_count(self) -> int:
+        """Number of open streams over all users."""
+        with self._lock:
+            return sum(len(streams) for streams in self._streams.values())
@@ -0,0 +1,226 @@
+"""
+Per-user inverted index for full-text search over todo content.
+
+Design decisions:
+- One index per user, so query cost depends only on that user's todos
+- Latin words and digits are tokenized as lowercase words; CJK ideographs
+  are indexed one character per token, so Chinese content is searchable
+  without a dictionary
+- Every query term matches as a prefix, using a sorted term list per user
+- Results must match all query terms; they are ranked by term frequency
+  weighted by inverse document frequency, with exact term matches
+  weighted above prefix matches, newest first on ties
+- Only todo ids, term postings and creation times are kept (no todo
+  contents), so the index does not hold a second copy of every todo next
+  to the storage; the caller resolves the returned ids to todos. Ids and
+  terms are interned, so they are shared with storage and the other indexes
+"""
+
+import bisect
+import math
+import re
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from .time_index import parse_timestamp
+
+
+# A single CJK ideograph, or a run of other word characters
+TOKEN_PATTERN = re.compile(
+    r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]|[^\W_\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+'
+)
+
+# Relative weight of a term that only matches a query term as a prefix
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _created_key(todo: Dict) -> int:
+    """Creation time used to order equally ranked results (-1 if unknown)."""
+    try:
+        return parse_timestamp(todo.get('created_at', ''))
+    except ValueError:
+        return -1
+
+
+class _UserIndex:
+    """Inverted index over the todos of one user."""
+
+    def __init__(self):
+        # term -> {todo_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        # All terms in sorted order, for prefix lookups
+        self.terms: List[str] = []
+        # todo_id -> (creation time in microseconds, *distinct terms of its content)
+        self.todos: Dict[str, Tuple] = {}
+
+    def add(self, todo: Dict):
+        todo_id = sys.intern(todo['id'])
+        if todo_id in self.todos:
+            return
+        # Interned, so the postings keys and every todo's terms share one string
+        terms = [sys.intern(term) for term in tokenize(todo.get('content', ''))]
+        self.todos[todo_id] = (_created_key(todo), *dict.fromkeys(terms))
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                bisect.insort(self.terms, term)
+            postings[todo_id] = postings.get(todo_id, 0) + 1
+
+    def remove(self, todo_id: str):
+        entry = self.todos.pop(todo_id, None)
+        if entry is None:
+            return
+        for term in entry[1:]:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(todo_id, None)
+            if not postings:
+                del self.postings[term]
+                del self.terms[bisect.bisect_left(self.terms, term)]
+
+    def matching_terms(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + '\U0010ffff')
+        return self.terms[start:end]
+
+
+class TodoSearchIndex:
+    """
+    Full-text search index over todo content, partitioned by user.
+
+    This implementation provides:
+    - Incremental updates as todos are created, updated and deleted
+    - Full rebuild from a list of todos (at startup)
+    - Ranked prefix search within one user's todos
+    - Thread-safe access
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._users: Dict[str, _UserIndex] = {}
+        self._lock = threading.Lock()
+        self.ready = False
+
+    def rebuild(self, load_todos: Callable[[], List[Dict]]):
+        """
+        Replace the index contents with the todos currently in storage.
+
+        Todos are loaded while holding the index lock, so a todo created
+        during the rebuild is either loaded or added afterwards, never lost.
+
+        Args:
+            load_todos: Callable returning all todo dictionaries from storage
+        """
+        with self._lock:
+            users: Dict[str, _UserIndex] = {}
+            for todo in load_todos():
+                user_index = users.get(todo['user_id'])
+                if user_index is None:
+                    user_index = users[todo['user_id']] = _UserIndex()
+                user_index.add(todo)
+
+            self._users = users
+            self.ready = True
+
+    def add(self, todo: Dict):
+        """
+        Index a newly created todo (no-op if it is already indexed).
+
+        Args:
+            todo: Todo dictionary with 'id', 'content' and 'user_id'
+        """
+        with self._lock:
+            user_index = self._users.get(todo['user_id'])
+            if user_index is None:
+                user_index = self._users[todo['user_id']] = _UserIndex()
+            user_index.add(todo)
+
+    def update(self, todo: Dict):
+        """
+        Re-index a todo whose content changed.
+
+        Args:
+            todo: Updated todo dictionary
+        """
+        with self._lock:
+            user_index = self._users.get(todo['user_id'])
+            if user_index is None:
+                user_index = self._users[todo['user_id']] = _UserIndex()
+            user_index.remove(todo['id'])
+            user_index.add(todo)
+
+    def remove(self, todo: Dict):
+        """
+        Remove a deleted todo from the index.
+
+        Args:
+            todo: Todo dictionary with 'id' and 'user_id'
+        """
+        with self._lock:
+            user_index = self._users.get(todo['user_id'])
+            if user_index is not None:
+                user_index.remove(todo['id'])
+
+    def search(self, user_id: str, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Search one user's todos.
+
+        Args:
+            user_id: User UUID whose todos are searched
+            query: Search text; every term matches as a prefix
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            IDs of the matching todos, best match first
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms:
+            return []
+
+        with self._lock:
+            user_index = self._users.get(user_id)
+            if user_index is None:
+                return []
+
+            total = len(user_index.todos)
+            scores: Optional[Dict[str, float]] = None
+
+            for query_term in query_terms:
+                term_scores: Dict[str, float] = {}
+                for term in user_index.matching_terms(query_term):
+                    postings = user_index.postings[term]
+                    weight = math.log(1 + total / len(postings))
+                    if term != query_term:
+                        weight *= PREFIX_MATCH_WEIGHT
+                    for todo_id, frequency in postings.items():
+                        score = frequency * weight
+                        if score > term_scores.get(todo_id, 0.0):
+                            term_scores[todo_id] = score
+
+                # Every query term must match
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        todo_id: score + term_scores[todo_id]
+                        for todo_id, score in scores.items()
+                        if todo_id in term_scores
+                    }
+                if not scores:
+                    return []
+
+            todos = user_index.todos
+            ranked = sorted(
+                scores,
+                key=lambda todo_id: (scores[todo_id], todos[todo_id][0]),
+                reverse=True
+            )
+
+        return ranked[:limit] if limit is not None else ranked
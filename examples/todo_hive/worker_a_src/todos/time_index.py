@@ -0,0 +1,185 @@
+"""
+Sorted created_at index of todos for Worker A.
+
+Answers "todos created between T1 and T2", for one user or over all users,
+with a binary search instead of a scan over every todo.
+
+Design decisions:
+- created_at is converted once to integer microseconds since the Unix
+  epoch (UTC) and kept next to the todo id, so range queries compare
+  integers instead of ISO strings
+- One sorted list of (timestamp, todo id) per user and one over all users;
+  ties are ordered by id, so every key is unique
+- New todos are inserted with bisect.insort; they are almost always the
+  newest, so the insert is close to an append
+- Ranges are read in batches, each batch starting with a binary search for
+  the last key returned, so a long scan never holds the lock for long or
+  copies the whole range at once
+- Updated on create and delete and rebuilt from storage at startup, like
+  the statistics; ids and owners are interned, so they are shared with
+  storage and the other indexes
+"""
+
+import sys
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Todos returned per locked read of the index
+RANGE_BATCH_SIZE = 500
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def parse_timestamp(value: str) -> int:
+    """
+    Convert an ISO 8601 timestamp to microseconds since the Unix epoch.
+
+    Timestamps without a UTC offset (like the stored created_at values)
+    are taken as UTC; a date alone means midnight UTC.
+
+    Args:
+        value: ISO 8601 date or date and time, e.g. '2024-05-01T12:00:00Z'
+
+    Returns:
+        Microseconds since 1970-01-01T00:00:00Z
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+class TodoTimeIndex:
+    """
+    Todo ids sorted by creation time, per user and global.
+
+    This implementation provides:
+    - Incremental updates as todos are created and deleted
+    - Full rebuild from a list of todos (at startup)
+    - Half-open [start, end) range queries, oldest first, streamed in batches
+    - Thread-safe access
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._users: Dict[str, List[Tuple[int, str]]] = {}
+        self._all: List[Tuple[int, str]] = []
+        # todo id -> (user_id, key) of every indexed todo
+        self._indexed: Dict[str, Tuple[str, Tuple[int, str]]] = {}
+        self._lock = threading.Lock()
+        self.ready = False
+
+    def _add(self, todo: Dict):
+        todo_id = sys.intern(todo['id'])
+        if todo_id in self._indexed:
+            return
+        try:
+            key = (parse_timestamp(todo.get('created_at', '')), todo_id)
+        except ValueError:
+            # Without a creation time the todo can never be in a range
+            return
+        user_id = sys.intern(todo['user_id'])
+        self._indexed[todo_id] = (user_id, key)
+        insort(self._users.setdefault(user_id, []), key)
+        insort(self._all, key)
+
+    @staticmethod
+    def _discard(entries: List[Tuple[int, str]], key: Tuple[int, str]):
+        position = bisect_left(entries, key)
+        if position < len(entries) and entries[position] == key:
+            del entries[position]
+
+    def rebuild(self, load_todos: Callable[[], List[Dict]]):
+        """
+        Replace the index with the todos currently in storage.
+
+        Todos are loaded while holding the lock, so a todo created during the
+        rebuild is either loaded or added afterwards, never lost.
+
+        Args:
+            load_todos: Callable returning all todo dictionaries from storage
+        """
+        with self._lock:
+            self._users = {}
+            self._all = []
+            self._indexed = {}
+            for todo in load_todos():
+                self._add(todo)
+            self.ready = True
+
+    def add(self, todo: Dict):
+        """
+        Index a newly created todo (no-op if it is already indexed).
+
+        Args:
+            todo: Todo dictionary with 'id', 'user_id' and 'created_at'
+        """
+        with self._lock:
+            self._add(todo)
+
+    def remove(self, todo: Dict):
+        """
+        Remove a deleted todo from the index.
+
+        Args:
+            todo: Todo dictionary with 'id'
+        """
+        with self._lock:
+            indexed = self._indexed.pop(todo['id'], None)
+            if indexed is None:
+                return
+            user_id, key = indexed
+            user_entries = self._users[user_id]
+            self._discard(user_entries, key)
+            if not user_entries:
+                del self._users[user_id]
+            self._discard(self._all, key)
+
+    def iter_range(self, start: Optional[int] = None, end: Optional[int] = None,
+                   user_id: Optional[str] = None,
+                   batch_size: int = RANGE_BATCH_SIZE) -> Iterator[str]:
+        """
+        Yield the ids of todos created in [start, end), oldest first.
+
+        The index is read in batches; todos created or deleted while the
+        caller consumes the ids are included or skipped according to where
+        they fall relative to the last id returned.
+
+        Args:
+            start: First included creation time in microseconds (None for no bound)
+            end: First excluded creation time in microseconds (None for no bound)
+            user_id: Only this user's todos (None for all users)
+            batch_size: Ids read per locked read of the index
+
+        Yields:
+            Todo ids
+        """
+        last_key = None
+        while True:
+            with self._lock:
+                entries = self._all if user_id is None else self._users.get(user_id, [])
+                if last_key is not None:
+                    position = bisect_right(entries, last_key)
+                elif start is not None:
+                    position = bisect_left(entries, (start, ''))
+                else:
+                    position = 0
+                batch = entries[position:position + batch_size]
+
+            complete = len(batch) < batch_size
+            if end is not None and batch and batch[-1][0] >= end:
+                batch = batch[:bisect_left(batch, (end, ''))]
+                complete = True
+
+            for _, todo_id in batch:
+                yield todo_id
+            if complete:
+                return
+            last_key = batch[-1]
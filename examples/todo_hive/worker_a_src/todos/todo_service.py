@@ -4,11 +4,48 @@ Todo service for Worker A.
 This service coordinates todo list management functionality:
 - Create todo items with validation
 - List todo items for authenticated users
+- Delta sync of a user's todos since a client-held version
+- Get, update and delete todo items owned by the user
+- Full-text search over a user's todos
+- Per-user and global todo statistics
+- Todos created in a time range, per user and (for admins) over all users
+- Change events for Server-Sent-Events streams
+- Follower mode: applying changes written by the primary process
 - Error handling
 """
 
-from typing import Tuple, Optional, Dict, List
-from .todo_storage import FileBasedTodoStorage
+from typing import Tuple, Optional, Dict, List, Iterator
+from .todo_storage import FileBasedTodoStorage, FollowedChange
+from .search_index import TodoSearchIndex
+from .todo_stats import TodoStats
+from .time_index import TodoTimeIndex, parse_timestamp
+from .event_hub import TodoEventHub
+from monitoring import metrics
+
+
+# Search result limits
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 200
+
+# Upper bound of the statistics window, in days
+MAX_STATS_DAYS = 3660
+
+# Returned for todos that do not exist or belong to another user
+TODO_NOT_FOUND_ERROR = "Todo not found"
+
+
+def _todo_response(todo: Dict) -> Dict:
+    """Public fields of a stored todo ('updated_at' only once updated)."""
+    response = {
+        'id': todo['id'],
+        'content': todo['content'],
+        'user_id': todo['user_id'],
+        'created_at': todo['created_at']
+    }
+    if 'updated_at' in todo:
+        response['updated_at'] = todo['updated_at']
+    return response
 
 
 class TodoService:
@@ -18,19 +55,107 @@ class TodoService:
     This implementation provides:
     - Create todo items with validation
     - List todo items for authenticated users
+    - Changes since a client-held version, so clients need not re-download
+      the whole list
+    - Get, update and delete single todo items, with ownership checks
+    - Ranked prefix search over a user's todos (per-user inverted index)
+    - Todo counts and created-per-day histograms from incrementally
+      maintained counters
+    - Time-range queries on created_at from a sorted index (binary search)
+    - Change events pushed to the owner's open event streams
+    - Follower mode: a read-only copy whose indexes and event streams
+      follow the changes the primary writes
     - Error handling for various scenarios
     - Integration with file-based todo storage
     """
 
-    def __init__(self, storage_file: str = "todos_a.json"):
+    def __init__(self, storage_file: str = "todos_a.json", cache_bytes: Optional[int] = None,
+                 follower: bool = False):
         """
         Initialize todo service.
 
         Args:
             storage_file: Path to todo storage file
+            cache_bytes: Byte budget of the storage's cache of users' todo
+                         lists (None keeps all todos in memory)
+            follower: Serve a read-only copy of storage written by another
+                      process, kept current with follow_primary()
+        """
+        self.todo_storage = FileBasedTodoStorage(storage_file, cache_bytes=cache_bytes, follower=follower)
+        self.search_index = TodoSearchIndex()
+        self.todo_stats = TodoStats()
+        self.time_index = TodoTimeIndex()
+        self.events = TodoEventHub()
+        # Storage load generation the search index, statistics and time index were built from
+        self._index_generation = None
+
+    def warm_up(self):
+        """Load todo storage and build the search index, statistics and time index from it."""
+        self.todo_storage.warm_up()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Rebuild the search index, statistics and time index from the todos currently in storage."""
+        self._index_generation = self.todo_storage.load_generation()
+        self.search_index.rebuild(self.todo_storage.get_all_todos)
+        self.todo_stats.rebuild(self.todo_storage.get_all_todos)
+        self.time_index.rebuild(self.todo_storage.get_all_todos)
+
+    def _ensure_indexes(self):
         """
-        self.todo_storage = FileBasedTodoStorage(storage_file)
+        Rebuild the search index, statistics and time index if they are not
+        built yet (warm_up() builds them at startup), or if storage reloaded
+        changes written by another process.
+        """
+        if (not (self.search_index.ready and self.todo_stats.ready and self.time_index.ready)
+                or self._index_generation != self.todo_storage.load_generation()):
+            self._rebuild_indexes()
+
+    def is_ready(self) -> bool:
+        """Return True once todo storage is loaded and the search index, statistics and time index are built."""
+        return (self.todo_storage.ready and self.search_index.ready
+                and self.todo_stats.ready and self.time_index.ready)
+
+    @metrics.timed('todo_service.follow_primary')
+    def follow_primary(self) -> Optional[List[FollowedChange]]:
+        """
+        Apply the changes the primary wrote since the last call (follower mode).
+
+        The search index, statistics and time index are updated and the
+        changes are published to open event streams, as if they had been
+        made by this process.
+
+        Returns:
+            The applied changes, or None if storage was reloaded from the
+            files (the indexes are then rebuilt)
+        """
+        changes = self.todo_storage.follow()
+        if changes is None:
+            self._ensure_indexes()
+            return None
+
+        for change in changes:
+            todo = change.todo
+            if change.op == 'create':
+                self.search_index.add(todo)
+                self.todo_stats.add(todo)
+                self.time_index.add(todo)
+                self.events.publish(todo['user_id'], 'todo_created', _todo_response(todo))
+            elif change.op == 'patch':
+                self.search_index.update(todo)
+                self.events.publish(todo['user_id'], 'todo_updated', _todo_response(todo))
+            else:
+                self.search_index.remove(todo)
+                self.todo_stats.remove(todo)
+                self.time_index.remove(todo)
+                self.events.publish(todo['user_id'], 'todo_deleted', {'id': todo['id']})
+        return changes
 
+    def storage_stats(self) -> Dict[str, Dict]:
+        """Return I/O counters of the storage files used by this service."""
+        return {'todos': self.todo_storage.stats.to_dict()}
+
+    @metrics.timed('todo_service.create_todo')
     def create_todo(self, content: str, user_id: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Create a new todo item for a user.
@@ -46,6 +171,9 @@ class TodoService:
             - error_message: Error message if failed, None if successful
         """
         # Validate input
+        if content is not None and not isinstance(content, str):
+            return False, None, "Todo content must be a string"
+
         if not content or not content.strip():
             return False, None, "Todo content cannot be empty"
 
@@ -61,22 +189,124 @@ class TodoService:
         if todo is None:
             return False, None, "Failed to create todo"
 
+        self.search_index.add(todo)
+        self.todo_stats.add(todo)
+        self.time_index.add(todo)
+
+        todo_data = _todo_response(todo)
+        self.events.publish(user_id, 'todo_created', todo_data)
+
         # Return todo data
-        todo_response = {
-            'id': todo['id'],
-            'content': todo['content'],
-            'user_id': todo['user_id'],
-            'created_at': todo['created_at']
-        }
+        return True, todo_data, None
+
+    @metrics.timed('todo_service.get_todo')
+    def get_todo(self, todo_id: str, user_id: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Get a single todo owned by the user.
+
+        Served from the storage's id index, so the cost does not depend on
+        the number of stored todos.
+
+        Args:
+            todo_id: Todo UUID to look up
+            user_id: User UUID of the requesting user
 
-        return True, todo_response, None
+        Returns:
+            Tuple of (success, todo_data, error_message)
+            - success: True if found, False otherwise
+            - todo_data: Todo dictionary if found, None otherwise
+            - error_message: Error message if failed (TODO_NOT_FOUND_ERROR if
+              the todo does not exist or belongs to another user)
+        """
+        if not user_id or not user_id.strip():
+            return False, None, "User ID is required"
 
-    def list_todos(self, user_id: str) -> Tuple[bool, Optional[List[Dict]], Optional[str]]:
+        todo = self.todo_storage.get_todo_by_id(todo_id)
+        if todo is None or todo.get('user_id') != user_id:
+            return False, None, TODO_NOT_FOUND_ERROR
+
+        return True, _todo_response(todo), None
+
+    @metrics.timed('todo_service.update_todo')
+    def update_todo(self, todo_id: str, user_id: str,
+                    content: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
-        List all todos for a specific user.
+        Update the content of a todo owned by the user.
+
+        Args:
+            todo_id: Todo UUID to update
+            user_id: User UUID of the requesting user
+            content: New todo content
+
+        Returns:
+            Tuple of (success, todo_data, error_message)
+            - success: True if update successful, False otherwise
+            - todo_data: Updated todo dictionary if successful, None otherwise
+            - error_message: Error message if failed (TODO_NOT_FOUND_ERROR if
+              the todo does not exist or belongs to another user)
+        """
+        if not user_id or not user_id.strip():
+            return False, None, "User ID is required"
+
+        is_valid, error = self.validate_content(content)
+        if not is_valid:
+            return False, None, error
+
+        todo = self.todo_storage.get_todo_by_id(todo_id)
+        if todo is None or todo.get('user_id') != user_id:
+            return False, None, TODO_NOT_FOUND_ERROR
+
+        todo = self.todo_storage.update_todo(todo_id, content.strip())
+        if todo is None:
+            return False, None, TODO_NOT_FOUND_ERROR
+
+        self.search_index.update(todo)
+
+        todo_data = _todo_response(todo)
+        self.events.publish(user_id, 'todo_updated', todo_data)
+
+        return True, todo_data, None
+
+    @metrics.timed('todo_service.delete_todo')
+    def delete_todo(self, todo_id: str, user_id: str) -> Tuple[bool, Optional[str]]:
+        """
+        Delete a todo owned by the user.
+
+        Args:
+            todo_id: Todo UUID to delete
+            user_id: User UUID of the requesting user
+
+        Returns:
+            Tuple of (success, error_message); the error is TODO_NOT_FOUND_ERROR
+            if the todo does not exist or belongs to another user
+        """
+        if not user_id or not user_id.strip():
+            return False, "User ID is required"
+
+        todo = self.todo_storage.get_todo_by_id(todo_id)
+        if todo is None or todo.get('user_id') != user_id:
+            return False, TODO_NOT_FOUND_ERROR
+
+        if not self.todo_storage.delete_todo(todo_id):
+            return False, TODO_NOT_FOUND_ERROR
+
+        self.search_index.remove(todo)
+        self.todo_stats.remove(todo)
+        self.time_index.remove(todo)
+        self.events.publish(user_id, 'todo_deleted', {'id': todo_id})
+
+        return True, None
+
+    @metrics.timed('todo_service.list_todos')
+    def list_todos(self, user_id: str, created_from: Optional[str] = None,
+                   created_to: Optional[str] = None) -> Tuple[bool, Optional[List[Dict]], Optional[str]]:
+        """
+        List all todos for a specific user, optionally only those created in a time range.
 
         Args:
             user_id: User UUID to filter todos
+            created_from: Only todos created at or after this ISO 8601 timestamp
+            created_to: Only todos created before this ISO 8601 timestamp
 
         Returns:
             Tuple of (success, todos_list, error_message)
@@ -87,21 +317,227 @@ class TodoService:
         if not user_id or not user_id.strip():
             return False, None, "User ID is required"
 
+        if created_from is not None or created_to is not None:
+            success, todos, error = self.iter_todos_created_between(created_from, created_to, user_id)
+            if not success:
+                return False, None, error
+            # Newest first, like the full list
+            return True, list(todos)[::-1], None
+
         # Get todos for user
         todos = self.todo_storage.get_todos_by_user_id(user_id)
 
         # Return todo data (without internal fields if any)
-        todos_response = [
-            {
-                'id': todo['id'],
-                'content': todo['content'],
-                'user_id': todo['user_id'],
-                'created_at': todo['created_at']
-            }
-            for todo in todos
-        ]
-
-        return True, todos_response, None
+        return True, [_todo_response(todo) for todo in todos], None
+
+    def parse_time_range(self, created_from: Optional[str], created_to: Optional[str]
+                         ) -> Tuple[bool, Optional[Tuple[Optional[int], Optional[int]]], Optional[str]]:
+        """
+        Validate and convert the bounds of a time-range query.
+
+        Args:
+            created_from: First included creation time (ISO 8601), or None
+            created_to: First excluded creation time (ISO 8601), or None
+
+        Returns:
+            Tuple of (is_valid, (start, end), error_message); start and end
+            are microseconds since the Unix epoch, or None where not given
+        """
+        bounds = []
+        for name, value in (('from', created_from), ('to', created_to)):
+            if value is None:
+                bounds.append(None)
+                continue
+            try:
+                bounds.append(parse_timestamp(value.strip()))
+            except ValueError:
+                return False, None, f"'{name}' must be an ISO 8601 timestamp"
+
+        start, end = bounds
+        if start is not None and end is not None and start > end:
+            return False, None, "'from' must not be after 'to'"
+        return True, (start, end), None
+
+    @metrics.timed('todo_service.iter_todos_created_between')
+    def iter_todos_created_between(self, created_from: Optional[str], created_to: Optional[str],
+                                   user_id: Optional[str] = None
+                                   ) -> Tuple[bool, Optional[Iterator[Dict]], Optional[str]]:
+        """
+        Get the todos created in a time range, oldest first.
+
+        Ids come from the sorted time index and todos are fetched as the
+        iterator is consumed, so a large range can be streamed without being
+        held in memory. Only validation happens before this returns.
+
+        Args:
+            created_from: Only todos created at or after this ISO 8601 timestamp (None for no bound)
+            created_to: Only todos created before this ISO 8601 timestamp (None for no bound)
+            user_id: Only this user's todos (None for all users, for admins)
+
+        Returns:
+            Tuple of (success, todos_iterator, error_message)
+        """
+        is_valid, bounds, error = self.parse_time_range(created_from, created_to)
+        if not is_valid:
+            return False, None, error
+
+        self._ensure_indexes()
+
+        start, end = bounds
+
+        def todos() -> Iterator[Dict]:
+            for todo_id in self.time_index.iter_range(start, end, user_id):
+                todo = self.todo_storage.get_todo_by_id(todo_id)
+                # Deleted since its id was read
+                if todo is not None:
+                    yield _todo_response(todo)
+
+        return True, todos(), None
+
+    @metrics.timed('todo_service.sync_todos')
+    def sync_todos(self, user_id: str,
+                   since: Optional[str] = None) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Get the changes to a user's todos since a client-held version.
+
+        Args:
+            user_id: User UUID
+            since: Version from the previous sync, or None for the full list
+
+        Returns:
+            Tuple of (success, changes, error_message)
+            - changes: Dictionary with 'version' (send as since next time),
+              'reset' (True if 'todos' is the full list replacing the client's
+              copy), 'todos' (created or updated todos) and 'deleted' (ids)
+        """
+        if not user_id or not user_id.strip():
+            return False, None, "User ID is required"
+
+        reset, todos, deleted_ids, version = self.todo_storage.get_changes_since(user_id, since)
+
+        return True, {
+            'version': version,
+            'reset': reset,
+            'todos': [_todo_response(todo) for todo in todos],
+            'deleted': deleted_ids
+        }, None
+
+    @metrics.timed('todo_service.search_todos')
+    def search_todos(self, user_id: str, query: str,
+                     limit: Optional[int] = None) -> Tuple[bool, Optional[List[Dict]], Optional[str]]:
+        """
+        Search a user's todos by content.
+
+        Every query term matches words starting with it; results contain all
+        query terms and are ranked best match first.
+
+        Args:
+            user_id: User UUID whose todos are searched
+            query: Search text
+            limit: Maximum number of results (default 20, at most 100)
+
+        Returns:
+            Tuple of (success, todos_list, error_message)
+            - success: True if successful, False otherwise
+            - todos_list: List of matching todo dictionaries if successful, None otherwise
+            - error_message: Error message if failed, None if successful
+        """
+        if not user_id or not user_id.strip():
+            return False, None, "User ID is required"
+
+        if not query or not query.strip():
+            return False, None, "Search query is required"
+
+        if len(query) > MAX_QUERY_LENGTH:
+            return False, None, f"Search query must be at most {MAX_QUERY_LENGTH} characters"
+
+        if limit is None:
+            limit = DEFAULT_SEARCH_LIMIT
+        if limit < 1 or limit > MAX_SEARCH_LIMIT:
+            return False, None, f"Limit must be between 1 and {MAX_SEARCH_LIMIT}"
+
+        self._ensure_indexes()
+
+        todo_ids = self.search_index.search(user_id, query, limit)
+
+        # A todo deleted since the search is left out
+        todos = []
+        for todo_id in todo_ids:
+            todo = self.todo_storage.get_todo_by_id(todo_id)
+            if todo is not None:
+                todos.append(_todo_response(todo))
+
+        return True, todos, None
+
+    def parse_days(self, days: Optional[str]) -> Tuple[bool, Optional[int], Optional[str]]:
+        """
+        Validate and convert the window of a statistics query.
+
+        Args:
+            days: Number of most recent days (decimal string), or None for all days
+
+        Returns:
+            Tuple of (is_valid, days, error_message); days is None where not given
+        """
+        if days is None:
+            return True, None, None
+        try:
+            parsed = int(days.strip())
+        except ValueError:
+            return False, None, "'days' must be an integer"
+        if not 1 <= parsed <= MAX_STATS_DAYS:
+            return False, None, f"Days must be between 1 and {MAX_STATS_DAYS}"
+        return True, parsed, None
+
+    @metrics.timed('todo_service.get_stats')
+    def get_stats(self, user_id: str,
+                  days: Optional[str] = None) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Get the todo count and created-per-day histogram of a user.
+
+        Served from counters, so the cost depends on the number of days with
+        todos, not on the number of todos.
+
+        Args:
+            user_id: User UUID
+            days: Only include the most recent N days in the histogram, as given in
+                  the query string (None for all)
+
+        Returns:
+            Tuple of (success, stats, error_message)
+            - stats: Dictionary with 'total' and 'created_per_day' if successful
+        """
+        if not user_id or not user_id.strip():
+            return False, None, "User ID is required"
+
+        is_valid, days, error = self.parse_days(days)
+        if not is_valid:
+            return False, None, error
+
+        self._ensure_indexes()
+
+        return True, self.todo_stats.user_stats(user_id, days), None
+
+    @metrics.timed('todo_service.get_global_stats')
+    def get_global_stats(self, days: Optional[str] = None) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Get todo statistics over all users (for admins).
+
+        Args:
+            days: Only include the most recent N days in the histogram, as given in
+                  the query string (None for all)
+
+        Returns:
+            Tuple of (success, stats, error_message)
+            - stats: Dictionary with 'total', 'users' and 'created_per_day' if successful
+        """
+        is_valid, days, error = self.parse_days(days)
+        if not is_valid:
+            return False, None, error
+
+        self._ensure_indexes()
+
+        return True, self.todo_stats.global_stats(days), None
 
     def validate_content(self, content: str) -> Tuple[bool, Optional[str]]:
         """
@@ -113,6 +549,9 @@ class TodoService:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        if content is not None and not isinstance(content, str):
+            return False, "Todo content must be a string"
+
         if not content or not content.strip():
             return False, "Todo content cannot be empty"
 
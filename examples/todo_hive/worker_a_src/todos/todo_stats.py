@@ -0,0 +1,177 @@
+"""
+Incrementally maintained todo statistics for Worker A.
+
+Keeps per-user and global todo counts plus created-per-day histograms, so
+statistics queries cost O(days) instead of a scan over every todo.
+
+Design decisions:
+- Days are UTC calendar days taken from the todo's created_at timestamp
+- Counters are updated on create and delete (updates change neither the
+  owner nor created_at) and rebuilt from storage at startup
+- Every counted todo id is remembered, so add/remove are idempotent and a
+  todo created during a rebuild is never counted twice; ids, owners and
+  days are interned, so they are shared with storage and the other indexes
+  instead of copied per rebuild
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _Counts:
+    """Todo count and created-per-day histogram of one user (or all users)."""
+
+    def __init__(self):
+        self.total = 0
+        # 'YYYY-MM-DD' -> number of todos created that day
+        self.per_day: Dict[str, int] = {}
+
+    def add(self, day: str):
+        self.total += 1
+        self.per_day[day] = self.per_day.get(day, 0) + 1
+
+    def remove(self, day: str):
+        self.total -= 1
+        remaining = self.per_day[day] - 1
+        if remaining:
+            self.per_day[day] = remaining
+        else:
+            del self.per_day[day]
+
+    def histogram(self, since: Optional[str]) -> List[Dict]:
+        return [
+            {'date': day, 'count': self.per_day[day]}
+            for day in sorted(self.per_day)
+            if since is None or day >= since
+        ]
+
+
+class TodoStats:
+    """
+    Todo counters and day-bucketed histograms, per user and global.
+
+    This implementation provides:
+    - Incremental updates as todos are created and deleted
+    - Full rebuild from a list of todos (at startup)
+    - Per-user and global statistics, optionally limited to recent days
+    - Thread-safe access
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._users: Dict[str, _Counts] = {}
+        self._global = _Counts()
+        # todo id -> (user_id, day) of every counted todo
+        self._counted: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self.ready = False
+
+    @staticmethod
+    def _day(todo: Dict) -> str:
+        """UTC calendar day a todo was created on."""
+        return sys.intern(todo.get('created_at', '')[:10])
+
+    def _add(self, todo: Dict):
+        todo_id = sys.intern(todo['id'])
+        if todo_id in self._counted:
+            return
+        user_id, day = sys.intern(todo['user_id']), self._day(todo)
+        self._counted[todo_id] = (user_id, day)
+        user_counts = self._users.get(user_id)
+        if user_counts is None:
+            user_counts = self._users[user_id] = _Counts()
+        user_counts.add(day)
+        self._global.add(day)
+
+    def rebuild(self, load_todos: Callable[[], List[Dict]]):
+        """
+        Replace the statistics with counts of the todos currently in storage.
+
+        Todos are loaded while holding the lock, so a todo created during the
+        rebuild is either loaded or added afterwards, never lost.
+
+        Args:
+            load_todos: Callable returning all todo dictionaries from storage
+        """
+        with self._lock:
+            self._users = {}
+            self._global = _Counts()
+            self._counted = {}
+            for todo in load_todos():
+                self._add(todo)
+            self.ready = True
+
+    def add(self, todo: Dict):
+        """
+        Count a newly created todo (no-op if it is already counted).
+
+        Args:
+            todo: Todo dictionary with 'id', 'user_id' and 'created_at'
+        """
+        with self._lock:
+            self._add(todo)
+
+    def remove(self, todo: Dict):
+        """
+        Stop counting a deleted todo.
+
+        Args:
+            todo: Todo dictionary with 'id'
+        """
+        with self._lock:
+            counted = self._counted.pop(todo['id'], None)
+            if counted is None:
+                return
+            user_id, day = counted
+            user_counts = self._users[user_id]
+            user_counts.remove(day)
+            if not user_counts.total:
+                del self._users[user_id]
+            self._global.remove(day)
+
+    @staticmethod
+    def _since(days: Optional[int]) -> Optional[str]:
+        """First day of a window of the most recent days (None for all)."""
+        if days is None:
+            return None
+        return (datetime.utcnow().date() - timedelta(days=days - 1)).isoformat()
+
+    def user_stats(self, user_id: str, days: Optional[int] = None) -> Dict:
+        """
+        Statistics of one user's todos.
+
+        Args:
+            user_id: User UUID
+            days: Only include the histogram of the most recent days (None for all)
+
+        Returns:
+            Dictionary with 'total' and 'created_per_day'
+            ([{'date': 'YYYY-MM-DD', 'count': n}], oldest first)
+        """
+        since = self._since(days)
+        with self._lock:
+            user_counts = self._users.get(user_id)
+            if user_counts is None:
+                return {'total': 0, 'created_per_day': []}
+            return {'total': user_counts.total, 'created_per_day': user_counts.histogram(since)}
+
+    def global_stats(self, days: Optional[int] = None) -> Dict:
+        """
+        Statistics of all todos.
+
+        Args:
+            days: Only include the histogram of the most recent days (None for all)
+
+        Returns:
+            Dictionary with 'total', 'users' (users with at least one todo)
+            and 'created_per_day'
+        """
+        since = self._since(days)
+        with self._lock:
+            return {
+                'total': self._global.total,
+                'users': len(self._users),
+                'created_per_day': self._global.histogram(since)
+            }
@@ -5,72 +5,1015 @@ This implementation provides:
 - JSON file format for data persistence
 - UUID as todo identifier
 - User association via user_id (UUID)
-- Create and list operations
+- Create, list, update and delete operations
+- Append-only change log with periodic compaction into the JSON file
+- Per-user change sequence for delta sync
+- Checksummed checkpoint and change records with crash recovery
+- Optional memory-bounded LRU cache of users' todo lists
+- Follower mode: a read-only copy kept current by tailing the change log
 """
 
 import json
 import os
+import re
+import sys
+import threading
+import time
 import uuid
-from typing import Optional, Dict, List
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Dict, List, NamedTuple, Tuple
 from datetime import datetime
+from monitoring import metrics
+from monitoring.storage_stats import StorageStats
+from storage import (
+    PREVIOUS_SUFFIX, StorageCorruptedError, checksum, decode_record, document_checksum,
+    encode_document, encode_document_stream, encode_record, fsync_directory,
+    keep_previous_copy, read_document, write_atomic,
+)
+
+
+# Suffix of the change log kept next to the storage file
+CHANGE_LOG_SUFFIX = '.changes'
+
+# Suffix of the per-user index of the storage file (cache mode)
+USER_INDEX_SUFFIX = '.users'
+
+# Compact once the change log holds this many records, or half as many
+# records as there are todos if that is more (keeps edits amortized O(1))
+MIN_COMPACT_CHANGES = 1000
+
+# Deletions remembered per user for delta sync; clients that synced before
+# the oldest forgotten deletion get a full resync
+MAX_TOMBSTONES_PER_USER = 1000
+
+# Start of a checkpoint written by this module: its lsn is the first key
+_CHECKPOINT_LSN = re.compile(rb'\{\s*"lsn":\s*(\d+)')
+
+
+class ReadOnlyStorageError(Exception):
+    """A write was attempted on a follower (read-only) storage."""
+
+
+class FollowedChange(NamedTuple):
+    """A change applied by FileBasedTodoStorage.follow."""
+    op: str                      # 'create', 'patch' or 'delete'
+    todo: Dict                   # Todo after the change; the deleted todo for 'delete'
+    lsn: int                     # Log sequence number of the change record
+    written_at: Optional[float]  # UNIX time the record was written (None for older records)
+
+
+def _todo_size(todo: Dict) -> int:
+    """Serialized size of a todo, counted against the cache budget."""
+    return len(json.dumps(todo, ensure_ascii=False).encode('utf-8'))
 
 
 class FileBasedTodoStorage:
     """
     File-based todo storage using JSON files with UUID identifiers.
-    
+
     This implementation provides:
     - Persistent todo data storage in JSON format
     - UUID-based todo identification
     - User association via user_id
-    - Create and list todo items
-    - No update or delete operations
+    - Create, list, update and delete todo items
+    - In-memory id index and per-user lists, loaded once and reloaded if
+      the files change
+    - Writes appended to a change log instead of rewriting the whole file
+    - Changes since a client-held version, per user (delta sync)
+    - Recovery from torn appends and damaged checkpoints at startup
+    - Cache mode: only recently used users' lists stay in memory, under a
+      byte budget with LRU eviction; other users are read from disk
+    - Follower mode: read-only, loaded once and then kept current by
+      reading only what the writing process appends to the change log
 
-    Storage format:
+    Storage format (the checkpoint):
     {
+        "lsn": 42,
         "todos": [
             {
                 "id": "uuid",
                 "content": "string",
                 "user_id": "uuid",
-                "created_at": "ISO 8601 string"
+                "created_at": "ISO 8601 string",
+                "updated_at": "ISO 8601 string (only after an update)"
             }
-        ]
+        ],
+        "checksum": "crc32:..."
     }
+
+    Change log format (<storage_file>.changes, one JSON record per line):
+    {"op": "create", "todo": {...}, "lsn": 43, "ts": 1714560000.123456, "checksum": "crc32:..."}
+    {"op": "patch", "id": "uuid", "content": "string", "updated_at": "ISO 8601 string", "lsn": 44, ...}
+    {"op": "delete", "id": "uuid", "lsn": 45, ...}
+    ("ts" is the UNIX time the record was written, for measuring replication lag)
+
+    The current state is the checkpoint with the change records after its
+    log sequence number (lsn) replayed on top; recovery time is bounded by
+    the compaction threshold, not by the length of the history.
+
+    Compaction writes a new checkpoint, keeps the old one as
+    <storage_file>.prev and moves the folded change log to
+    <storage_file>.changes.prev; each file is committed atomically, so a
+    crash at any point leaves a state that replays to the same todos. A
+    checkpoint failing its checksum is replaced by the previous one plus
+    both change logs. A torn or damaged tail of the change log is ignored
+    and cut off before the next append. Every append is fsync'ed before the
+    write returns, so an acknowledged change survives a power or OS failure.
+
+    In cache mode (cache_bytes set) compaction writes the checkpoint
+    grouped by user, one todo per line, plus <storage_file>.users with each
+    user's byte range, its checksum and todo ids. Only the todo ids and
+    owners are kept in memory for all todos; a user's list is read from its
+    range (plus that user's later change records) when first used, and the
+    least recently used lists are evicted once their serialized size
+    exceeds cache_bytes. Without a matching index (first start, restore,
+    recovery) everything is loaded once and the next compaction writes it.
+
+    In follower mode (follower=True) another process (the primary) owns
+    the files. Reads never reload them; follow() reads the records appended
+    to the change log since the last call and applies them. When the
+    primary compacts, the rest of the moved log is read from
+    <storage_file>.changes.prev, so a follower keeps up without re-reading
+    the checkpoint; only if it cannot continue (the log was rotated twice
+    between calls, truncated or damaged, or the checkpoint rewritten in
+    place, e.g. by a restore) is everything reloaded.
     """
 
-    def __init__(self, storage_file: str = "todos_a.json"):
+    def __init__(self, storage_file: str = "todos_a.json", cache_bytes: Optional[int] = None,
+                 follower: bool = False):
         """
         Initialize file-based todo storage.
 
         Args:
             storage_file: Path to the JSON file for storing todos
+            cache_bytes: Keep at most about this many bytes of users' todos
+                         in memory (serialized size); None keeps all
+            follower: Read-only copy of files written by another process,
+                      kept current with follow()
         """
         self.storage_file = storage_file
-        self._ensure_storage_file()
+        self.change_log_file = storage_file + CHANGE_LOG_SUFFIX
+        self.previous_change_log_file = self.change_log_file + PREVIOUS_SUFFIX
+        self.user_index_file = storage_file + USER_INDEX_SUFFIX
+        self.cache_bytes = cache_bytes
+        self.follower = follower
+        self.stats = StorageStats(storage_file)
+        if cache_bytes is not None:
+            self.stats.enable_cache(cache_bytes)
+        self.ready = False
+        self._lock = threading.RLock()
+        # todo id -> owner's user_id; None until loaded
+        self._owners: Optional[Dict[str, str]] = None
+        # user_id -> {todo id: todo}; in cache mode only resident users,
+        # least recently used first
+        self._user_todos: Dict[str, Dict[str, Dict]] = OrderedDict() if cache_bytes is not None else {}
+        # Cache mode: where each user's todos are on disk (offset, length and
+        # checksum in the checkpoint; offset and length of later change
+        # records), and the serialized size of each resident user's todos
+        self._user_ranges: Dict[str, Tuple[int, int, str]] = {}
+        self._user_log: Dict[str, List[Tuple[int, int]]] = {}
+        self._user_sizes: Dict[str, int] = {}
+        self._resident_bytes = 0
+        # Cache mode: the checkpoint has no matching per-user index, so all
+        # users stay resident until the next compaction writes one
+        self._index_stale = False
+        self._pending_changes = 0
+        self._file_signature = None
+        # Log sequence number of the last change record
+        self._lsn = 0
+        # Follower mode: inode of the change log being read (None if there
+        # was none) and the offset after its last applied record
+        self._tail: Tuple[Optional[int], int] = (None, 0)
+        # Follower in cache mode: the checkpoint and change log that were
+        # loaded, kept open so users read later come from the same files
+        # even after the primary replaced them
+        self._pinned: Dict[str, BinaryIO] = {}
+        # Recovery state of the last load: where the valid change log ends if
+        # its tail is damaged, and whether the checkpoint lags behind the
+        # previous change log (recovered from .prev, or compaction interrupted)
+        self._log_valid_bytes: Optional[int] = None
+        self._checkpoint_stale = False
+        self.recovery: Optional[Dict] = None
+        # Incremented whenever the todos are (re)loaded from the files
+        self._generation = 0
+        # Delta sync state, reset on every (re)load: a change sequence number,
+        # and per user the ids of changed and deleted todos in sequence order
+        self._instance = uuid.uuid4().hex[:8]
+        self._change_seq = 0
+        self._user_changes: Dict[str, Dict[str, int]] = {}
+        self._user_tombstones: Dict[str, Dict[str, int]] = {}
+        self._user_pruned_seq: Dict[str, int] = {}
+        if not follower:
+            self._ensure_storage_file()
 
     def _ensure_storage_file(self):
         """Ensure the storage file exists, create if not."""
         if not os.path.exists(self.storage_file):
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump({"todos": []}, f)
+            write_atomic(self.storage_file, encode_document({"lsn": 0, "todos": []}))
+
+    @metrics.timed('todo_storage.load')
+    def _load_todos(self) -> Tuple[Dict, str]:
+        """
+        Load the checkpoint from the storage file, or from its previous copy
+        if the storage file fails verification.
+
+        Returns:
+            Tuple of (data, source); source is 'current', 'previous' or 'missing'
+
+        Raises:
+            StorageCorruptedError: If neither copy passes verification
+        """
+        result = read_document(self.storage_file)
+        if result.data is None:
+            return {"lsn": 0, "todos": []}, result.source
+
+        data = result.data
+        # Ensure "todos" key exists
+        if "todos" not in data:
+            data["todos"] = []
+        self.stats.record_read(result.num_bytes, result.parse_seconds, len(data["todos"]))
+        return data, result.source
 
-    def _load_todos(self) -> Dict:
-        """Load todos from storage file."""
+    def _keep_previous_segment(self):
+        """Keep the checkpoint as .prev and move the change log to .changes.prev."""
+        keep_previous_copy(self.storage_file)
+        if os.path.exists(self.change_log_file):
+            os.replace(self.change_log_file, self.previous_change_log_file)
+
+    @metrics.timed('todo_storage.save')
+    def _save_todos(self, data: Dict, rotate: bool = True):
+        """
+        Save todos to storage file (atomically replaced and fsync'ed).
+
+        Args:
+            data: Checkpoint with "lsn" and "todos"
+            rotate: Keep the replaced checkpoint as .prev and move the change
+                    log it was folded from to .changes.prev (compaction)
+        """
+        start = time.perf_counter()
+        raw = encode_document(data)
+        serialize_seconds = time.perf_counter() - start
+        write_atomic(self.storage_file, raw, self._keep_previous_segment if rotate else None)
+        self.stats.record_write(len(raw), serialize_seconds, len(data.get("todos", [])))
+
+    @metrics.timed('todo_storage.save')
+    def _save_todos_by_user(self, rotate: bool = True):
+        """
+        Save todos to storage file grouped by user, and write its per-user
+        index (cache mode, hold _lock).
+
+        Users that are not resident are read from the old checkpoint one at
+        a time, so all todos are never in memory at once.
+
+        Args:
+            rotate: As for _save_todos
+        """
+        start = time.perf_counter()
+        users = {}
+
+        def chunks():
+            header = f'{{\n  "lsn": {self._lsn},\n  "todos": [\n'.encode('utf-8')
+            yield header
+            position = len(header)
+            user_ids = set(self._user_ranges) | set(self._user_log) | set(self._user_todos)
+            for user_id in sorted(user_ids, key=str):
+                todos = self._user_todos.get(user_id)
+                if todos is None:
+                    todos = self._read_user(user_id)
+                if not todos:
+                    continue
+                body = b',\n'.join(json.dumps(todo, ensure_ascii=False).encode('utf-8')
+                                   for todo in todos.values())
+                if users:
+                    yield b',\n'
+                    position += 2
+                users[user_id] = [position, len(body), checksum(body), list(todos)]
+                yield body
+                position += len(body)
+            yield b'\n  ]'
+
+        size = write_atomic(self.storage_file, encode_document_stream(chunks()),
+                            self._keep_previous_segment if rotate else None)
+        index = {
+            "lsn": self._lsn,
+            "checkpoint_checksum": document_checksum(self.storage_file, verify=False),
+            "users": users
+        }
+        write_atomic(self.user_index_file, encode_document(index))
+        self.stats.record_write(size, time.perf_counter() - start, len(self._owners))
+
+        self._user_ranges = {user_id: tuple(entry[:3]) for user_id, entry in users.items()}
+        self._user_log = {}
+        self._index_stale = False
+
+    def _load_user_index(self) -> Optional[Dict]:
+        """
+        Load the per-user index of the checkpoint (cache mode).
+
+        Returns:
+            The index, or None if it is missing or damaged, or does not
+            match the checkpoint on disk (or the checkpoint fails verification)
+        """
         try:
-            with open(self.storage_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure "todos" key exists
-                if "todos" not in data:
-                    data["todos"] = []
-                return data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {"todos": []}
-
-    def _save_todos(self, data: Dict):
-        """Save todos to storage file."""
-        with open(self.storage_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            result = read_document(self.user_index_file)
+        except StorageCorruptedError:
+            return None
+        index = result.data
+        if index is None:
+            return None
+        checkpoint_checksum = document_checksum(self.storage_file)
+        if checkpoint_checksum is None or index.get("checkpoint_checksum") != checkpoint_checksum:
+            return None
+        return index
+
+    @contextmanager
+    def _open_loaded(self, path: str) -> Iterator[BinaryIO]:
+        """Open a storage file for reading; the one pinned at load time if any (hold _lock)."""
+        pinned = self._pinned.get(path)
+        if pinned is not None:
+            yield pinned
+            return
+        with open(path, 'rb') as f:
+            yield f
+
+    def _pin_loaded_files(self, signature: Tuple) -> bool:
+        """
+        Keep the checkpoint and change log of a load open (follower in cache
+        mode; no-op otherwise).
+
+        Returns:
+            False if the files on disk are no longer those of the signature
+            (the load must be retried)
+        """
+        if not (self.follower and self.cache_bytes is not None):
+            return True
+        pinned = {}
+        for path, expected in zip((self.storage_file, self.change_log_file), signature):
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                f = None
+            if (f is None) != (expected is None) or (f is not None and os.fstat(f.fileno()).st_ino != expected[2]):
+                for opened in list(pinned.values()) + [f]:
+                    if opened is not None:
+                        opened.close()
+                return False
+            if f is not None:
+                pinned[path] = f
+        for f in self._pinned.values():
+            f.close()
+        self._pinned = pinned
+        return True
+
+    @metrics.timed('todo_storage.read_user')
+    def _read_user(self, user_id: str) -> Dict[str, Dict]:
+        """
+        Read one user's todos from disk (cache mode, hold _lock): the user's
+        range of the checkpoint with the user's later change records applied.
+
+        Raises:
+            StorageCorruptedError: If the range or a record fails verification
+        """
+        todos = {}
+        user_range = self._user_ranges.get(user_id)
+        if user_range is not None:
+            offset, length, expected = user_range
+            with self._open_loaded(self.storage_file) as f:
+                f.seek(offset)
+                raw = f.read(length)
+            if checksum(raw) != expected:
+                raise StorageCorruptedError(f"{self.storage_file}: todos of user {user_id} fail verification")
+            todos = {todo['id']: todo for todo in json.loads(b'[' + raw + b']')}
+
+        positions = self._user_log.get(user_id)
+        if positions:
+            with self._open_loaded(self.change_log_file) as f:
+                for offset, length in positions:
+                    f.seek(offset)
+                    try:
+                        record = decode_record(f.read(length))
+                    except ValueError as e:
+                        raise StorageCorruptedError(f"{self.change_log_file}: {e}") from e
+                    self._apply_change(todos, record)
+        return todos
+
+    def _resident_list(self, user_id: str) -> Optional[Dict[str, Dict]]:
+        """A user's todos if in memory, without counting a cache lookup (hold _lock)."""
+        if self.cache_bytes is None:
+            return self._user_todos.setdefault(user_id, {})
+        return self._user_todos.get(user_id)
+
+    def _user_list(self, user_id: str) -> Dict[str, Dict]:
+        """
+        A user's todos (id -> todo), to read or update in place (hold _lock).
+
+        In cache mode this is a cache lookup: a miss reads the user's todos
+        from disk and may evict the least recently used users.
+        """
+        if self.cache_bytes is None:
+            return self._user_todos.setdefault(user_id, {})
+
+        todos = self._user_todos.get(user_id)
+        self.stats.record_cache_lookup(todos is not None)
+        if todos is not None:
+            self._user_todos.move_to_end(user_id)
+            return todos
+
+        todos = self._read_user(user_id)
+        self._user_todos[user_id] = todos
+        self._user_sizes[user_id] = sum(_todo_size(todo) for todo in todos.values())
+        self._resident_bytes += self._user_sizes[user_id]
+        self._evict()
+        return todos
+
+    def _resize(self, user_id: str, delta: int):
+        """Account for a change of a resident user's todos (hold _lock)."""
+        if self.cache_bytes is None:
+            return
+        self._user_sizes[user_id] += delta
+        self._resident_bytes += delta
+        self._evict()
+
+    def _evict(self):
+        """
+        Evict least recently used users until the cache fits its budget
+        (hold _lock). The most recently used user always stays resident.
+        """
+        # Without an index, evicted users could not be read back
+        while (not self._index_stale and self._resident_bytes > self.cache_bytes
+               and len(self._user_todos) > 1):
+            user_id, _ = self._user_todos.popitem(last=False)
+            self._resident_bytes -= self._user_sizes.pop(user_id)
+            self.stats.record_cache_eviction()
+        self.stats.update_cache_size(self._resident_bytes, len(self._user_todos))
+
+    def _load_changes(self, path: str) -> Tuple[List[Dict], List[Tuple[int, int]], int, int]:
+        """
+        Load verified change records from a change log.
+
+        Reading stops at the first torn or damaged record (an interrupted
+        append); records after it cannot be trusted to be in order.
+
+        Returns:
+            Tuple of (records, (offset, length) of each record, valid_bytes, total_bytes)
+        """
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return [], [], 0, 0
+
+        start = time.perf_counter()
+        changes = []
+        positions = []
+        valid_bytes = 0
+        for line in raw.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            try:
+                changes.append(decode_record(line))
+            except ValueError:
+                break
+            positions.append((valid_bytes, len(line)))
+            valid_bytes += len(line)
+        self.stats.record_read(len(raw), time.perf_counter() - start, len(changes))
+        return changes, positions, valid_bytes, len(raw)
+
+    def _append_change(self, record: Dict) -> Tuple[int, int]:
+        """
+        Append one change record to the change log and fsync it.
+
+        Returns:
+            Tuple of (offset, length) of the record in the change log
+        """
+        if self._log_valid_bytes is not None:
+            self._truncate_change_log()
+
+        start = time.perf_counter()
+        raw = encode_record(record)
+        serialize_seconds = time.perf_counter() - start
+        with open(self.change_log_file, 'ab') as f:
+            offset = f.tell()
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if offset == 0:
+            # New change log: persist its directory entry as well
+            fsync_directory(os.path.dirname(os.path.abspath(self.change_log_file)))
+        self.stats.record_append(len(raw), serialize_seconds)
+        self._pending_changes += 1
+        return offset, len(raw)
+
+    def _truncate_change_log(self):
+        """Cut a damaged tail off the change log, so appends follow valid records."""
+        with open(self.change_log_file, 'r+b') as f:
+            f.truncate(self._log_valid_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_valid_bytes = None
+
+    @staticmethod
+    def _read_records(f, offset: int) -> Tuple[List[Tuple[Dict, Tuple[int, int]]], int, bool]:
+        """
+        Read the complete change records of an open change log from an offset.
+
+        A line still being written (no newline yet) is left for the next read.
+
+        Returns:
+            Tuple of (records with their (offset, length), offset after the
+            last complete record, damaged); damaged is True if a complete
+            line fails verification or the file is shorter than offset
+        """
+        size = os.fstat(f.fileno()).st_size
+        if size < offset:
+            return [], offset, True
+        f.seek(offset)
+        records = []
+        for line in f.read(size - offset).splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            try:
+                records.append((decode_record(line), (offset, len(line))))
+            except ValueError:
+                return records, offset, True
+            offset += len(line)
+        return records, offset, False
+
+    def _checkpoint_lsn(self) -> Optional[int]:
+        """Lsn of the checkpoint on disk, read from its first line (None if it has none)."""
+        try:
+            with open(self.storage_file, 'rb') as f:
+                match = _CHECKPOINT_LSN.match(f.read(64))
+        except FileNotFoundError:
+            return None
+        return int(match.group(1)) if match else None
+
+    def _read_new_changes(self) -> Optional[List[Tuple[Dict, Tuple[int, int]]]]:
+        """
+        Read the change records appended since the last read and move the
+        tail past them (follower mode, hold _lock).
+
+        If the primary compacted meanwhile, the rest of the moved log is read
+        from .changes.prev before the new log. Positions are only meaningful
+        for records of the current change log.
+
+        Returns:
+            List of (record, (offset, length) in the change log), or None if
+            reading cannot continue from the tail and the storage must be reloaded
+        """
+        inode, offset = self._tail
+        checkpoint = self._current_signature()[0]
+        records = []
+        try:
+            log = open(self.change_log_file, 'rb')
+        except FileNotFoundError:
+            log = None
+        try:
+            log_inode = os.fstat(log.fileno()).st_ino if log is not None else None
+            if log_inode == inode:
+                # The checkpoint only changes together with the log, except
+                # when it is rewritten in place (restore, recovery)
+                if checkpoint != self._file_signature[0]:
+                    return None
+                if log is not None:
+                    records, offset, damaged = self._read_records(log, offset)
+                    if damaged:
+                        return None
+                self._tail = (inode, offset)
+                return records
+
+            # The log was moved by a compaction (or created by the first write)
+            if self.cache_bytes is not None:
+                # Cached users are located by positions in the moved log
+                return None
+            lsn = self._lsn
+            if inode is not None:
+                try:
+                    with open(self.previous_change_log_file, 'rb') as previous:
+                        if os.fstat(previous.fileno()).st_ino != inode:
+                            return None
+                        records, offset, damaged = self._read_records(previous, offset)
+                except FileNotFoundError:
+                    return None
+                if damaged:
+                    return None
+                lsn = max([lsn] + [record.get('lsn', 0) for record, _ in records])
+            # The new checkpoint must be the one folded from exactly that log
+            while True:
+                checkpoint = self._current_signature()[0]
+                checkpoint_lsn = self._checkpoint_lsn()
+                # Not replaced while its lsn was read
+                if self._current_signature()[0] == checkpoint:
+                    break
+            if checkpoint_lsn is not None and checkpoint_lsn < lsn and inode is not None:
+                # Compaction has moved the log but not replaced the
+                # checkpoint yet: stay on the moved log until it has
+                self._tail = (inode, offset)
+                return records
+            if checkpoint_lsn != lsn:
+                return None
+            if log is None:
+                self._tail = (None, 0)
+            else:
+                new_records, offset, damaged = self._read_records(log, 0)
+                if damaged:
+                    return None
+                records.extend(new_records)
+                self._tail = (log_inode, offset)
+            return records
+        finally:
+            self._file_signature = (checkpoint,) + self._file_signature[1:]
+            if log is not None:
+                log.close()
+
+    def _current_signature(self) -> Tuple:
+        """Size, modification time and inode of the storage file and change log."""
+        signature = []
+        for path in (self.storage_file, self.change_log_file):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns, stat.st_ino))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _ensure_loaded(self):
+        """
+        Load the todos into memory, or reload them if the files changed.
+
+        In cache mode with an index matching the checkpoint only the todo
+        ids and owners are loaded; users' todos are read when first used.
+        In follower mode the files are only loaded once; follow() applies
+        later changes.
+        """
+        if self._owners is not None and self.follower:
+            return
+        signature = self._current_signature()
+        if self._owners is not None and signature == self._file_signature:
+            return
+
+        start = time.perf_counter()
+        use_index = self.cache_bytes is not None
+        while True:
+            index = self._load_user_index() if use_index else None
+            if index is None:
+                data, source = self._load_todos()
+            else:
+                data, source = index, 'current'
+            # Needed on top of the previous checkpoint, or if compaction was
+            # interrupted after moving the change log
+            previous_changes, _, _, _ = self._load_changes(self.previous_change_log_file)
+            changes, positions, valid_bytes, total_bytes = self._load_changes(self.change_log_file)
+            checkpoint_lsn = data.get("lsn", 0)
+            if index is not None and any(record.get('lsn', 0) > checkpoint_lsn for record in previous_changes):
+                # Compaction was interrupted: the index cannot locate those records
+                use_index = False
+                continue
+            # If another process compacted between the reads, the logs
+            # may no longer belong to the checkpoint that was read
+            current = self._current_signature()
+            if current[0] == signature[0] and self._pin_loaded_files(signature):
+                break
+            signature = current
+
+        owners = {}
+        user_todos = None
+        if index is not None:
+            for user_id, entry in index["users"].items():
+                for todo_id in entry[3]:
+                    # Interned: the indexes built from re-read todos share these ids
+                    owners[sys.intern(todo_id)] = user_id
+        else:
+            user_todos = {}
+            for todo in data["todos"]:
+                owners[todo['id']] = todo.get('user_id')
+                user_todos.setdefault(todo.get('user_id'), {})[todo['id']] = todo
+        checkpoint_records = len(owners)
+
+        # Replay only records after the checkpoint. Records without an lsn
+        # were written before sequence numbers and only belong on top of a
+        # checkpoint without one.
+        legacy_checkpoint = "lsn" not in data
+        lsn = checkpoint_lsn
+        checkpoint_stale = source == 'previous'
+        user_log = {}
+        replayed = 0
+        previous_records = len(previous_changes)
+        for position, record in enumerate(previous_changes + changes):
+            record_lsn = record.get('lsn')
+            if record_lsn is None:
+                if not legacy_checkpoint:
+                    continue
+            elif record_lsn <= checkpoint_lsn:
+                continue
+            else:
+                lsn = max(lsn, record_lsn)
+
+            op = record.get('op')
+            todo_id = record['todo']['id'] if op == 'create' else record.get('id')
+            if op == 'create':
+                owners[todo_id] = record['todo'].get('user_id')
+            if todo_id in owners:
+                user_id = owners.pop(todo_id) if op == 'delete' else owners[todo_id]
+                if user_todos is not None:
+                    self._apply_change(user_todos.setdefault(user_id, {}), record)
+                else:
+                    user_log.setdefault(user_id, []).append(positions[position - previous_records])
+            replayed += 1
+            if position < previous_records:
+                checkpoint_stale = True
+
+        self._owners = owners
+        self._user_log = user_log
+        self._user_sizes = {}
+        self._resident_bytes = 0
+        if index is not None:
+            self._user_todos = OrderedDict()
+            self._user_ranges = {user_id: tuple(entry[:3]) for user_id, entry in index["users"].items()}
+            self._index_stale = False
+        elif self.cache_bytes is not None:
+            self._user_todos = OrderedDict(user_todos)
+            self._user_ranges = {}
+            self._index_stale = True
+            for user_id, todos in self._user_todos.items():
+                self._user_sizes[user_id] = sum(_todo_size(todo) for todo in todos.values())
+            self._resident_bytes = sum(self._user_sizes.values())
+        else:
+            self._user_todos = user_todos
+        self._pending_changes = len(changes)
+        self._file_signature = signature
+        self._lsn = lsn
+        self._tail = (signature[1][2] if signature[1] is not None else None, valid_bytes)
+        self._log_valid_bytes = valid_bytes if valid_bytes < total_bytes else None
+        self._checkpoint_stale = checkpoint_stale
+        self.recovery = {
+            'checkpoint': source,
+            'checkpoint_lsn': checkpoint_lsn,
+            'checkpoint_records': checkpoint_records,
+            'replayed_records': replayed,
+            'discarded_bytes': total_bytes - valid_bytes,
+            'lsn': lsn,
+            'seconds': round(time.perf_counter() - start, 6)
+        }
+        if self.cache_bytes is not None:
+            self.recovery['user_index'] = index is not None
+            self._evict()
+        self.stats.record_recovery(self.recovery)
+        self._generation += 1
+        self._change_seq = 0
+        self._user_changes = {}
+        self._user_tombstones = {}
+        self._user_pruned_seq = {}
+        self._update_size()
+
+    @staticmethod
+    def _apply_change(todos: Dict[str, Dict], record: Dict):
+        """Apply one change record to an id -> todo mapping."""
+        op = record.get('op')
+        if op == 'create':
+            todo = record['todo']
+            todos[todo['id']] = todo
+        elif op == 'patch':
+            todo = todos.get(record['id'])
+            if todo is not None:
+                todos[record['id']] = {
+                    **todo, 'content': record['content'], 'updated_at': record['updated_at']
+                }
+        elif op == 'delete':
+            todos.pop(record['id'], None)
+
+    def _record_change(self, user_id: str, record: Dict):
+        """Persist a change of a user's todos that was applied in memory, compacting if due."""
+        self._lsn += 1
+        position = self._append_change({**record, 'lsn': self._lsn, 'ts': round(time.time(), 6)})
+        if self.cache_bytes is not None:
+            self._user_log.setdefault(user_id, []).append(position)
+        if (self._checkpoint_stale or self._index_stale
+                or self._pending_changes >= max(MIN_COMPACT_CHANGES, len(self._owners) // 2)):
+            self.compact()
+        else:
+            self._file_signature = self._current_signature()
+            self._update_size()
+
+    def _note_change(self, user_id: str, todo_id: str, deleted: bool = False):
+        """Record a created, updated or deleted todo in the user's change sequence."""
+        self._change_seq += 1
+        changes = self._user_changes.setdefault(user_id, {})
+        tombstones = self._user_tombstones.setdefault(user_id, {})
+        # Re-inserting keeps each mapping ordered by sequence number
+        changes.pop(todo_id, None)
+        tombstones.pop(todo_id, None)
+        if not deleted:
+            changes[todo_id] = self._change_seq
+            return
+
+        tombstones[todo_id] = self._change_seq
+        if len(tombstones) > MAX_TOMBSTONES_PER_USER:
+            oldest_id = next(iter(tombstones))
+            self._user_pruned_seq[user_id] = tombstones.pop(oldest_id)
+
+    def _check_writable(self):
+        """Refuse writes in follower mode; the primary owns the files."""
+        if self.follower:
+            raise ReadOnlyStorageError(f"{self.storage_file} is a read-only follower copy")
+
+    def _update_size(self):
+        """Report the current record count and on-disk size to the stats."""
+        size = sum(entry[0] for entry in self._current_signature() if entry is not None)
+        self.stats.update_size(len(self._owners), size)
+
+    def compact(self):
+        """
+        Fold the change log into the storage file and clear the log.
+
+        Runs automatically when the change log grows large; can also be
+        called explicitly (e.g. before backups).
+
+        If the checkpoint lags behind the previous change log (it was
+        recovered from its previous copy, or an earlier compaction was
+        interrupted), only the checkpoint is rewritten: the previous copy and
+        both change logs stay as they are, so they still replay to the same
+        state.
+
+        In cache mode the checkpoint is written grouped by user together
+        with its per-user index.
+        """
+        self._check_writable()
+        with self._lock:
+            self._ensure_loaded()
+            rotate = not self._checkpoint_stale
+            if self.cache_bytes is None:
+                todos = [todo for user_todos in self._user_todos.values() for todo in user_todos.values()]
+                self._save_todos({"lsn": self._lsn, "todos": todos}, rotate=rotate)
+            else:
+                self._save_todos_by_user(rotate=rotate)
+                self._evict()
+            if rotate:
+                self._pending_changes = 0
+                self._log_valid_bytes = None
+            self._checkpoint_stale = False
+            self._file_signature = self._current_signature()
+            self._update_size()
+
+    def recover(self) -> Dict:
+        """
+        Load the storage and repair what the load found damaged.
+
+        Called at startup by the process that writes the storage: a torn
+        change log tail is cut off and a checkpoint that lags behind the
+        previous change log (or, in cache mode, has no matching per-user
+        index) is rewritten.
+
+        Returns:
+            Recovery report (checkpoint source and lsn, records replayed,
+            bytes discarded, seconds taken)
+        """
+        self._check_writable()
+        with self._lock:
+            self._ensure_loaded()
+            recovery = self.recovery
+            if self._log_valid_bytes is not None:
+                self._truncate_change_log()
+            if self._checkpoint_stale or self._index_stale:
+                self.compact()
+            self._file_signature = self._current_signature()
+            return recovery
+
+    def restore(self, todos: List[Dict]):
+        """
+        Replace the stored todos (used when restoring a backup).
+
+        The change logs and the previous checkpoint are cleared first, so
+        they are never replayed on top of the restored storage file.
+
+        The restored checkpoint takes a new lsn, so followers that only see
+        the records written after it notice the gap and reload.
+
+        Args:
+            todos: Todo dictionaries to store
+        """
+        self._check_writable()
+        with self._lock:
+            for path in (self.storage_file + PREVIOUS_SUFFIX, self.previous_change_log_file):
+                if os.path.exists(path):
+                    os.unlink(path)
+            with open(self.change_log_file, 'wb'):
+                pass
+            self._lsn += 1
+            self._save_todos({"lsn": self._lsn, "todos": todos}, rotate=False)
+            self._owners = None
+            self._ensure_loaded()
+            if self._index_stale:
+                self.compact()
+
+    def load_generation(self) -> int:
+        """
+        Return a number that changes whenever the todos are reloaded from
+        the files (e.g. after another process wrote to them), so derived
+        in-memory indexes know when to rebuild.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._generation
+
+    def applied_lsn(self) -> int:
+        """Log sequence number of the last change loaded, written or followed."""
+        with self._lock:
+            return self._lsn
+
+    def warm_up(self):
+        """
+        Load (and if needed recover) the storage once and mark it as ready.
+
+        Called at startup so the first request does not pay for the initial
+        load, and so readiness checks can tell when storage is usable. A
+        follower only loads; repairs are left to the primary.
+        """
+        if self.follower:
+            with self._lock:
+                self._ensure_loaded()
+        else:
+            self.recover()
+        self.ready = True
+
+    @metrics.timed('todo_storage.follow')
+    def follow(self) -> Optional[List[FollowedChange]]:
+        """
+        Apply the change records the primary appended since the last call
+        (follower mode).
+
+        Only the new bytes of the change log are read. Records are applied
+        strictly in lsn order; a gap (e.g. after a restore) or a log that
+        cannot be continued reloads the storage from the files instead.
+
+        Returns:
+            The applied changes in log order, or None if the storage was
+            (re)loaded from the files, so derived indexes must be rebuilt
+        """
+        with self._lock:
+            if self._owners is not None:
+                records = self._read_new_changes()
+                changes = [] if records is not None else None
+                for record, position in records or ():
+                    lsn = record.get('lsn')
+                    if lsn is not None and lsn <= self._lsn:
+                        continue
+                    if lsn != self._lsn + 1:
+                        changes = None
+                        break
+                    change = self._apply_followed(record, position)
+                    self._lsn = lsn
+                    if change is not None:
+                        changes.append(change)
+                if changes is not None:
+                    self._update_size()
+                    return changes
+
+            self._owners = None
+            self._ensure_loaded()
+            return None
+
+    def _apply_followed(self, record: Dict, position: Tuple[int, int]) -> Optional[FollowedChange]:
+        """
+        Apply one change record read by follow() (hold _lock).
+
+        Returns:
+            The applied change, or None if it refers to an unknown todo
+        """
+        op = record.get('op')
+        todo_id = record['todo']['id'] if op == 'create' else record.get('id')
+        if op == 'create':
+            self._owners[todo_id] = record['todo'].get('user_id')
+        elif todo_id not in self._owners:
+            return None
+        user_id = self._owners[todo_id]
+
+        # In cache mode the record is located like one written here, and a
+        # user that is not resident is only read if the updated todo is needed
+        if self.cache_bytes is not None:
+            self._user_log.setdefault(user_id, []).append(position)
+        user_todos = self._resident_list(user_id)
+        if user_todos is None:
+            if op == 'create':
+                todo = record['todo']
+            elif op == 'patch':
+                todo = self._user_list(user_id)[todo_id]
+            else:
+                todo = {'id': todo_id, 'user_id': user_id}
+        else:
+            before = user_todos.get(todo_id)
+            self._apply_change(user_todos, record)
+            after = user_todos.get(todo_id)
+            if self.cache_bytes is not None:
+                self._resize(user_id, (_todo_size(after) if after is not None else 0)
+                             - (_todo_size(before) if before is not None else 0))
+            todo = after or before or {'id': todo_id, 'user_id': user_id}
+
+        if op == 'delete':
+            del self._owners[todo_id]
+        self._note_change(user_id, todo_id, deleted=op == 'delete')
+        return FollowedChange(op, todo, record['lsn'], record.get('ts'))
 
     def create_todo(self, content: str, user_id: str) -> Optional[Dict]:
         """
@@ -83,9 +1026,7 @@ class FileBasedTodoStorage:
         Returns:
             Todo dictionary if creation successful, None otherwise
         """
-        data = self._load_todos()
-        todos = data.get("todos", [])
-
+        self._check_writable()
         # Generate UUID for todo
         todo_id = str(uuid.uuid4())
 
@@ -97,12 +1038,75 @@ class FileBasedTodoStorage:
             'created_at': datetime.utcnow().isoformat()
         }
 
-        todos.append(todo)
-        data["todos"] = todos
-        self._save_todos(data)
+        with self._lock:
+            self._ensure_loaded()
+            self._owners[todo_id] = user_id
+            # In cache mode a user that is not resident is not read for this
+            user_todos = self._resident_list(user_id)
+            if user_todos is not None:
+                user_todos[todo_id] = todo
+                self._resize(user_id, _todo_size(todo))
+            self._note_change(user_id, todo_id)
+            self._record_change(user_id, {'op': 'create', 'todo': todo})
 
         return todo
 
+    def update_todo(self, todo_id: str, content: str) -> Optional[Dict]:
+        """
+        Update the content of a todo.
+
+        Args:
+            todo_id: Todo UUID to update
+            content: New todo content
+
+        Returns:
+            Updated todo dictionary if found, None otherwise
+        """
+        self._check_writable()
+        with self._lock:
+            self._ensure_loaded()
+            if todo_id not in self._owners:
+                return None
+
+            user_id = self._owners[todo_id]
+            user_todos = self._user_list(user_id)
+            todo = user_todos[todo_id]
+            updated_at = datetime.utcnow().isoformat()
+            updated = {**todo, 'content': content, 'updated_at': updated_at}
+            user_todos[todo_id] = updated
+            self._resize(user_id, _todo_size(updated) - _todo_size(todo))
+            self._note_change(user_id, todo_id)
+            self._record_change(user_id, {
+                'op': 'patch', 'id': todo_id, 'content': content, 'updated_at': updated_at
+            })
+
+        return updated
+
+    def delete_todo(self, todo_id: str) -> bool:
+        """
+        Delete a todo.
+
+        Args:
+            todo_id: Todo UUID to delete
+
+        Returns:
+            True if the todo existed and was deleted, False otherwise
+        """
+        self._check_writable()
+        with self._lock:
+            self._ensure_loaded()
+            if todo_id not in self._owners:
+                return False
+
+            user_id = self._owners.pop(todo_id)
+            user_todos = self._resident_list(user_id)
+            if user_todos is not None:
+                self._resize(user_id, -_todo_size(user_todos.pop(todo_id)))
+            self._note_change(user_id, todo_id, deleted=True)
+            self._record_change(user_id, {'op': 'delete', 'id': todo_id})
+
+        return True
+
     def get_todos_by_user_id(self, user_id: str) -> List[Dict]:
         """
         Get all todos for a specific user.
@@ -113,42 +1117,99 @@ class FileBasedTodoStorage:
         Returns:
             List of todo dictionaries for the user
         """
-        data = self._load_todos()
-        todos = data.get("todos", [])
-
-        # Filter todos by user_id
-        user_todos = [todo for todo in todos if todo.get('user_id') == user_id]
+        with self._lock:
+            self._ensure_loaded()
+            user_todos = list(self._user_list(user_id).values())
 
-        # Sort by created_at (newest first)
-        user_todos.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        with metrics.stage('todo_storage.filter_sort'):
+            # Sort by created_at (newest first)
+            user_todos.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
         return user_todos
 
+    def get_changes_since(self, user_id: str,
+                          version: Optional[str]) -> Tuple[bool, List[Dict], List[str], str]:
+        """
+        Get a user's todos created or updated, and ids deleted, after a version.
+
+        Versions are only comparable within one load of the files; a version
+        from before a restart or reload (or None, or one older than the
+        remembered deletions) yields a full resync instead.
+
+        Args:
+            user_id: User UUID
+            version: Version returned by an earlier call, or None
+
+        Returns:
+            Tuple of (reset, todos, deleted_ids, current_version)
+            - reset: True if todos is the user's full list (newest first)
+              and replaces the client's copy
+            - todos: Changed todos, most recently changed first (or the full list)
+            - deleted_ids: Ids of deleted todos (empty on reset)
+            - current_version: Version to send with the next call
+        """
+        with self._lock:
+            self._ensure_loaded()
+            prefix = f"{self._instance}-{self._generation}-"
+            current_version = f"{prefix}{self._change_seq}"
+
+            since = None
+            if version and version.startswith(prefix) and version[len(prefix):].isdigit():
+                since = int(version[len(prefix):])
+            if since is None or since > self._change_seq or since < self._user_pruned_seq.get(user_id, 0):
+                return True, self.get_todos_by_user_id(user_id), [], current_version
+
+            user_todos = self._user_list(user_id)
+            todos = []
+            for todo_id, seq in reversed(self._user_changes.get(user_id, {}).items()):
+                if seq <= since:
+                    break
+                todos.append(user_todos[todo_id])
+
+            deleted_ids = []
+            for todo_id, seq in reversed(self._user_tombstones.get(user_id, {}).items()):
+                if seq <= since:
+                    break
+                deleted_ids.append(todo_id)
+
+        return False, todos, deleted_ids, current_version
+
     def get_todo_by_id(self, todo_id: str) -> Optional[Dict]:
         """
         Get a todo by ID.
 
+        O(1) lookup in the in-memory id index; the files are only parsed
+        when they were never loaded or changed on disk (and in cache mode,
+        when the owner's todos are not resident).
+
         Args:
             todo_id: Todo UUID to look up
 
         Returns:
             Todo dictionary if found, None otherwise
         """
-        data = self._load_todos()
-        todos = data.get("todos", [])
-
-        for todo in todos:
-            if todo.get('id') == todo_id:
-                return todo
-
-        return None
+        with self._lock:
+            self._ensure_loaded()
+            if todo_id not in self._owners:
+                return None
+            return self._user_list(self._owners[todo_id]).get(todo_id)
 
     def get_all_todos(self) -> List[Dict]:
         """
-        Get all todos (for debugging purposes).
+        Get all todos (for debugging purposes, backups and index rebuilds).
+
+        In cache mode users that are not resident are read from disk
+        without being added to the cache.
 
         Returns:
             List of all todo dictionaries
         """
-        data = self._load_todos()
-        return data.get("todos", [])
\ No newline at end of file
+        with self._lock:
+            self._ensure_loaded()
+            todos = []
+            for user_id in dict.fromkeys(self._owners.values()):
+                user_todos = self._user_todos.get(user_id)
+                if user_todos is None:
+                    user_todos = self._read_user(user_id)
+                todos.extend(user_todos.values())
+            return todos
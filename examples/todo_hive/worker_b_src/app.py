@@ -1,19 +1,87 @@
 """
 HTTP API application for Worker B.
 
-This application provides user registration with JWT token generation.
+This application provides user registration with JWT token generation,
+and bulk registration of many accounts (admin provisioning).
 Uses Flask as the HTTP framework.
 """
 
-from flask import Flask, request, jsonify
+import time
+
+# Taken before the remaining imports, so startup timing includes them
+PROCESS_STARTED = time.perf_counter()
+
+import os
+import signal
+import threading
+from flask import Flask, Response, request, jsonify, g
 from functools import wraps
 from auth.auth_service import AuthService
+from monitoring import metrics, profiling, InFlightTracker, StartupTimer
 
 
 app = Flask(__name__)
 
-# Initialize authentication service
-auth_service = AuthService()
+# Usernames allowed to call admin endpoints (comma-separated environment variable)
+ADMIN_USERNAMES = {
+    name.strip()
+    for name in os.environ.get('WORKER_B_ADMIN_USERS', '').split(',')
+    if name.strip()
+}
+
+# Latency histograms are only recorded (and /metrics served) when enabled
+if os.environ.get('WORKER_B_METRICS') == '1':
+    metrics.enable()
+
+# /ready reports "not ready" while this many other requests are in flight
+MAX_IN_FLIGHT = int(os.environ.get('WORKER_B_MAX_IN_FLIGHT', '64'))
+
+# Where profiling sessions write their .pstats files and summaries
+PROFILE_DIR = os.environ.get('WORKER_B_PROFILE_DIR', 'profiles')
+
+# Requests profiled after SIGUSR1 (handler installed when WORKER_B_PROFILE_SIGNAL=1)
+PROFILE_SIGNAL_REQUESTS = int(os.environ.get('WORKER_B_PROFILE_REQUESTS', '100'))
+
+# Maximum number of tokens accepted by a single batch verification request
+MAX_VERIFY_BATCH_SIZE = 1000
+
+# Maximum number of accounts accepted by a single bulk registration request
+MAX_REGISTER_BATCH_SIZE = 500
+
+startup = StartupTimer(PROCESS_STARTED)
+startup.record('imports', time.perf_counter() - PROCESS_STARTED)
+
+# Initialize authentication service (cheap: storage is loaded by the warm-up below)
+with startup.phase('init_services'):
+    auth_service = AuthService()
+in_flight = InFlightTracker()
+
+
+def warm_up_services():
+    """Load storage before traffic arrives."""
+    with startup.phase('warm_up.auth'):
+        auth_service.warm_up()
+    startup.mark_ready()
+    app.logger.info('Worker B ready after %.3fs', startup.ready_seconds)
+
+
+# Warm up in the background while the server already answers health checks;
+# /ready returns 503 until it finishes, and earlier requests load on demand
+threading.Thread(target=warm_up_services, name='warm-up', daemon=True).start()
+
+
+def start_profiling_on_signal(signum, frame):
+    """Profile the next PROFILE_SIGNAL_REQUESTS requests (SIGUSR1 handler)."""
+    # Start from a thread: the handler may interrupt code holding profiling locks
+    threading.Thread(
+        target=profiling.start,
+        kwargs={'requests': PROFILE_SIGNAL_REQUESTS, 'output_dir': PROFILE_DIR},
+        daemon=True
+    ).start()
+
+
+if os.environ.get('WORKER_B_PROFILE_SIGNAL') == '1' and hasattr(signal, 'SIGUSR1'):
+    signal.signal(signal.SIGUSR1, start_profiling_on_signal)
 
 
 def require_auth(f):
@@ -22,29 +90,86 @@ def require_auth(f):
     def decorated_function(*args, **kwargs):
         token = None
 
-        # Check for token in Authorization header
-        auth_header = request.headers.get('Authorization')
-        if auth_header:
-            try:
-                token = auth_header.split(' ')[1]  # Format: "Bearer <token>"
-            except IndexError:
-                pass
+        with metrics.stage('require_auth'):
+            # Check for token in Authorization header
+            auth_header = request.headers.get('Authorization')
+            if auth_header:
+                try:
+                    token = auth_header.split(' ')[1]  # Format: "Bearer <token>"
+                except IndexError:
+                    pass
+
+            context = auth_service.authenticate(token) if token else None
 
         if not token:
             return jsonify({'error': 'Authentication required'}), 401
 
-        user_info = auth_service.verify_token(token)
-        if not user_info:
+        if context is None:
             return jsonify({'error': 'Invalid or expired token'}), 401
 
-        # Add user information to request context
-        request.current_user = user_info.get('username')
-        request.current_user_id = user_info.get('user_id')
+        # Verified identity for the rest of the request (decoded only once)
+        g.auth = context
         return f(*args, **kwargs)
 
     return decorated_function
 
 
+def require_admin(f):
+    """Decorator to require an authenticated admin user (use after require_auth)."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if g.auth.username not in ADMIN_USERNAMES:
+            return jsonify({'error': 'Admin privileges required'}), 403
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@app.before_request
+def count_in_flight_request():
+    """Count the request as in flight until its teardown."""
+    in_flight.start()
+    startup.mark_first_request()
+
+
+@app.teardown_request
+def release_in_flight_request(exc):
+    """Stop counting the request as in flight."""
+    in_flight.finish()
+
+
+@app.before_request
+def start_request_profile():
+    """Profile the request while a profiling session is active."""
+    if profiling.is_active():
+        profiling.begin_request()
+
+
+@app.teardown_request
+def stop_request_profile(exc):
+    """Stop profiling the request (if it was profiled)."""
+    profiling.end_request()
+
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started (only while metrics are enabled)."""
+    if metrics.is_enabled():
+        g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_latency(response):
+    """Record the request latency per method, route and status."""
+    started = g.get('request_started')
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe_request(
+            request.method, endpoint, response.status_code, time.perf_counter() - started
+        )
+    return response
+
+
 # Authentication endpoints
 
 @app.route('/api/register', methods=['POST'])
@@ -85,6 +210,81 @@ def register():
         return jsonify({'error': error or 'Registration failed'}), 400
 
 
+@app.route('/api/register/bulk', methods=['POST'])
+@require_auth
+@require_admin
+def register_bulk():
+    """
+    Register many users in one request (admin only, no tokens issued).
+
+    Passwords are hashed in parallel and all users are stored with a
+    single write. Accounts are registered independently: invalid or taken
+    usernames are reported per account.
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Request body:
+    {
+        "accounts": [
+            {"username": "string", "password": "string"}
+        ]
+    }
+
+    Response (201, one result per account, in request order):
+    {
+        "created": 1,
+        "results": [
+            {
+                "username": "string",
+                "user": {
+                    "id": "uuid",
+                    "username": "string",
+                    "created_at": "ISO 8601 string"
+                }
+            },
+            {
+                "username": "string",
+                "error": "Username already exists"
+            }
+        ]
+    }
+
+    Response (400, no account was created; same body plus "error"):
+    {
+        "error": "No accounts were created",
+        "created": 0,
+        "results": [...]
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    accounts = data.get('accounts')
+
+    if not isinstance(accounts, list) or not accounts:
+        return jsonify({'error': 'Accounts must be a non-empty array'}), 400
+
+    if len(accounts) > MAX_REGISTER_BATCH_SIZE:
+        return jsonify({
+            'error': f'At most {MAX_REGISTER_BATCH_SIZE} accounts can be registered per request'
+        }), 400
+
+    success, result, error = auth_service.register_bulk(accounts)
+
+    if success:
+        if not result['created']:
+            return jsonify({'error': 'No accounts were created', **result}), 400
+        return jsonify(result), 201
+    else:
+        return jsonify({'error': error or 'Bulk registration failed'}), 400
+
+
 @app.route('/api/login', methods=['POST'])
 def login():
     """
@@ -123,6 +323,157 @@ def login():
         return jsonify({'error': error or 'Login failed'}), 401
 
 
+@app.route('/api/logout', methods=['POST'])
+@require_auth
+def logout():
+    """
+    Log out by revoking the current token.
+
+    Requires: Bearer token in Authorization header
+
+    Response (200):
+    {
+        "message": "Logged out"
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    success, error = auth_service.logout(g.auth)
+
+    if success:
+        return jsonify({'message': 'Logged out'}), 200
+    else:
+        return jsonify({'error': error or 'Logout failed'}), 400
+
+
+@app.route('/api/admin/revoke', methods=['POST'])
+@require_auth
+@require_admin
+def admin_revoke():
+    """
+    Revoke another session's token (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Request body (one of):
+    {
+        "token": "jwt_token_string"
+    }
+    {
+        "jti": "token_id"
+    }
+
+    Response (200):
+    {
+        "message": "Token revoked"
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    success, error = auth_service.revoke_token(
+        token=data.get('token'),
+        token_id=data.get('jti')
+    )
+
+    if success:
+        return jsonify({'message': 'Token revoked'}), 200
+    else:
+        return jsonify({'error': error or 'Revocation failed'}), 400
+
+
+@app.route('/api/admin/profile', methods=['POST'])
+@require_auth
+@require_admin
+def admin_start_profile():
+    """
+    Profile the next N requests or all requests for T seconds (admin only).
+
+    The session switches itself off and writes a .pstats file plus a text
+    summary of the hottest worker functions to WORKER_B_PROFILE_DIR.
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Request body (one of):
+    {
+        "requests": 100
+    }
+    {
+        "seconds": 30
+    }
+
+    Response (202):
+    {
+        "profile": {
+            "requests": 100,
+            "seconds": null,
+            "started_at": "ISO 8601 string",
+            "profiled_requests": 0,
+            "skipped_requests": 0
+        }
+    }
+
+    Response (400 / 409):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    requests_limit = data.get('requests')
+    seconds_limit = data.get('seconds')
+
+    is_valid, error = profiling.validate_limits(requests_limit, seconds_limit)
+    if not is_valid:
+        return jsonify({'error': error}), 400
+
+    success, session, error = profiling.start(
+        requests=requests_limit, seconds=seconds_limit, output_dir=PROFILE_DIR
+    )
+
+    if success:
+        return jsonify({'profile': session}), 202
+    else:
+        return jsonify({'error': error or 'Profiling could not be started'}), 409
+
+
+@app.route('/api/admin/profile', methods=['GET'])
+@require_auth
+@require_admin
+def admin_profile_status():
+    """
+    Get the active profiling session and the result of the last one (admin only).
+
+    Requires: Bearer token of an admin user in Authorization header
+
+    Response (200):
+    {
+        "active": null,
+        "last_result": {
+            "requests": 100,
+            "seconds": null,
+            "started_at": "ISO 8601 string",
+            "finished_at": "ISO 8601 string",
+            "profiled_requests": 100,
+            "skipped_requests": 3,
+            "pstats": "profiles/profile_<timestamp>_<pid>.pstats",
+            "summary": "profiles/profile_<timestamp>_<pid>.txt"
+        }
+    }
+    """
+    return jsonify(profiling.status()), 200
+
+
 @app.route('/api/me', methods=['GET'])
 @require_auth
 def get_current_user():
@@ -140,9 +491,7 @@ def get_current_user():
         }
     }
     """
-    user = auth_service.get_user_by_token(
-        request.headers.get('Authorization', '').split(' ')[1]
-    )
+    user = g.auth.user
 
     if not user:
         return jsonify({'error': 'User not found'}), 404
@@ -201,23 +550,171 @@ def verify_token():
         }), 200
 
 
-# Health check endpoint
+@app.route('/api/verify-tokens', methods=['POST'])
+def verify_tokens():
+    """
+    Verify a batch of JWT tokens in one request.
+
+    Request body:
+    {
+        "tokens": ["jwt_token_string", ...]
+    }
+
+    Response (200, one result per token, in request order):
+    {
+        "results": [
+            {
+                "valid": true,
+                "user": {
+                    "user_id": "uuid",
+                    "username": "string"
+                }
+            },
+            {
+                "valid": false,
+                "error": "error message"
+            }
+        ]
+    }
+
+    Response (400):
+    {
+        "error": "error message"
+    }
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    tokens = data.get('tokens')
+
+    if not isinstance(tokens, list) or not tokens:
+        return jsonify({'error': 'Tokens must be a non-empty array'}), 400
+
+    if len(tokens) > MAX_VERIFY_BATCH_SIZE:
+        return jsonify({
+            'error': f'At most {MAX_VERIFY_BATCH_SIZE} tokens can be verified per request'
+        }), 400
+
+    results = []
+    for token, user_info in zip(tokens, auth_service.verify_tokens(tokens)):
+        if user_info:
+            results.append({'valid': True, 'user': user_info})
+        elif not token:
+            results.append({'valid': False, 'error': 'Token is required'})
+        else:
+            results.append({'valid': False, 'error': 'Invalid or expired token'})
+
+    return jsonify({'results': results}), 200
+
+
+# Health check endpoints
 
 @app.route('/health', methods=['GET'])
 def health():
     """
     Health check endpoint.
 
+    Query parameters:
+        verbose: "1" to include readiness, in-flight requests, startup
+                 timing and storage I/O counters
+
     Response (200):
     {
         "status": "healthy",
         "service": "Worker B Authentication API"
     }
+
+    Response (200, verbose=1):
+    {
+        "status": "healthy",
+        "service": "Worker B Authentication API",
+        "ready": true,
+        "in_flight_requests": 1,
+        "startup": {
+            "phases": {"imports": 0.21, "init_services": 0.002, "warm_up.auth": 0.01, ...},
+            "ready_seconds": 0.45,
+            "time_to_first_request_seconds": 0.3,
+            "uptime_seconds": 120.5
+        },
+        "storage": {
+            "users": {
+                "file": "users_b.json",
+                "file_reads": 42,
+                "file_writes": 1,
+                "bytes_read": 51234,
+                "bytes_written": 1220,
+                "parse_seconds": 0.0031,
+                "serialize_seconds": 0.0002,
+                "record_count": 10,
+                "file_size_bytes": 1220
+            }
+        }
+    }
     """
-    return jsonify({
+    response = {
         'status': 'healthy',
         'service': 'Worker B Authentication API'
-    }), 200
+    }
+
+    if request.args.get('verbose') == '1':
+        storage = auth_service.storage_stats()
+        response['ready'] = auth_service.is_ready()
+        response['in_flight_requests'] = in_flight.count
+        response['startup'] = startup.to_dict()
+        response['storage'] = storage
+
+    return jsonify(response), 200
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Readiness check endpoint.
+
+    Ready once storage has been loaded, and only while fewer than
+    WORKER_B_MAX_IN_FLIGHT other requests are in flight (default 64).
+
+    Response (200):
+    {
+        "ready": true
+    }
+
+    Response (503):
+    {
+        "ready": false,
+        "reason": "error message"
+    }
+    """
+    if not (auth_service.is_ready()):
+        return jsonify({'ready': False, 'reason': 'Storage is not loaded'}), 503
+
+    # Do not count this readiness request itself
+    if in_flight.count - 1 >= MAX_IN_FLIGHT:
+        return jsonify({'ready': False, 'reason': 'Too many requests in flight'}), 503
+
+    return jsonify({'ready': True}), 200
+
+
+# Metrics endpoint
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """
+    Latency histograms in the Prometheus text exposition format.
+
+    Enabled with the WORKER_B_METRICS=1 environment variable.
+
+    Response (200): text/plain; version=0.0.4
+
+    Response (404):
+    {
+        "error": "Metrics are disabled"
+    }
+    """
+    if not metrics.is_enabled():
+        return jsonify({'error': 'Metrics are disabled'}), 404
+
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 
 # Root endpoint
@@ -233,10 +730,18 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "register": "POST /api/register",
+            "register_bulk": "POST /api/register/bulk",
             "login": "POST /api/login",
+            "logout": "POST /api/logout",
             "me": "GET /api/me",
             "verify_token": "POST /api/verify-token",
-            "health": "GET /health"
+            "verify_tokens": "POST /api/verify-tokens",
+            "admin_revoke": "POST /api/admin/revoke",
+            "admin_profile": "POST /api/admin/profile",
+            "admin_profile_status": "GET /api/admin/profile",
+            "health": "GET /health",
+            "ready": "GET /ready",
+            "metrics": "GET /metrics"
         }
     }
     """
@@ -245,10 +750,18 @@ def root():
         'version': '1.0.0',
         'endpoints': {
             'register': 'POST /api/register',
+            'register_bulk': 'POST /api/register/bulk',
             'login': 'POST /api/login',
+            'logout': 'POST /api/logout',
             'me': 'GET /api/me',
             'verify_token': 'POST /api/verify-token',
-            'health': 'GET /health'
+            'verify_tokens': 'POST /api/verify-tokens',
+            'admin_revoke': 'POST /api/admin/revoke',
+            'admin_profile': 'POST /api/admin/profile',
+            'admin_profile_status': 'GET /api/admin/profile',
+            'health': 'GET /health',
+            'ready': 'GET /ready',
+            'metrics': 'GET /metrics'
         }
     }), 200
 
@@ -7,7 +7,18 @@ and JWT token management.
 
 from .user_storage import FileBasedUserStorage
 from .registration_service import RegistrationService
+from .token_revocation import TokenRevocationList
 from .token_manager import JWTTokenManager
+from .auth_context import AuthContext
 from .auth_service import AuthService
 
-__all__ = ['FileBasedUserStorage', 'RegistrationService', 'JWTTokenManager', 'AuthService']
+
+def __getattr__(name):
+    # HS256Verifier imports jwt; load it only when it is asked for
+    if name == 'HS256Verifier':
+        from .hs256_verifier import HS256Verifier
+        return HS256Verifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['FileBasedUserStorage', 'RegistrationService', 'HS256Verifier', 'TokenRevocationList', 'JWTTokenManager', 'AuthContext', 'AuthService']
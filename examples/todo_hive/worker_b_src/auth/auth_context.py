@@ -0,0 +1,61 @@
+"""
+Request-scoped authentication context for Worker B.
+
+The require_auth decorator verifies the bearer token once per request and
+stores an AuthContext; handlers and services read the caller's identity
+from it instead of decoding the token again.
+
+Design decisions:
+- Verified claims are kept as-is (user_id, username, jti, exp)
+- The user record is loaded lazily, at most once per request
+"""
+
+from typing import Optional, Dict, Callable, Any
+
+
+_NOT_LOADED = object()
+
+
+class AuthContext:
+    """
+    Identity of the caller of the current request.
+
+    This implementation provides:
+    - The raw token and its verified claims
+    - Convenience accessors for user ID and username
+    - A lazily loaded, memoized user record
+    """
+
+    __slots__ = ('token', 'claims', '_user_loader', '_user')
+
+    def __init__(self, token: str, claims: Dict[str, Any],
+                 user_loader: Callable[[str], Optional[Dict]]):
+        """
+        Initialize the context.
+
+        Args:
+            token: Verified JWT token string
+            claims: Verified token claims
+            user_loader: Function loading a user record by user ID
+        """
+        self.token = token
+        self.claims = claims
+        self._user_loader = user_loader
+        self._user = _NOT_LOADED
+
+    @property
+    def user_id(self) -> Optional[str]:
+        """User UUID from the token."""
+        return self.claims.get('user_id')
+
+    @property
+    def username(self) -> Optional[str]:
+        """Username from the token."""
+        return self.claims.get('username')
+
+    @property
+    def user(self) -> Optional[Dict]:
+        """User record, loaded on first access and memoized for the request."""
+        if self._user is _NOT_LOADED:
+            self._user = self._user_loader(self.user_id) if self.user_id else None
+        return self._user
@@ -4,9 +4,11 @@ Authentication service for Worker B.
 This service coordinates user registration and JWT token management.
 """
 
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List, Any
 from .user_storage import FileBasedUserStorage
 from .token_manager import JWTTokenManager
+from .auth_context import AuthContext
+from monitoring import metrics
 from .registration_service import RegistrationService
 
 
@@ -18,17 +20,21 @@ class AuthService:
     - User login (for completeness)
     """
 
-    def __init__(self, storage_file: str = "users_b.json"):
+    def __init__(self, storage_file: str = "users_b.json", revocation_file: str = "revoked_b.json"):
         """
         Initialize authentication service.
 
         Args:
             storage_file: Path to user storage file
+            revocation_file: Path to revoked token storage file
         """
+        # One storage instance (and in-memory user index) for login,
+        # verification and registration
         self.user_storage = FileBasedUserStorage(storage_file)
-        self.registration_service = RegistrationService(storage_file)
-        self.token_manager = JWTTokenManager()
+        self.registration_service = RegistrationService(user_storage=self.user_storage)
+        self.token_manager = JWTTokenManager(revocation_file=revocation_file)
 
+    @metrics.timed('auth_service.register')
     def register(self, username: str, password: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Register a new user and return JWT token.
@@ -63,6 +69,21 @@ class AuthService:
 
         return True, response_data, None
 
+    @metrics.timed('auth_service.register_bulk')
+    def register_bulk(self, accounts: Any) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Register many users at once (administrative provisioning, no tokens).
+
+        Args:
+            accounts: List of {"username": ..., "password": ...} dictionaries
+
+        Returns:
+            Tuple of (success, result, error_message); result holds 'created'
+            and per-account 'results' (see RegistrationService.register_bulk)
+        """
+        return self.registration_service.register_bulk(accounts)
+
+    @metrics.timed('auth_service.login')
     def login(self, username: str, password: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Login a user and generate a token.
@@ -109,6 +130,7 @@ class AuthService:
 
         return True, response_data, None
 
+    @metrics.timed('auth_service.verify_token')
     def verify_token(self, token: str) -> Optional[Dict[str, str]]:
         """
         Verify a token and return user information.
@@ -121,6 +143,76 @@ class AuthService:
         """
         return self.token_manager.verify_token(token)
 
+    @metrics.timed('auth_service.verify_tokens')
+    def verify_tokens(self, tokens: List[Any]) -> List[Optional[Dict[str, str]]]:
+        """
+        Verify a batch of tokens and return user information for each.
+
+        Args:
+            tokens: List of JWT tokens to verify
+
+        Returns:
+            List aligned with tokens; each entry is a dictionary with 'user_id'
+            and 'username' if that token is valid, None otherwise
+        """
+        return self.token_manager.verify_tokens(tokens)
+
+    @metrics.timed('auth_service.authenticate')
+    def authenticate(self, token: str) -> Optional[AuthContext]:
+        """
+        Verify a token once and build the request's authentication context.
+
+        Args:
+            token: JWT token to verify
+
+        Returns:
+            AuthContext if the token is valid, None otherwise
+        """
+        claims = self.token_manager.verify_claims(token)
+        if claims is None:
+            return None
+
+        return AuthContext(token, claims, self.user_storage.get_user_by_id)
+
+    def logout(self, context: AuthContext) -> Tuple[bool, Optional[str]]:
+        """
+        Log out by revoking the token of the given authentication context.
+
+        Args:
+            context: Authentication context of the session to end
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not self.token_manager.revoke_claims(context.claims):
+            return False, "Token cannot be revoked"
+
+        return True, None
+
+    def revoke_token(self, token: Optional[str] = None,
+                     token_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Revoke a token (administrative), given either the token or its ID.
+
+        Args:
+            token: JWT token to revoke
+            token_id: Token ID ('jti' claim) to revoke when the token is unknown
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if token:
+            revoked = self.token_manager.revoke_token(token)
+        elif token_id:
+            revoked = self.token_manager.revoke_token_id(token_id)
+        else:
+            return False, "Token or token ID is required"
+
+        if not revoked:
+            return False, "Token cannot be revoked"
+
+        return True, None
+
     def get_user_by_token(self, token: str) -> Optional[Dict]:
         """
         Get user information from token.
@@ -131,12 +223,22 @@ class AuthService:
         Returns:
             User dictionary if token is valid, None otherwise
         """
-        user_info = self.verify_token(token)
-        if not user_info:
+        context = self.authenticate(token)
+        if context is None:
             return None
 
-        user_id = user_info.get('user_id')
-        if user_id:
-            return self.user_storage.get_user_by_id(user_id)
+        return context.user
+
+    def warm_up(self):
+        """Load user storage so the first request does not pay for it."""
+        self.user_storage.warm_up()
 
-        return None
+    def is_ready(self) -> bool:
+        """Return True once user storage has been loaded."""
+        return self.user_storage.ready
+
+    def storage_stats(self) -> Dict[str, Dict]:
+        """Return I/O counters of the storage files used by this service."""
+        return {
+            'users': self.user_storage.stats.to_dict()
+        }
@@ -5,8 +5,18 @@ This service coordinates user registration functionality with proper
 error handling and validation.
 """
 
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List, Any
 from .user_storage import FileBasedUserStorage
+from monitoring import metrics
+
+
+def _user_response(user: Dict) -> Dict:
+    """User data without the password hash."""
+    return {
+        'id': user['id'],
+        'username': user['username'],
+        'created_at': user['created_at']
+    }
 
 
 class RegistrationService:
@@ -15,19 +25,40 @@ class RegistrationService:
 
     This implementation provides:
     - User registration with validation
+    - Bulk registration (one storage write for many accounts)
     - Error handling for various scenarios
     - Integration with file-based user storage
     """
 
-    def __init__(self, storage_file: str = "users_b.json"):
+    def __init__(self, storage_file: str = "users_b.json",
+                 user_storage: Optional[FileBasedUserStorage] = None):
         """
         Initialize registration service.
 
         Args:
             storage_file: Path to user storage file
+            user_storage: Existing storage instance to share (e.g. AuthService's);
+                          created from storage_file if omitted
+        """
+        self.user_storage = user_storage or FileBasedUserStorage(storage_file)
+
+    @staticmethod
+    def _validate_credentials(username: Any, password: Any) -> Tuple[bool, Optional[str]]:
+        """
+        Check that username and password are non-empty strings.
+
+        Returns:
+            Tuple of (is_valid, error_message)
         """
-        self.user_storage = FileBasedUserStorage(storage_file)
+        if not isinstance(username, str) or not username.strip():
+            return False, "Username cannot be empty"
+
+        if not isinstance(password, str) or not password.strip():
+            return False, "Password cannot be empty"
 
+        return True, None
+
+    @metrics.timed('registration_service.register')
     def register(self, username: str, password: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         Register a new user.
@@ -43,33 +74,70 @@ class RegistrationService:
             - error_message: Error message if failed, None if successful
         """
         # Validate input
-        if not username or not username.strip():
-            return False, None, "Username cannot be empty"
-
-        if not password or not password.strip():
-            return False, None, "Password cannot be empty"
+        is_valid, error = self._validate_credentials(username, password)
+        if not is_valid:
+            return False, None, error
 
         # Normalize username (strip whitespace)
         username = username.strip()
 
-        # Check if username already exists
-        if self.user_storage.username_exists(username):
-            return False, None, "Username already exists"
-
-        # Register user
+        # Register user (the existence check and insert are atomic in storage)
         user = self.user_storage.register_user(username, password)
 
         if user is None:
-            return False, None, "Registration failed"
+            return False, None, "Username already exists"
 
         # Return user data without password hash for security
-        user_response = {
-            'id': user['id'],
-            'username': user['username'],
-            'created_at': user['created_at']
-        }
+        return True, _user_response(user), None
 
-        return True, user_response, None
+    @metrics.timed('registration_service.register_bulk')
+    def register_bulk(self, accounts: Any) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Register many users at once.
+
+        Each account is validated and registered independently; a failing
+        account does not prevent the others from being created.
+
+        Args:
+            accounts: List of {"username": ..., "password": ...} dictionaries
+
+        Returns:
+            Tuple of (success, result, error_message)
+            - result: {"created": n, "results": [...]} with one entry per
+              account, in order: {"username", "user"} or {"username", "error"}
+        """
+        if not isinstance(accounts, list) or not accounts:
+            return False, None, "Accounts must be a non-empty list"
+
+        results: List[Dict] = []
+        valid = []  # (index in results, username, password)
+        for account in accounts:
+            if not isinstance(account, dict):
+                results.append({'username': None, 'error': "Account must be an object"})
+                continue
+
+            username = account.get('username')
+            password = account.get('password')
+            is_valid, error = self._validate_credentials(username, password)
+            if not is_valid:
+                results.append({'username': username, 'error': error})
+                continue
+
+            username = username.strip()
+            results.append({'username': username})
+            valid.append((len(results) - 1, username, password))
+
+        users = self.user_storage.register_users([(username, password) for _, username, password in valid])
+
+        created = 0
+        for (index, _, _), user in zip(valid, users):
+            if user is None:
+                results[index]['error'] = "Username already exists"
+            else:
+                results[index]['user'] = _user_response(user)
+                created += 1
+
+        return True, {'created': created, 'results': results}, None
 
     def validate_username(self, username: str) -> Tuple[bool, Optional[str]]:
         """
@@ -0,0 +1,251 @@
+"""
+Token revocation list for Worker B.
+
+JWT tokens are stateless, so logging out (or killing a compromised session)
+requires remembering revoked token IDs (the 'jti' claim) until the token
+would have expired anyway.
+
+Design decisions:
+- Exact set of revoked jti values with their expiration time
+- Bloom filter pre-check in front of the exact set, so the common case
+  (token not revoked) answers without touching the set
+- Checksummed JSON file persistence, atomically replaced like the user
+  and todo storage; a damaged file fails loudly instead of un-revoking
+  every token
+- Entries are purged once their token has expired
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+from storage import encode_document, keep_previous_copy, read_document, write_atomic
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set membership filter.
+
+    This implementation provides:
+    - No false negatives: every added key is reported as possibly present
+    - A bounded false positive rate for the configured capacity
+    - Bits stored in a single bytearray
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        """
+        Initialize an empty Bloom filter.
+
+        Args:
+            capacity: Expected number of keys
+            false_positive_rate: Target false positive rate at capacity
+        """
+        self.capacity = max(capacity, 1)
+        num_bits = int(-self.capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _hashes(self, key: str):
+        """Return the two base hashes used for double hashing."""
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return h & 0xFFFFFFFF, (h >> 32) | 1
+
+    def add(self, key: str):
+        """Add a key to the filter."""
+        h1, h2 = self._hashes(key)
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % self.num_bits
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Check whether a key may have been added.
+
+        Args:
+            key: Key to check
+
+        Returns:
+            False if the key was definitely never added, True otherwise
+        """
+        h1, h2 = self._hashes(key)
+        bits = self._bits
+        num_bits = self.num_bits
+        position = h1 % num_bits
+        for _ in range(self.num_hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + h2) % num_bits
+        return True
+
+
+class TokenRevocationList:
+    """
+    Persistent list of revoked token IDs with automatic expiry.
+
+    Storage format:
+    {
+        "revoked": [
+            {
+                "jti": "string",
+                "exp": 1700000000
+            }
+        ],
+        "checksum": "crc32:..."
+    }
+
+    Saved like the user storage: fsync'ed, atomically replaced, with the
+    replaced version kept as <storage_file>.prev.
+    """
+
+    # Initial Bloom filter capacity; the filter is rebuilt larger when exceeded
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, storage_file: str = "revoked_b.json"):
+        """
+        Initialize the revocation list and load persisted entries.
+
+        Args:
+            storage_file: Path to the JSON file for storing revoked tokens
+        """
+        self.storage_file = storage_file
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, int] = {}
+        self._next_expiry: Optional[int] = None
+        self._bloom = BloomFilter(self.INITIAL_CAPACITY)
+        # Where the last load came from ('current', 'previous' or 'missing')
+        self._load_source = 'missing'
+
+        with self._lock:
+            self._revoked = self._load_revoked()
+            self._purge_expired(int(time.time()))
+
+    def _load_revoked(self) -> Dict[str, int]:
+        """
+        Load revoked entries from storage file, or from its previous copy if
+        the storage file fails verification.
+
+        Raises:
+            StorageCorruptedError: If neither copy passes verification
+        """
+        result = read_document(self.storage_file)
+        self._load_source = result.source
+        data = result.data
+        if data is None:
+            return {}
+
+        return {
+            entry['jti']: int(entry['exp'])
+            for entry in data.get("revoked", [])
+            if entry.get('jti') and entry.get('exp') is not None
+        }
+
+    def _save_revoked(self):
+        """Save revoked entries to storage file (atomically replaced and fsync'ed)."""
+        data = {
+            "revoked": [
+                {'jti': jti, 'exp': exp} for jti, exp in self._revoked.items()
+            ]
+        }
+        # A file that failed verification must not become the previous copy
+        keep_previous = self._load_source == 'current'
+        write_atomic(
+            self.storage_file, encode_document(data),
+            (lambda: keep_previous_copy(self.storage_file)) if keep_previous else None
+        )
+        self._load_source = 'current'
+
+    def _rebuild_bloom(self):
+        """Rebuild the Bloom filter from the exact set (filters cannot delete)."""
+        capacity = self.INITIAL_CAPACITY
+        while capacity < 2 * len(self._revoked):
+            capacity *= 2
+
+        bloom = BloomFilter(capacity)
+        for jti in self._revoked:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def _purge_expired(self, now: int) -> bool:
+        """
+        Drop entries whose token has expired. Caller must hold the lock.
+
+        Returns:
+            True if any entry was removed
+        """
+        expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+        for jti in expired:
+            del self._revoked[jti]
+
+        self._next_expiry = min(self._revoked.values()) if self._revoked else None
+        self._rebuild_bloom()
+        return bool(expired)
+
+    def revoke(self, jti: str, exp: int) -> bool:
+        """
+        Revoke a token until its expiration time.
+
+        Args:
+            jti: Token ID ('jti' claim)
+            exp: Token expiration as a UNIX timestamp ('exp' claim)
+
+        Returns:
+            True if the token was revoked, False if it has already expired
+        """
+        now = int(time.time())
+        if exp <= now:
+            return False
+
+        with self._lock:
+            if self._next_expiry is not None and self._next_expiry <= now:
+                self._purge_expired(now)
+
+            self._revoked[jti] = exp
+            if self._next_expiry is None or exp < self._next_expiry:
+                self._next_expiry = exp
+
+            # Keep the false positive rate bounded as the list grows
+            if len(self._revoked) > self._bloom.capacity:
+                self._rebuild_bloom()
+            else:
+                self._bloom.add(jti)
+
+            self._save_revoked()
+
+        return True
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """
+        Check whether a token ID has been revoked.
+
+        Args:
+            jti: Token ID ('jti' claim)
+
+        Returns:
+            True if the token is revoked, False otherwise
+        """
+        if not self._revoked or not jti:
+            return False
+
+        if not self._bloom.might_contain(jti):
+            return False
+
+        # Bloom filter hit (revoked, or a false positive): consult the exact set
+        exp = self._revoked.get(jti)
+        return exp is not None and exp > time.time()
+
+    def purge_expired(self) -> int:
+        """
+        Remove entries for tokens that have expired.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            before = len(self._revoked)
+            if self._purge_expired(int(time.time())):
+                self._save_revoked()
+            return before - len(self._revoked)
+
+    def __len__(self) -> int:
+        return len(self._revoked)
@@ -8,13 +8,30 @@ Design decisions:
 - UUID as user identifier
 - bcrypt for password hashing
 - Simple file-based storage without external dependencies (except bcrypt for security)
+- Users are cached in memory with username and id indexes, and reloaded when
+  the file changes on disk (e.g. written by another process or a restore)
+- Registration reserves the username under a lock (atomic check-and-insert);
+  bcrypt hashing runs outside the lock, so registrations do not serialize
+- Bulk registration hashes passwords on a thread pool (bcrypt releases the
+  GIL, so hashing uses all cores) and stores all users in one write
+- The file is checksummed and durably replaced, keeping the previous
+  version; a damaged file is never read as empty
 """
 
-import json
 import os
+import threading
+import time
 import uuid
-from typing import Optional, Dict
-import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, Dict, List, Set, Tuple
+from monitoring import metrics
+from monitoring.storage_stats import StorageStats
+from storage import encode_document, keep_previous_copy, read_document, write_atomic
+
+
+# Threads hashing passwords during bulk registration
+HASH_WORKERS = os.cpu_count() or 1
 
 
 class FileBasedUserStorage:
@@ -27,6 +44,8 @@ class FileBasedUserStorage:
     - Password hashing using bcrypt
     - Read/write user information
     - User existence checking
+    - In-memory username/id indexes and atomic username reservation
+    - Bulk registration with parallel password hashing
 
     Storage format:
     {
@@ -37,8 +56,13 @@ class FileBasedUserStorage:
                 "password_hash": "string",
                 "created_at": "ISO 8601 string"
             }
-        ]
+        ],
+        "checksum": "crc32:..."
     }
+
+    Each save is fsync'ed and atomically replaces the file, keeping the
+    replaced version as <storage_file>.prev; a file failing its checksum is
+    replaced by that copy instead of being read as empty.
     """
 
     def __init__(self, storage_file: str = "users_b.json"):
@@ -49,35 +73,147 @@ class FileBasedUserStorage:
             storage_file: Path to the JSON file for storing users
         """
         self.storage_file = storage_file
+        self.stats = StorageStats(storage_file)
+        self.ready = False
+        # Where the last load came from ('current', 'previous' or 'missing')
+        self._load_source = 'missing'
+        self._lock = threading.Lock()
+        # Cached file content and indexes (None until loaded)
+        self._users: Optional[List[Dict]] = None
+        self._by_username: Dict[str, Dict] = {}
+        self._by_id: Dict[str, Dict] = {}
+        self._file_signature = None
+        # Usernames being registered (password hashing in progress)
+        self._reserved: Set[str] = set()
         self._ensure_storage_file()
 
     def _ensure_storage_file(self):
         """Ensure the storage file exists, create if not."""
         if not os.path.exists(self.storage_file):
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump({"users": []}, f)
+            write_atomic(self.storage_file, encode_document({"users": []}))
 
+    @metrics.timed('user_storage.load')
     def _load_users(self) -> Dict:
-        """Load users from storage file."""
-        try:
-            with open(self.storage_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure "users" key exists
-                if "users" not in data:
-                    data["users"] = []
-                return data
-        except (FileNotFoundError, json.JSONDecodeError):
+        """
+        Load users from storage file, or from its previous copy if the
+        storage file fails verification.
+
+        Raises:
+            StorageCorruptedError: If neither copy passes verification
+        """
+        result = read_document(self.storage_file)
+        self._load_source = result.source
+        if result.data is None:
             return {"users": []}
 
+        data = result.data
+        # Ensure "users" key exists
+        if "users" not in data:
+            data["users"] = []
+        self.stats.record_read(result.num_bytes, result.parse_seconds, len(data["users"]))
+        return data
+
+    @metrics.timed('user_storage.save')
     def _save_users(self, data: Dict):
-        """Save users to storage file."""
-        with open(self.storage_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save users to storage file (atomically replaced and fsync'ed)."""
+        start = time.perf_counter()
+        raw = encode_document(data)
+        serialize_seconds = time.perf_counter() - start
+        # A file that failed verification must not become the previous copy
+        keep_previous = self._load_source == 'current'
+        write_atomic(
+            self.storage_file, raw,
+            (lambda: keep_previous_copy(self.storage_file)) if keep_previous else None
+        )
+        self._load_source = 'current'
+        self.stats.record_write(len(raw), serialize_seconds, len(data.get("users", [])))
+
+    def _current_signature(self) -> Optional[Tuple]:
+        """Size, modification time and inode of the storage file."""
+        try:
+            stat = os.stat(self.storage_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def _ensure_loaded(self):
+        """Load users and build the indexes, or reload if the file changed (hold _lock)."""
+        signature = self._current_signature()
+        if self._users is not None and signature == self._file_signature:
+            return
+
+        users = self._load_users()["users"]
+        self._users = users
+        self._by_username = {user.get('username'): user for user in users}
+        self._by_id = {user.get('id'): user for user in users}
+        self._file_signature = signature
+
+    def _append_users(self, new_users: List[Dict]):
+        """Store new users in one write and add them to the indexes (hold _lock)."""
+        users = self._users + new_users
+        self._save_users({"users": users})
+        self._users = users
+        for user in new_users:
+            self._by_username[user['username']] = user
+            self._by_id[user['id']] = user
+        self._file_signature = self._current_signature()
+
+    def _reserve(self, username: str) -> bool:
+        """Reserve an unused username for registration (hold _lock)."""
+        if username in self._by_username or username in self._reserved:
+            return False
+        self._reserved.add(username)
+        return True
+
+    @staticmethod
+    def _new_user(username: str, password: str) -> Dict:
+        """Create a user entry with a new UUID and a bcrypt password hash."""
+        # Imported on first use to keep process startup fast
+        import bcrypt
+
+        password_hash = bcrypt.hashpw(
+            password.encode('utf-8'),
+            bcrypt.gensalt()
+        ).decode('utf-8')
+
+        return {
+            'id': str(uuid.uuid4()),
+            'username': username,
+            'password_hash': password_hash,
+            'created_at': datetime.utcnow().isoformat()
+        }
 
+    def warm_up(self):
+        """
+        Load the storage file once and mark the storage as ready.
+
+        Called at startup so the first request does not pay for the initial
+        load, and so readiness checks can tell when storage is usable. A
+        storage file recovered from its previous copy is rewritten.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._users = None
+            self._ensure_loaded()
+            source = self._load_source
+            if source == 'previous':
+                self._save_users({"users": self._users})
+                self._file_signature = self._current_signature()
+            self.stats.record_recovery({
+                'checkpoint': source,
+                'checkpoint_records': len(self._users),
+                'seconds': round(time.perf_counter() - start, 6)
+            })
+        self.ready = True
+
+    @metrics.timed('user_storage.register_user')
     def register_user(self, username: str, password: str) -> Optional[Dict]:
         """
         Register a new user with UUID identifier.
 
+        The username is reserved before the password is hashed, so two
+        concurrent registrations of the same name cannot both succeed.
+
         Args:
             username: Username
             password: Plain text password (will be hashed)
@@ -85,36 +221,91 @@ class FileBasedUserStorage:
         Returns:
             User dictionary if registration successful, None if user already exists
         """
-        data = self._load_users()
-        users = data.get("users", [])
+        with self._lock:
+            self._ensure_loaded()
+            if not self._reserve(username):
+                return None
 
-        # Check if username already exists
-        if any(user.get('username') == username for user in users):
-            return None
+        try:
+            user = self._new_user(username, password)
+
+            with self._lock:
+                # The file may have been changed by another process meanwhile
+                self._ensure_loaded()
+                if username in self._by_username:
+                    return None
+                self._append_users([user])
+        finally:
+            with self._lock:
+                self._reserved.discard(username)
 
-        # Generate UUID for user
-        user_id = str(uuid.uuid4())
+        return user
 
-        # Hash password using bcrypt
-        password_hash = bcrypt.hashpw(
-            password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+    @metrics.timed('user_storage.register_users')
+    def register_users(self, accounts: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        Register many users with one write to the storage file.
 
-        # Create user entry
-        from datetime import datetime
-        user = {
-            'id': user_id,
-            'username': username,
-            'password_hash': password_hash,
-            'created_at': datetime.utcnow().isoformat()
-        }
+        Passwords are hashed in parallel on HASH_WORKERS threads.
 
-        users.append(user)
-        data["users"] = users
-        self._save_users(data)
+        Args:
+            accounts: List of (username, plain text password) pairs
 
-        return user
+        Returns:
+            List aligned with accounts; each entry is the user dictionary,
+            or None if the username already exists (or repeats an earlier
+            entry of the same batch)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            reserved = [self._reserve(username) for username, _ in accounts]
+
+        results: List[Optional[Dict]] = [None] * len(accounts)
+        pending = [i for i, ok in enumerate(reserved) if ok]
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(HASH_WORKERS, len(pending)))) as pool:
+                users = list(pool.map(lambda i: self._new_user(*accounts[i]), pending))
+
+            with self._lock:
+                # The file may have been changed by another process meanwhile
+                self._ensure_loaded()
+                new_users = []
+                for i, user in zip(pending, users):
+                    if user['username'] not in self._by_username:
+                        results[i] = user
+                        new_users.append(user)
+                if new_users:
+                    self._append_users(new_users)
+        finally:
+            with self._lock:
+                for i in pending:
+                    self._reserved.discard(accounts[i][0])
+
+        return results
+
+    def get_all_users(self) -> List[Dict]:
+        """
+        Get all users (used by backups).
+
+        Returns:
+            List of all user dictionaries
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._users)
+
+    def restore(self, users: List[Dict]):
+        """
+        Replace the stored users (used when restoring a backup).
+
+        Args:
+            users: User dictionaries to store
+        """
+        with self._lock:
+            self._save_users({"users": users})
+            self._users = None
+            self._ensure_loaded()
 
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """
@@ -126,14 +317,9 @@ class FileBasedUserStorage:
         Returns:
             User dictionary if found, None otherwise
         """
-        data = self._load_users()
-        users = data.get("users", [])
-
-        for user in users:
-            if user.get('username') == username:
-                return user
-
-        return None
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_username.get(username)
 
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """
@@ -145,14 +331,9 @@ class FileBasedUserStorage:
         Returns:
             User dictionary if found, None otherwise
         """
-        data = self._load_users()
-        users = data.get("users", [])
-
-        for user in users:
-            if user.get('id') == user_id:
-                return user
-
-        return None
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_id.get(user_id)
 
     def username_exists(self, username: str) -> bool:
         """
@@ -185,6 +366,9 @@ class FileBasedUserStorage:
         if not stored_hash:
             return False
 
+        # Imported on first use to keep process startup fast
+        import bcrypt
+
         try:
             return bcrypt.checkpw(
                 password.encode('utf-8'),
@@ -0,0 +1,370 @@
+"""
+Online snapshots, incremental backups and restore for Worker B storage.
+
+A snapshot captures users_b.json as it was at one point in time. The
+service keeps running: the storage file is replaced atomically on every
+save, so a snapshot never sees a half-written file and never blocks
+writers.
+
+Usage (from worker_b_src):
+    # Take a snapshot (incremental if a previous snapshot exists)
+    python -m backup.snapshots create --backup-dir backups
+
+    # Force a full snapshot
+    python -m backup.snapshots create --backup-dir backups --full
+
+    # List snapshots and verify the checksums of one (default: latest)
+    python -m backup.snapshots list --backup-dir backups
+    python -m backup.snapshots verify --backup-dir backups [SNAPSHOT_ID]
+
+    # Restore a snapshot (default: latest) into the storage files
+    python -m backup.snapshots restore --backup-dir backups [SNAPSHOT_ID]
+
+Backup layout:
+    backups/<snapshot_id>/manifest.json
+    backups/<snapshot_id>/<storage>.jsonl
+
+Every data file holds one change per line, {"op": "put", "record": {...}}
+or {"op": "delete", "id": "uuid"}. A full snapshot puts every record; an
+incremental snapshot only holds records added or changed since its parent,
+plus deletions. The manifest stores the SHA-256 of each data file and of
+the resulting storage state, both checked before a restore.
+
+Design decisions:
+- Snapshot ids are UTC timestamps, so they sort chronologically
+- A snapshot directory is written under a temporary name and renamed when
+  complete; an interrupted backup leaves no half-written snapshot
+- Chains are bounded by MAX_CHAIN_LENGTH incremental snapshots, after which
+  a full snapshot is taken, so restores stay fast
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from auth.user_storage import FileBasedUserStorage
+
+
+# Storage name -> (storage file, storage class, method returning all records)
+STORAGES = {
+    'users': ('users_b.json', FileBasedUserStorage, 'get_all_users'),
+}
+
+DEFAULT_BACKUP_DIR = 'backups'
+
+# Incremental snapshots allowed on top of one full snapshot
+MAX_CHAIN_LENGTH = 10
+
+MANIFEST_FILE = 'manifest.json'
+PARTIAL_SUFFIX = '.partial'
+
+
+def _open_storage(name: str, data_dir: str):
+    """Open the storage with the given name in data_dir."""
+    storage_file, storage_class, _ = STORAGES[name]
+    return storage_class(os.path.join(data_dir, storage_file))
+
+
+def _read_records(name: str, data_dir: str) -> List[Dict]:
+    """Read all records of the storage with the given name."""
+    return getattr(_open_storage(name, data_dir), STORAGES[name][2])()
+
+
+def _sha256_file(path: str) -> str:
+    """Return the hex SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def state_checksum(records: Dict[str, Dict]) -> str:
+    """
+    Return the SHA-256 of a storage state, independent of record order.
+
+    Args:
+        records: Mapping of record id to record
+    """
+    digest = hashlib.sha256()
+    for record_id in sorted(records):
+        digest.update(json.dumps(records[record_id], sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def list_snapshots(backup_dir: str = DEFAULT_BACKUP_DIR) -> List[Dict]:
+    """
+    List complete snapshots, oldest first.
+
+    Args:
+        backup_dir: Directory holding the snapshots
+
+    Returns:
+        List of snapshot manifests
+    """
+    if not os.path.isdir(backup_dir):
+        return []
+
+    manifests = []
+    for entry in sorted(os.listdir(backup_dir)):
+        manifest_path = os.path.join(backup_dir, entry, MANIFEST_FILE)
+        if entry.endswith(PARTIAL_SUFFIX) or not os.path.isfile(manifest_path):
+            continue
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifests.append(json.load(f))
+    return manifests
+
+
+def _read_manifest(backup_dir: str, snapshot_id: str) -> Dict:
+    """Read the manifest of a snapshot."""
+    manifest_path = os.path.join(backup_dir, snapshot_id, MANIFEST_FILE)
+    if not os.path.isfile(manifest_path):
+        raise ValueError(f"Snapshot not found: {snapshot_id}")
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_state(backup_dir: str, snapshot_id: str) -> Tuple[Dict, Dict[str, Dict[str, Dict]]]:
+    """
+    Rebuild the storage state captured by a snapshot, checking checksums.
+
+    Returns:
+        Tuple of (manifest, {storage name: {record id: record}})
+
+    Raises:
+        ValueError: If a snapshot is missing or a checksum does not match
+    """
+    chain = [_read_manifest(backup_dir, snapshot_id)]
+    while chain[-1]['parent'] is not None:
+        chain.append(_read_manifest(backup_dir, chain[-1]['parent']))
+    chain.reverse()
+
+    state: Dict[str, Dict[str, Dict]] = {name: {} for name in STORAGES}
+    for manifest in chain:
+        for name, info in manifest['storages'].items():
+            data_path = os.path.join(backup_dir, manifest['id'], info['file'])
+            if _sha256_file(data_path) != info['sha256']:
+                raise ValueError(f"Checksum mismatch: {manifest['id']}/{info['file']}")
+
+            records = state.setdefault(name, {})
+            with open(data_path, 'rb') as f:
+                for line in f:
+                    change = json.loads(line)
+                    if change['op'] == 'put':
+                        records[change['record']['id']] = change['record']
+                    else:
+                        records.pop(change['id'], None)
+
+            if state_checksum(records) != info['state_sha256']:
+                raise ValueError(f"State checksum mismatch: {manifest['id']}/{name}")
+
+    return chain[-1], state
+
+
+def _write_changes(path: str, changes: List[Dict]) -> str:
+    """Write change lines to a data file and return its SHA-256."""
+    with open(path, 'wb') as f:
+        for change in changes:
+            f.write((json.dumps(change, ensure_ascii=False) + '\n').encode('utf-8'))
+    return _sha256_file(path)
+
+
+def create_snapshot(data_dir: str = '.', backup_dir: str = DEFAULT_BACKUP_DIR,
+                    full: bool = False) -> Dict:
+    """
+    Take a snapshot of the storage files in data_dir.
+
+    The snapshot is incremental on top of the latest snapshot unless full
+    is set, there is no previous snapshot, or the chain is already
+    MAX_CHAIN_LENGTH incremental snapshots long.
+
+    Args:
+        data_dir: Directory holding the storage files
+        backup_dir: Directory receiving the snapshot
+        full: Always take a full snapshot
+
+    Returns:
+        Manifest of the new snapshot
+
+    Raises:
+        ValueError: If the parent snapshot fails verification
+    """
+    snapshots = list_snapshots(backup_dir)
+    parent = snapshots[-1] if snapshots and not full else None
+    if parent is not None and parent['chain_length'] >= MAX_CHAIN_LENGTH:
+        parent = None
+
+    previous: Dict[str, Dict[str, Dict]] = {name: {} for name in STORAGES}
+    if parent is not None:
+        _, previous = _load_state(backup_dir, parent['id'])
+
+    created_at = datetime.utcnow()
+    snapshot_id = f"{created_at:%Y%m%dT%H%M%S%fZ}"
+    os.makedirs(backup_dir, exist_ok=True)
+    partial_dir = os.path.join(backup_dir, snapshot_id + PARTIAL_SUFFIX)
+    os.makedirs(partial_dir)
+
+    manifest = {
+        'id': snapshot_id,
+        'type': 'incremental' if parent is not None else 'full',
+        'parent': parent['id'] if parent is not None else None,
+        'chain_length': parent['chain_length'] + 1 if parent is not None else 0,
+        'created_at': created_at.isoformat(),
+        'storages': {}
+    }
+
+    try:
+        for name in STORAGES:
+            records = {record['id']: record for record in _read_records(name, data_dir)}
+            old_records = previous.get(name, {})
+
+            changes = []
+            added = changed = 0
+            for record_id, record in records.items():
+                old_record = old_records.get(record_id)
+                if old_record == record:
+                    continue
+                changes.append({'op': 'put', 'record': record})
+                if old_record is None:
+                    added += 1
+                else:
+                    changed += 1
+            removed = [record_id for record_id in old_records if record_id not in records]
+            changes.extend({'op': 'delete', 'id': record_id} for record_id in removed)
+
+            data_file = f"{name}.jsonl"
+            data_path = os.path.join(partial_dir, data_file)
+            manifest['storages'][name] = {
+                'file': data_file,
+                'sha256': _write_changes(data_path, changes),
+                'bytes': os.path.getsize(data_path),
+                'records': len(records),
+                'added': added,
+                'changed': changed,
+                'removed': len(removed),
+                'state_sha256': state_checksum(records)
+            }
+
+        with open(os.path.join(partial_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.rename(partial_dir, os.path.join(backup_dir, snapshot_id))
+    except BaseException:
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        raise
+
+    return manifest
+
+
+def verify_snapshot(backup_dir: str = DEFAULT_BACKUP_DIR,
+                    snapshot_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+    """
+    Check the checksums of a snapshot and every snapshot it builds on.
+
+    Args:
+        backup_dir: Directory holding the snapshots
+        snapshot_id: Snapshot to verify (default: latest)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if snapshot_id is None:
+        snapshots = list_snapshots(backup_dir)
+        if not snapshots:
+            return False, "No snapshots found"
+        snapshot_id = snapshots[-1]['id']
+
+    try:
+        _load_state(backup_dir, snapshot_id)
+    except (OSError, ValueError, KeyError) as e:
+        return False, str(e)
+    return True, None
+
+
+def restore_snapshot(backup_dir: str = DEFAULT_BACKUP_DIR, snapshot_id: Optional[str] = None,
+                     data_dir: str = '.') -> Tuple[bool, Optional[Dict], Optional[str]]:
+    """
+    Replace the storage files in data_dir with the state of a snapshot.
+
+    The snapshot is verified before anything is written. Stop the service
+    (or at least writers) first; requests in flight during a restore may be
+    lost.
+
+    Args:
+        backup_dir: Directory holding the snapshots
+        snapshot_id: Snapshot to restore (default: latest)
+        data_dir: Directory holding the storage files
+
+    Returns:
+        Tuple of (success, restored_manifest, error_message)
+    """
+    if snapshot_id is None:
+        snapshots = list_snapshots(backup_dir)
+        if not snapshots:
+            return False, None, "No snapshots found"
+        snapshot_id = snapshots[-1]['id']
+
+    try:
+        manifest, state = _load_state(backup_dir, snapshot_id)
+    except (OSError, ValueError, KeyError) as e:
+        return False, None, str(e)
+
+    for name in STORAGES:
+        _open_storage(name, data_dir).restore(list(state.get(name, {}).values()))
+
+    return True, manifest, None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Worker B storage snapshots')
+    parser.add_argument('--backup-dir', default=DEFAULT_BACKUP_DIR, help='snapshot directory')
+    parser.add_argument('--data-dir', default='.', help='directory holding the storage files')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create_parser = subparsers.add_parser('create', help='take a snapshot')
+    create_parser.add_argument('--full', action='store_true', help='take a full snapshot')
+
+    subparsers.add_parser('list', help='list snapshots')
+
+    for command in ('verify', 'restore'):
+        command_parser = subparsers.add_parser(command, help=f'{command} a snapshot')
+        command_parser.add_argument('snapshot_id', nargs='?', help='snapshot id (default: latest)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'create':
+        manifest = create_snapshot(args.data_dir, args.backup_dir, full=args.full)
+        print(f"Created {manifest['type']} snapshot {manifest['id']}")
+        for name, info in manifest['storages'].items():
+            print(f"  {name}: {info['records']} records, +{info['added']} ~{info['changed']} "
+                  f"-{info['removed']}, {info['bytes']} bytes")
+        return 0
+
+    if args.command == 'list':
+        for manifest in list_snapshots(args.backup_dir):
+            sizes = ', '.join(
+                f"{name} {info['records']}" for name, info in manifest['storages'].items()
+            )
+            print(f"{manifest['id']}  {manifest['type']:<11}  {sizes}")
+        return 0
+
+    if args.command == 'verify':
+        is_valid, error = verify_snapshot(args.backup_dir, args.snapshot_id)
+        print('OK' if is_valid else f"FAILED: {error}")
+        return 0 if is_valid else 1
+
+    success, manifest, error = restore_snapshot(args.backup_dir, args.snapshot_id, args.data_dir)
+    if not success:
+        print(f"Restore failed: {error}")
+        return 1
+    print(f"Restored snapshot {manifest['id']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
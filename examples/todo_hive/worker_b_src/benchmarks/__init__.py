@@ -0,0 +1,6 @@
+"""
+Benchmarks for Worker B.
+
+Run from the worker_b_src directory, e.g.:
+    python -m benchmarks.verify_tokens
+"""
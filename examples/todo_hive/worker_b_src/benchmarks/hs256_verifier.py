@@ -0,0 +1,166 @@
+"""
+Equivalence check and benchmark: HS256Verifier vs PyJWT's jwt.decode.
+
+Builds a corpus of valid, expired, tampered and malformed tokens, checks
+that the fast-path verifier accepts exactly the tokens jwt.decode accepts
+(with identical claims), then times both on valid and invalid tokens.
+
+Usage (from the worker source directory):
+    python -m benchmarks.hs256_verifier [--iterations N]
+
+Exits with status 1 if any token is judged differently.
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import jwt
+
+from auth.hs256_verifier import HS256Verifier
+from auth.token_manager import JWTTokenManager
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _segments(token: str):
+    return token.split('.')
+
+
+def build_corpus(manager: JWTTokenManager):
+    """Return a list of (label, token) pairs covering accept and reject cases."""
+    secret = manager.secret_key
+    now = datetime.utcnow()
+    corpus = []
+
+    for i in range(5):
+        corpus.append(('valid', manager.generate_token(str(uuid.uuid4()), f"user_{i}")))
+    corpus.append(('valid unicode username', manager.generate_token(str(uuid.uuid4()), '使用者')))
+    corpus.append(('valid without exp', jwt.encode({'user_id': 'u', 'username': 'n'}, secret, algorithm='HS256')))
+    corpus.append(('valid extra header', jwt.encode({'user_id': 'u'}, secret, algorithm='HS256', headers={'kid': 'k1'})))
+    corpus.append(('valid bytes token', manager.generate_token('u', 'n').encode('utf-8')))
+
+    def claims(**overrides):
+        payload = {'user_id': 'u', 'username': 'n', 'iat': now, 'exp': now + timedelta(hours=1)}
+        payload.update(overrides)
+        return jwt.encode(payload, secret, algorithm='HS256')
+
+    corpus.append(('expired', claims(exp=now - timedelta(seconds=1))))
+    corpus.append(('expired long ago', claims(iat=now - timedelta(days=3), exp=now - timedelta(days=2))))
+    corpus.append(('iat in future', claims(iat=now + timedelta(hours=1))))
+    corpus.append(('nbf in future', claims(nbf=now + timedelta(hours=1))))
+    corpus.append(('nbf in past', claims(nbf=now - timedelta(hours=1))))
+    corpus.append(('exp not integer', claims(exp='tomorrow')))
+    corpus.append(('exp numeric string', claims(exp=str(int(time.time()) + 3600))))
+    corpus.append(('aud present', claims(aud='gateway')))
+    corpus.append(('aud empty', claims(aud='')))
+
+    good = manager.generate_token('u', 'n')
+    header, payload, signature = _segments(good)
+    forged_payload = _b64(json.dumps({'user_id': 'admin', 'username': 'admin'}).encode())
+    corpus.append(('tampered payload', f"{header}.{forged_payload}.{signature}"))
+    corpus.append(('tampered signature', f"{header}.{payload}.{_b64(b'0' * 32)}"))
+    corpus.append(('truncated signature', f"{header}.{payload}.{signature[:-4]}"))
+    corpus.append(('empty signature', f"{header}.{payload}."))
+    corpus.append(('other secret', jwt.encode({'user_id': 'u'}, 'not_the_secret', algorithm='HS256')))
+    corpus.append(('alg none', jwt.encode({'user_id': 'u'}, None, algorithm='none')))
+    corpus.append(('alg HS512', jwt.encode({'user_id': 'u'}, secret, algorithm='HS512')))
+    corpus.append(('alg swapped to HS512', f"{_b64(json.dumps({'alg': 'HS512', 'typ': 'JWT'}).encode())}.{payload}.{signature}"))
+    corpus.append(('header without alg', f"{_b64(b'{}')}.{payload}.{signature}"))
+    corpus.append(('b64 false header', f"{_b64(json.dumps({'alg': 'HS256', 'b64': False}).encode())}.{payload}.{signature}"))
+
+    corpus.append(('empty string', ''))
+    corpus.append(('garbage', 'not-a-token'))
+    corpus.append(('two segments', f"{header}.{payload}"))
+    corpus.append(('four segments', f"{good}.extra"))
+    corpus.append(('bad header base64', f"!!!.{payload}.{signature}"))
+    corpus.append(('header not json', f"{_b64(b'not json')}.{payload}.{signature}"))
+    corpus.append(('header is a list', f"{_b64(b'[1, 2]')}.{payload}.{signature}"))
+    corpus.append(('bad padding', f"{header}.{payload}a.{signature}"))
+
+    def signed(raw_payload: bytes):
+        header_segment = _b64(json.dumps({'alg': 'HS256', 'typ': 'JWT'}).encode())
+        signing_input = f"{header_segment}.{_b64(raw_payload)}"
+        algorithm = jwt.algorithms.HMACAlgorithm(jwt.algorithms.HMACAlgorithm.SHA256)
+        return f"{signing_input}.{_b64(algorithm.sign(signing_input.encode(), secret.encode()))}"
+
+    corpus.append(('signed payload not json', signed(b'not json')))
+    corpus.append(('signed payload is a list', signed(b'[1, 2, 3]')))
+    corpus.append(('signed payload invalid utf-8', signed(b'\xff\xfe')))
+
+    return corpus
+
+
+def reference_verify(token, secret: str):
+    """Verification exactly as JWTTokenManager performed it with PyJWT."""
+    try:
+        payload = jwt.decode(token, secret, algorithms=['HS256'])
+    except jwt.InvalidTokenError:
+        return None
+    return {'user_id': payload.get('user_id'), 'username': payload.get('username')}
+
+
+def check_equivalence(verifier: HS256Verifier, corpus, secret: str) -> int:
+    """Compare both verifiers on the corpus; return the number of mismatches."""
+    mismatches = 0
+    for label, token in corpus:
+        expected = reference_verify(token, secret)
+        actual = verifier.verify(token)
+        status = 'ok' if expected == actual else 'MISMATCH'
+        if expected != actual:
+            mismatches += 1
+        verdict = 'accept' if expected is not None else 'reject'
+        print(f"  {status:<9}{verdict:<8}{label}")
+    return mismatches
+
+
+def time_per_call(func, tokens, iterations: int) -> float:
+    """Return average microseconds per call of func over tokens."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for token in tokens:
+            func(token)
+    return (time.perf_counter() - start) / (iterations * len(tokens)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000,
+                        help='timing iterations per token group')
+    args = parser.parse_args()
+
+    manager = JWTTokenManager()
+    secret = manager.secret_key
+    verifier = HS256Verifier(secret)
+    corpus = build_corpus(manager)
+
+    print(f"Equivalence check on {len(corpus)} tokens:")
+    mismatches = check_equivalence(verifier, corpus, secret)
+    print(f"{len(corpus) - mismatches}/{len(corpus)} tokens judged identically\n")
+
+    groups = {
+        'valid': [manager.generate_token(str(uuid.uuid4()), f"user_{i}") for i in range(10)],
+        'expired': [token for label, token in corpus if label.startswith('expired')],
+        'tampered': [token for label, token in corpus if label.startswith('tampered')],
+        'malformed': [token for label, token in corpus
+                      if label in ('garbage', 'two segments', 'bad header base64', 'header not json')],
+    }
+
+    print(f"{'tokens':<12}{'jwt.decode us':>15}{'fast path us':>15}{'speedup':>10}")
+    for name, tokens in groups.items():
+        reference = time_per_call(lambda t: reference_verify(t, secret), tokens, args.iterations)
+        fast = time_per_call(verifier.verify, tokens, args.iterations)
+        print(f"{name:<12}{reference:>15.2f}{fast:>15.2f}{reference / fast:>10.2f}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
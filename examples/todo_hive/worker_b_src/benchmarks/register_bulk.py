@@ -0,0 +1,81 @@
+"""
+Benchmark: bulk registration vs one registration per account.
+
+Measures the per-account cost of RegistrationService.register (one bcrypt
+hash and one storage write per account) and RegistrationService.register_bulk
+(hashes spread over HASH_WORKERS threads, one storage write per batch),
+on a temporary storage file that already holds --existing users.
+
+Usage (from worker_b_src):
+    python -m benchmarks.register_bulk [--accounts N] [--existing N] [--batch-sizes 10,100]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from auth.registration_service import RegistrationService
+from auth.user_storage import FileBasedUserStorage, HASH_WORKERS
+
+
+def make_service(directory: str, name: str, existing: int) -> RegistrationService:
+    """Registration service on a fresh storage file with `existing` users."""
+    storage = FileBasedUserStorage(os.path.join(directory, f"{name}.json"))
+    storage.restore([
+        {
+            'id': f"existing-{i}",
+            'username': f"existing_{i}",
+            'password_hash': '',
+            'created_at': '2024-01-01T00:00:00'
+        }
+        for i in range(existing)
+    ])
+    return RegistrationService(user_storage=storage)
+
+
+def bench_single(service: RegistrationService, accounts):
+    """Register every account separately; return seconds per account."""
+    start = time.perf_counter()
+    for account in accounts:
+        success, _, _ = service.register(account['username'], account['password'])
+        assert success
+    return (time.perf_counter() - start) / len(accounts)
+
+
+def bench_bulk(service: RegistrationService, accounts, batch_size: int):
+    """Register accounts in batches of batch_size; return seconds per account."""
+    start = time.perf_counter()
+    for offset in range(0, len(accounts), batch_size):
+        success, result, _ = service.register_bulk(accounts[offset:offset + batch_size])
+        assert success and result['created'] == len(accounts[offset:offset + batch_size])
+    return (time.perf_counter() - start) / len(accounts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--accounts', type=int, default=40,
+                        help='number of accounts to register per scenario')
+    parser.add_argument('--existing', type=int, default=10000,
+                        help='users already in the storage file')
+    parser.add_argument('--batch-sizes', default='10,40',
+                        help='comma-separated batch sizes for register_bulk')
+    args = parser.parse_args()
+
+    print(f"hash workers: {HASH_WORKERS}, existing users: {args.existing}")
+    with tempfile.TemporaryDirectory() as directory:
+        accounts = [{'username': f"single_{i}", 'password': 'bench-password'} for i in range(args.accounts)]
+        single = bench_single(make_service(directory, 'single', args.existing), accounts)
+        print(f"{'method':<28}{'ms/account':>12}{'speedup':>10}")
+        print(f"{'register':<28}{single * 1e3:>12.1f}{1.0:>10.2f}")
+
+        for batch_size in (int(size) for size in args.batch_sizes.split(',')):
+            accounts = [{'username': f"bulk_{i}", 'password': 'bench-password'} for i in range(args.accounts)]
+            service = make_service(directory, f"bulk_{batch_size}", args.existing)
+            per_account = bench_bulk(service, accounts, batch_size)
+            label = f"register_bulk (x{batch_size})"
+            print(f"{label:<28}{per_account * 1e3:>12.1f}{single / per_account:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
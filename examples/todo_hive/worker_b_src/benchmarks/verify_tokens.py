@@ -0,0 +1,74 @@
+"""
+Benchmark: batch token verification vs the single-token endpoint.
+
+Measures the per-token cost of verifying tokens through
+POST /api/verify-token (one token per request) and
+POST /api/verify-tokens (many tokens per request), using the Flask
+test client so that request handling overhead is included.
+
+Usage (from worker_b_src):
+    python -m benchmarks.verify_tokens [--tokens N] [--batch-sizes 1,10,100]
+"""
+
+import argparse
+import time
+import uuid
+
+from app import app, auth_service
+
+
+def make_tokens(count: int):
+    """Generate valid tokens for distinct synthetic users."""
+    manager = auth_service.token_manager
+    return [
+        manager.generate_token(user_id=str(uuid.uuid4()), username=f"bench_user_{i}")
+        for i in range(count)
+    ]
+
+
+def bench_single(client, tokens):
+    """Verify every token with its own request; return seconds per token."""
+    start = time.perf_counter()
+    for token in tokens:
+        response = client.post('/api/verify-token', json={'token': token})
+        assert response.get_json()['valid']
+    return (time.perf_counter() - start) / len(tokens)
+
+
+def bench_batch(client, tokens, batch_size: int):
+    """Verify tokens in batches of batch_size; return seconds per token."""
+    start = time.perf_counter()
+    for offset in range(0, len(tokens), batch_size):
+        batch = tokens[offset:offset + batch_size]
+        response = client.post('/api/verify-tokens', json={'tokens': batch})
+        assert all(result['valid'] for result in response.get_json()['results'])
+    return (time.perf_counter() - start) / len(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tokens', type=int, default=2000,
+                        help='number of tokens to verify per scenario')
+    parser.add_argument('--batch-sizes', default='1,10,100,1000',
+                        help='comma-separated batch sizes for /api/verify-tokens')
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    client = app.test_client()
+
+    # Warm up both code paths
+    bench_single(client, tokens[:10])
+    bench_batch(client, tokens[:10], 10)
+
+    single = bench_single(client, tokens)
+    print(f"{'endpoint':<32}{'us/token':>12}{'speedup':>10}")
+    print(f"{'POST /api/verify-token':<32}{single * 1e6:>12.1f}{1.0:>10.2f}")
+
+    for batch_size in (int(size) for size in args.batch_sizes.split(',')):
+        per_token = bench_batch(client, tokens, batch_size)
+        label = f"POST /api/verify-tokens (x{batch_size})"
+        print(f"{label:<32}{per_token * 1e6:>12.1f}{single / per_token:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
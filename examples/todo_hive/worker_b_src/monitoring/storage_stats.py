@@ -0,0 +1,93 @@
+"""
+Storage I/O counters for Worker B.
+
+Each file-based storage keeps a StorageStats instance that its _load_* and
+_save_* methods update. The counters are reported by /health?verbose=1.
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+class StorageStats:
+    """
+    Thread-safe I/O counters for one storage file.
+
+    This implementation tracks:
+    - File reads and writes, bytes read and written
+    - Time spent parsing (JSON decode) and serializing (JSON encode)
+    - Record count and file size as of the last read or write (including
+      any change log kept next to the storage file)
+    - The report of the last recovery (load after a restart or crash)
+    """
+
+    def __init__(self, storage_file: str):
+        """
+        Initialize counters.
+
+        Args:
+            storage_file: Path of the storage file being tracked
+        """
+        self.storage_file = storage_file
+        self._lock = threading.Lock()
+        self.file_reads = 0
+        self.file_writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.parse_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.record_count: Optional[int] = None
+        self.file_size: Optional[int] = None
+        self.recovery: Optional[Dict] = None
+
+    def record_read(self, num_bytes: int, parse_seconds: float, record_count: int):
+        """Record one completed file read."""
+        with self._lock:
+            self.file_reads += 1
+            self.bytes_read += num_bytes
+            self.parse_seconds += parse_seconds
+            self.record_count = record_count
+            self.file_size = num_bytes
+
+    def record_write(self, num_bytes: int, serialize_seconds: float, record_count: int):
+        """Record one completed file write."""
+        with self._lock:
+            self.file_writes += 1
+            self.bytes_written += num_bytes
+            self.serialize_seconds += serialize_seconds
+            self.record_count = record_count
+            self.file_size = num_bytes
+
+    def record_append(self, num_bytes: int, serialize_seconds: float):
+        """Record one append to a change log kept next to the storage file."""
+        with self._lock:
+            self.file_writes += 1
+            self.bytes_written += num_bytes
+            self.serialize_seconds += serialize_seconds
+
+    def update_size(self, record_count: int, file_size: int):
+        """Set the current record count and on-disk size."""
+        with self._lock:
+            self.record_count = record_count
+            self.file_size = file_size
+
+    def record_recovery(self, report: Dict):
+        """Set the report of the last recovery."""
+        with self._lock:
+            self.recovery = report
+
+    def to_dict(self) -> Dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {
+                'file': self.storage_file,
+                'file_reads': self.file_reads,
+                'file_writes': self.file_writes,
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+                'parse_seconds': round(self.parse_seconds, 6),
+                'serialize_seconds': round(self.serialize_seconds, 6),
+                'record_count': self.record_count,
+                'file_size_bytes': self.file_size,
+                'recovery': self.recovery
+            }
@@ -0,0 +1,299 @@
+"""
+Checksummed, atomically committed storage files.
+
+Storage files stay plain JSON: a document gets a trailing "checksum" key
+and a change-log record (one JSON object per line) gets a trailing
+"checksum" member, each holding the CRC-32 of the bytes written before it.
+Verifying costs one CRC pass over the raw bytes, not a second serialization.
+
+Design decisions:
+- A file is written to a temporary file, fsync'ed, renamed over the old
+  one and the directory fsync'ed, so after a crash it is either the old or
+  the new version, never a truncated one
+- The previous version can be kept as <file>.prev (a hard link, no copy),
+  so a checkpoint that fails verification can fall back to the last good one
+- A damaged file raises StorageCorruptedError instead of being treated as
+  empty, so it can never be silently overwritten with no data
+- Files without checksums (written before checksums were introduced) are
+  accepted and reported as unverified
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Union
+
+
+# Suffix of the previous good copy of a storage file
+PREVIOUS_SUFFIX = '.prev'
+
+CHECKSUM_KEY = 'checksum'
+
+# Bytes written between a document's content and its checksum
+_DOCUMENT_MARKER = f',\n  "{CHECKSUM_KEY}": "'.encode('utf-8')
+
+# Bytes written between a record's content and its checksum
+_RECORD_MARKER = f', "{CHECKSUM_KEY}": "'.encode('utf-8')
+
+
+class StorageCorruptedError(Exception):
+    """A storage file failed verification and no intact copy was found."""
+
+
+class DocumentRead(NamedTuple):
+    """Result of read_document."""
+    data: Optional[Dict]     # None if the file does not exist
+    num_bytes: int           # Size of the file that was used
+    parse_seconds: float     # Time spent decoding and verifying it
+    source: str              # 'current', 'previous' (fallback) or 'missing'
+    verified: bool           # False for files written without checksums
+
+
+# Bytes read per chunk when verifying a file without loading it
+_CHUNK_SIZE = 1024 * 1024
+
+
+def checksum(data: bytes) -> str:
+    """Checksum string of some bytes ("crc32:" and 8 hex digits)."""
+    return f"crc32:{zlib.crc32(data):08x}"
+
+
+def encode_document(data: Dict) -> bytes:
+    """
+    Serialize a JSON document with a trailing checksum.
+
+    Args:
+        data: Non-empty dictionary (must not contain a "checksum" key)
+
+    Returns:
+        UTF-8 bytes of the document
+    """
+    body = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # Indented output ends with "\n}"; the checksum covers everything before it
+    content = body[:-2]
+    return content + _DOCUMENT_MARKER + f'{checksum(content)}"\n}}\n'.encode('utf-8')
+
+
+def encode_document_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Append a checksum to a JSON document produced in chunks.
+
+    Lets a large document be written without holding it in memory; the
+    result reads back with decode_document like one from encode_document.
+
+    Args:
+        chunks: The document without its closing brace, e.g. b'{\n  "a": [\n', ..., b'\n  ]'
+
+    Yields:
+        The chunks, followed by the checksum and the closing brace
+    """
+    crc = 0
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        yield chunk
+    yield _DOCUMENT_MARKER + f'crc32:{crc:08x}"\n}}\n'.encode('utf-8')
+
+
+def document_checksum(path: str, verify: bool = True) -> Optional[str]:
+    """
+    Read the checksum stored at the end of a document file.
+
+    Args:
+        path: Document file
+        verify: Also check the content against it (read in chunks, not parsed)
+
+    Returns:
+        The document's checksum, or None if the file is missing, has no
+        checksum or fails verification
+    """
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 64))
+            tail = f.read()
+            marker = tail.rfind(_DOCUMENT_MARKER)
+            if marker < 0:
+                return None
+            expected = tail[marker + len(_DOCUMENT_MARKER):].split(b'"', 1)[0].decode('ascii', 'replace')
+            if not verify:
+                return expected
+
+            remaining = size - len(tail) + marker
+            f.seek(0)
+            crc = 0
+            while remaining > 0:
+                chunk = f.read(min(_CHUNK_SIZE, remaining))
+                if not chunk:
+                    return None
+                crc = zlib.crc32(chunk, crc)
+                remaining -= len(chunk)
+    except FileNotFoundError:
+        return None
+    return expected if f"crc32:{crc:08x}" == expected else None
+
+
+def decode_document(raw: bytes) -> Dict:
+    """
+    Parse and verify a document written by encode_document.
+
+    Returns:
+        The document without its checksum
+
+    Raises:
+        ValueError: If the bytes are not a JSON object or the checksum does not match
+    """
+    data = json.loads(raw.decode('utf-8'))
+    if not isinstance(data, dict):
+        raise ValueError("Storage document is not a JSON object")
+
+    expected = data.pop(CHECKSUM_KEY, None)
+    if expected is not None:
+        end = raw.rfind(_DOCUMENT_MARKER)
+        if end < 0 or checksum(raw[:end]) != expected:
+            raise ValueError("Storage document checksum mismatch")
+    return data
+
+
+def encode_record(record: Dict) -> bytes:
+    """
+    Serialize a change-log record as one line with a trailing checksum.
+
+    Args:
+        record: Non-empty dictionary (must not contain a "checksum" key)
+
+    Returns:
+        UTF-8 bytes of the line, including the newline
+    """
+    content = json.dumps(record, ensure_ascii=False).encode('utf-8')[:-1]
+    return content + _RECORD_MARKER + f'{checksum(content)}"}}\n'.encode('utf-8')
+
+
+def decode_record(line: bytes) -> Dict:
+    """
+    Parse and verify one change-log line written by encode_record.
+
+    Returns:
+        The record without its checksum
+
+    Raises:
+        ValueError: If the line is torn, not a JSON object or fails its checksum
+    """
+    record = json.loads(line.decode('utf-8'))
+    if not isinstance(record, dict):
+        raise ValueError("Change record is not a JSON object")
+
+    expected = record.pop(CHECKSUM_KEY, None)
+    if expected is not None:
+        end = line.rfind(_RECORD_MARKER)
+        if end < 0 or checksum(line[:end]) != expected:
+            raise ValueError("Change record checksum mismatch")
+    return record
+
+
+def read_document(path: str) -> DocumentRead:
+    """
+    Read and verify a storage document, falling back to its previous copy.
+
+    Args:
+        path: Storage file path
+
+    Returns:
+        DocumentRead; data is None (source 'missing') if the file does not exist
+
+    Raises:
+        StorageCorruptedError: If the file and its previous copy both fail verification
+    """
+    errors = []
+    for candidate, source in ((path, 'current'), (path + PREVIOUS_SUFFIX, 'previous')):
+        try:
+            with open(candidate, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            if source == 'current':
+                return DocumentRead(None, 0, 0.0, 'missing', True)
+            errors.append(f"{candidate}: missing")
+            continue
+
+        start = time.perf_counter()
+        try:
+            data = decode_document(raw)
+        except ValueError as e:
+            errors.append(f"{candidate}: {e}")
+            continue
+        verified = raw.rfind(_DOCUMENT_MARKER) >= 0
+        return DocumentRead(data, len(raw), time.perf_counter() - start, source, verified)
+
+    raise StorageCorruptedError("; ".join(errors))
+
+
+def fsync_directory(directory: str):
+    """Persist a rename in a directory (no-op where directories cannot be opened)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def keep_previous_copy(path: str):
+    """
+    Keep the current version of a file as <path>.prev.
+
+    Uses a hard link where supported, so no data is copied.
+    """
+    if not os.path.exists(path):
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.prev.tmp")
+    try:
+        os.link(path, temp_path)
+    except FileExistsError:
+        os.unlink(temp_path)
+        os.link(path, temp_path)
+    except OSError:
+        # No hard links (e.g. some network or FAT filesystems)
+        shutil.copyfile(path, temp_path)
+    os.replace(temp_path, path + PREVIOUS_SUFFIX)
+
+
+def write_atomic(path: str, raw: Union[bytes, Iterable[bytes]],
+                 before_replace: Optional[Callable[[], None]] = None) -> int:
+    """
+    Replace a file atomically and durably.
+
+    Args:
+        path: File to replace
+        raw: New content, or an iterable of chunks of it
+        before_replace: Called after the new content is on disk and right
+                        before it replaces the file (e.g. keep_previous_copy)
+
+    Returns:
+        Number of bytes written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if isinstance(raw, bytes):
+                raw = [raw]
+            size = 0
+            for chunk in raw:
+                size += f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        if before_replace is not None:
+            before_replace()
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    fsync_directory(directory)
+    return size